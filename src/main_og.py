@@ -2,6 +2,7 @@ import math
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pygame
 
 # --- Config ---
@@ -23,6 +24,10 @@ ACCENT_BORDER = (0, 120, 255, 200)
 CLIP_COLOR = (60, 200, 120, 200)
 CLIP_FILL = (60, 200, 120, 40)
 
+# True: redraw Bresenham lines and circles with pygame.draw (C loops) instead of
+# the hand-written rasterizers below. DDA lines always use draw_line_dda.
+FAST_DRAW = False
+
 # --- Geometry / Scene ---
 @dataclass
 class Point:
@@ -41,14 +46,73 @@ class Circle:
     r: int
     algo: str = "BRESENHAM"
 
+LINE_ALGOS = ("DDA", "BRESENHAM")
+
+def _grow(buf: np.ndarray, n: int) -> np.ndarray:
+    if n < len(buf):
+        return buf
+    out = np.empty((2 * len(buf),) + buf.shape[1:], dtype=buf.dtype)
+    out[:n] = buf[:n]
+    return out
+
+# Lines/circles live in flat arrays (x0, y0, x1, y1) / (cx, cy, r); Line and Circle
+# are only used to build new entries.
 class Scene:
     def __init__(self):
-        self.lines: List[Line] = []
-        self.circles: List[Circle] = []
+        self._line_xy = np.empty((16, 4), dtype=np.int32)
+        self._line_algo = np.empty(16, dtype=np.uint8)
+        self._circle_cxcyr = np.empty((16, 3), dtype=np.int32)
+        self.n_lines = 0
+        self.n_circles = 0
+
+    @property
+    def line_xy(self) -> np.ndarray:
+        return self._line_xy[:self.n_lines]
+
+    @property
+    def line_algo(self) -> np.ndarray:
+        return self._line_algo[:self.n_lines]
+
+    @property
+    def circle_cxcyr(self) -> np.ndarray:
+        return self._circle_cxcyr[:self.n_circles]
+
+    def add_line(self, ln: Line):
+        n = self.n_lines
+        self._line_xy = _grow(self._line_xy, n)
+        self._line_algo = _grow(self._line_algo, n)
+        self._line_xy[n] = (ln.p0.x, ln.p0.y, ln.p1.x, ln.p1.y)
+        self._line_algo[n] = LINE_ALGOS.index(ln.algo)
+        self.n_lines = n + 1
+
+    def add_circle(self, c: Circle):
+        n = self.n_circles
+        self._circle_cxcyr = _grow(self._circle_cxcyr, n)
+        self._circle_cxcyr[n] = (c.c.x, c.c.y, c.r)
+        self.n_circles = n + 1
+
+    def keep_lines(self, mask: np.ndarray):
+        n = int(mask.sum())
+        if n == self.n_lines:
+            return
+        self._line_xy[:n] = self.line_xy[mask]
+        self._line_algo[:n] = self.line_algo[mask]
+        self.n_lines = n
 
     def clear(self):
-        self.lines.clear()
-        self.circles.clear()
+        self.n_lines = 0
+        self.n_circles = 0
+
+# --- Text ---
+_text_cache: dict = {}
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    # labels repeat across frames; render each (font, text, color) only once
+    key = (font, text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = _text_cache[key] = font.render(text, True, color)
+    return surf
 
 # --- UI Button ---
 class Button:
@@ -62,7 +126,7 @@ class Button:
         color = UI_BTN_HOVER if self.hover else UI_BTN
         pygame.draw.rect(surf, color, self.rect, border_radius=8)
         pygame.draw.rect(surf, UI_STROKE, self.rect, width=1, border_radius=8)
-        txt = font.render(self.label, True, WHITE)
+        txt = render_text(font, self.label, WHITE)
         surf.blit(txt, (self.rect.x + 10, self.rect.y + (self.rect.h - txt.get_height()) // 2))
 
     def handle_event(self, ev):
@@ -72,74 +136,114 @@ class Button:
             if self.rect.collidepoint(ev.pos) and ev.type == pygame.MOUSEBUTTONDOWN:
                 self.on_click()
 
+# --- Events ---
+def coalesce_motion(events: List[pygame.event.Event]) -> List[pygame.event.Event]:
+    # a run of consecutive MOUSEMOTION events collapses to its last one; the order
+    # relative to button events is kept so drags still start/end where they should
+    out: List[pygame.event.Event] = []
+    for ev in events:
+        if ev.type == pygame.MOUSEMOTION and out and out[-1].type == pygame.MOUSEMOTION:
+            out[-1] = ev
+        else:
+            out.append(ev)
+    return out
+
 # --- Rasterization ---
 def put_pixel(surf: pygame.Surface, x: int, y: int, color: Tuple[int, int, int] = BLACK):
     if 0 <= x < surf.get_width() and 0 <= y < surf.get_height():
         surf.set_at((x, y), color)
 
-def draw_line_dda(surf: pygame.Surface, p0: Point, p1: Point, color: Tuple[int, int, int] = BLACK):
-    x0, y0 = p0.x, p0.y
-    x1, y1 = p1.x, p1.y
+_packed_colors: dict = {}
+
+def packed_color(surf: pygame.Surface, color: Tuple[int, int, int]) -> int:
+    # map_rgb result for the surface's pixel format, as the unsigned value pixels2d stores
+    key = (surf.get_bitsize(), surf.get_masks(), color)
+    val = _packed_colors.get(key)
+    if val is None:
+        val = _packed_colors[key] = surf.map_rgb(color) & 0xFFFFFFFF
+    return val
+
+def put_pixels(surf: pygame.Surface, xs: np.ndarray, ys: np.ndarray, color: Tuple[int, int, int] = BLACK):
+    w, h = surf.get_width(), surf.get_height()
+    m = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+    pix = pygame.surfarray.pixels2d(surf)
+    pix[xs[m], ys[m]] = packed_color(surf, color)
+    del pix  # releases the surface lock
+
+# The rasterizers below only compute pixel coordinates; the writes happen in
+# put_pixels, so a caller drawing many primitives can lock the surface once.
+def line_dda_pixels(x0: int, y0: int, x1: int, y1: int) -> Tuple[np.ndarray, np.ndarray]:
     dx, dy = x1 - x0, y1 - y0
     steps = int(max(abs(dx), abs(dy)))
 
     if steps == 0:
-        put_pixel(surf, x0, y0, color)
-        return
-    
-    x_inc = dx / steps
-    y_inc = dy / steps
-    x, y = x0, y0
+        return np.array([x0]), np.array([y0])
 
-    for _ in range(steps + 1):
-        put_pixel(surf, round(x), round(y), color)
-        x += x_inc
-        y += y_inc
+    # cumsum adds the increments one by one, exactly like the scalar x += x_inc loop
+    xs = np.cumsum(np.r_[float(x0), np.full(steps, dx / steps)])
+    ys = np.cumsum(np.r_[float(y0), np.full(steps, dy / steps)])
+    return np.rint(xs).astype(np.int32), np.rint(ys).astype(np.int32)
 
-def draw_line_bresenham(surf: pygame.Surface, p0: Point, p1: Point, color: Tuple[int, int, int] = BLACK):
-    x0, y0 = p0.x, p0.y
-    x1, y1 = p1.x, p1.y
+def line_bresenham_pixels(x0: int, y0: int, x1: int, y1: int) -> Tuple[np.ndarray, np.ndarray]:
     dx = abs(x1 - x0)
     dy = abs(y1 - y0)
     sx = 1 if x0 < x1 else -1
     sy = 1 if y0 < y1 else -1
-    err = dx - dy
 
-    while True:
-        put_pixel(surf, x0, y0, color)
-        if x0 == x1 and y0 == y1:
-            break
-        e2 = 2 * err
-        if e2 > -dy:
-            err -= dy
-            x0 += sx
-        if e2 < dx:
-            err += dx
-            y0 += sy
-
-def draw_circle_bresenham(surf: pygame.Surface, center: Point, r: int, color: Tuple[int, int, int] = BLACK):
+    # One step per pixel along the major axis; the minor axis advances whenever the
+    # error term crosses zero, which in closed form is a rounded (half-down) division.
+    major, minor = (dx, dy) if dx >= dy else (dy, dx)
+    k = np.arange(major + 1, dtype=np.int64)
+    if minor == 0:          # horizontal / vertical (and single point)
+        m = np.zeros_like(k)
+    elif minor == major:    # 45 degrees: one minor step per major step
+        m = k
+    else:
+        m = (2 * k * minor + major - 1) // (2 * major)
+    if dx >= dy:
+        return x0 + sx * k, y0 + sy * m
+    return x0 + sx * m, y0 + sy * k
+
+def circle_bresenham_pixels(cx: int, cy: int, r: int) -> Tuple[np.ndarray, np.ndarray]:
     if r <= 0:
-        put_pixel(surf, center.x, center.y, color)
-        return
+        return np.array([cx]), np.array([cy])
+    # walk a single octant (x <= y); the other seven are mirror images of it
+    ox: List[int] = []
+    oy: List[int] = []
+    # midpoint decision with the increments carried along (e = 2x+1, ty = 2y),
+    # so each step is adds/subtracts only
     x = 0
     y = r
     d = 1 - r
+    e = 1
+    ty = 2 * r
     while x <= y:
-        put_pixel(surf, center.x + x, center.y + y, color)
-        put_pixel(surf, center.x + y, center.y + x, color)
-        put_pixel(surf, center.x - x, center.y + y, color)
-        put_pixel(surf, center.x - y, center.y + x, color)
-        put_pixel(surf, center.x + x, center.y - y, color)
-        put_pixel(surf, center.x + y, center.y - x, color)
-        put_pixel(surf, center.x - x, center.y - y, color)
-        put_pixel(surf, center.x - y, center.y - x, color)
+        ox.append(x)
+        oy.append(y)
 
         x += 1
+        e += 2
         if d < 0:
-            d += 2 * x + 1
+            d += e
         else: 
             y -= 1
-            d += 2 * (x - y) + 1
+            ty -= 2
+            d += e - ty
+
+    a = np.array(ox, dtype=np.int32)
+    b = np.array(oy, dtype=np.int32)
+    xs = cx + np.concatenate((a, b, -a, -b, a, b, -a, -b))
+    ys = cy + np.concatenate((b, a, b, a, -b, -a, -b, -a))
+    return xs, ys
+
+def draw_line_dda(surf: pygame.Surface, p0: Point, p1: Point, color: Tuple[int, int, int] = BLACK):
+    put_pixels(surf, *line_dda_pixels(p0.x, p0.y, p1.x, p1.y), color)
+
+def draw_line_bresenham(surf: pygame.Surface, p0: Point, p1: Point, color: Tuple[int, int, int] = BLACK):
+    put_pixels(surf, *line_bresenham_pixels(p0.x, p0.y, p1.x, p1.y), color)
+
+def draw_circle_bresenham(surf: pygame.Surface, center: Point, r: int, color: Tuple[int, int, int] = BLACK):
+    put_pixels(surf, *circle_bresenham_pixels(center.x, center.y, r), color)
 
 # --- Selection helpers ---
 def norm_rect(a: Tuple[int, int], b: Tuple[int, int]) -> pygame.Rect:
@@ -150,8 +254,9 @@ def norm_rect(a: Tuple[int, int], b: Tuple[int, int]) -> pygame.Rect:
     h = abs(y1 - y0)
     return pygame.Rect(left, top, w, h)
 
-def point_in_rect(pt: Point, rect: pygame.Rect) -> bool:
-    return rect.collidepoint(pt.x, pt.y)
+def points_in_rect(xs: np.ndarray, ys: np.ndarray, rect: pygame.Rect) -> np.ndarray:
+    # same half-open test as rect.collidepoint, for arrays of points
+    return (xs >= rect.left) & (xs < rect.right) & (ys >= rect.top) & (ys < rect.bottom)
 
 # --- Transform math ---
 def rotate_point(px: float, py: float, cx: float, cy: float, theta: float) -> Tuple[int, int]:
@@ -169,20 +274,30 @@ def scale_point(px: float, py: float, cx: float, cy: float, s: float) -> Tuple[i
 
     return (int(round(x)), int(round(y)))
 
+# Array versions of rotate_point/scale_point: (N,2) points -> (N,2) rounded ints,
+# same arithmetic (and half-to-even rounding) as the scalar functions.
+# rotate_points takes cos/sin so a drag frame evaluates the trig only once.
+def rotate_points(pts: np.ndarray, cx: float, cy: float, ct: float, st: float) -> np.ndarray:
+    px, py = pts[:, 0], pts[:, 1]
+
+    x = cx + ct*(px - cx) - st*(py - cy)
+    y = cy + st*(px - cx) + ct*(py - cy)
+
+    return np.rint(np.stack((x, y), axis=1)).astype(np.int32)
+
+def scale_points(pts: np.ndarray, cx: float, cy: float, s: float) -> np.ndarray:
+    x = cx + s*(pts[:, 0] - cx)
+    y = cy + s*(pts[:, 1] - cy)
+
+    return np.rint(np.stack((x, y), axis=1)).astype(np.int32)
+
 # --- Clipping (Cohen–Sutherland & Liang–Barsky) ---
 INSIDE, LEFT, RIGHT, BOTTOM, TOP = 0, 1, 2, 4, 8
 
-def _cs_code(x: int, y: int, rect: pygame.Rect) -> int:
-    code = INSIDE
-    if x < rect.left: 
-        code |= LEFT
-    elif x > rect.right: 
-        code |= RIGHT
-    if y < rect.top: 
-        code |= TOP
-    elif y > rect.bottom: 
-        code |= BOTTOM
-    return code
+# branchless, so the same expression also works elementwise on NumPy arrays
+def _cs_code(x, y, rect: pygame.Rect):
+    return (((x < rect.left) * LEFT) | ((x > rect.right) * RIGHT)
+            | ((y < rect.top) * TOP) | ((y > rect.bottom) * BOTTOM))
 
 def cohen_sutherland_clip(p0: Point, p1: Point, rect: pygame.Rect) -> Optional[Tuple[Point, Point]]:
     x0, y0, x1, y1 = p0.x, p0.y, p1.x, p1.y
@@ -251,29 +366,79 @@ def liang_barsky_clip(p0: Point, p1: Point, rect: pygame.Rect) -> Optional[Tuple
     ny1 = int(round(y0 + u1 * dy))
     return Point(nx0, ny0), Point(nx1, ny1)
 
+def cohen_sutherland_clip_batch(P0: np.ndarray, P1: np.ndarray, rect: pygame.Rect) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # same iteration as cohen_sutherland_clip, run on every unresolved segment at once
+    P0 = P0.astype(np.int64)
+    P1 = P1.astype(np.int64)
+    code0 = _cs_code(P0[:, 0], P0[:, 1], rect)
+    code1 = _cs_code(P1[:, 0], P1[:, 1], rect)
+    accept = np.zeros(len(P0), dtype=bool)
+    active = np.ones(len(P0), dtype=bool)
+
+    while True:
+        accept |= active & ((code0 | code1) == 0)
+        active &= ~accept & ((code0 & code1) == 0)
+        idx = np.nonzero(active)[0]
+        if len(idx) == 0:
+            return accept, P0, P1
+
+        x0, y0 = P0[idx, 0], P0[idx, 1]
+        x1, y1 = P1[idx, 0], P1[idx, 1]
+        c0 = code0[idx]
+        code_out = np.where(c0 != 0, c0, code1[idx])
+        dx, dy = x1 - x0, y1 - y0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_top = np.where(dy != 0, x0 + dx * (rect.top - y0) / dy, x0)
+            x_bottom = np.where(dy != 0, x0 + dx * (rect.bottom - y0) / dy, x0)
+            y_right = np.where(dx != 0, y0 + dy * (rect.right - x0) / dx, y0)
+            y_left = np.where(dx != 0, y0 + dy * (rect.left - x0) / dx, y0)
+        edge = [(code_out & TOP) != 0, (code_out & BOTTOM) != 0, (code_out & RIGHT) != 0]
+        x = np.rint(np.select(edge, [x_top, x_bottom, rect.right], rect.left)).astype(np.int64)
+        y = np.rint(np.select(edge, [rect.top, rect.bottom, y_right], y_left)).astype(np.int64)
+
+        on0 = code_out == c0
+        i0, i1 = idx[on0], idx[~on0]
+        P0[i0, 0], P0[i0, 1] = x[on0], y[on0]
+        P1[i1, 0], P1[i1, 1] = x[~on0], y[~on0]
+        code0[i0] = _cs_code(P0[i0, 0], P0[i0, 1], rect)
+        code1[i1] = _cs_code(P1[i1, 0], P1[i1, 1], rect)
+
+def liang_barsky_clip_batch(P0: np.ndarray, P1: np.ndarray, rect: pygame.Rect) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    x0, y0 = P0[:, 0].astype(np.int64), P0[:, 1].astype(np.int64)
+    dx = P1[:, 0] - x0
+    dy = P1[:, 1] - y0
+    p = np.stack([-dx, dx, -dy, dy], axis=1)
+    q = np.stack([x0 - rect.left, rect.right - x0, y0 - rect.top, rect.bottom - y0], axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = q / p
+    u0 = np.where(p < 0, r, 0.0).max(axis=1)
+    u1 = np.where(p > 0, r, 1.0).min(axis=1)
+    accept = ~((p == 0) & (q < 0)).any(axis=1) & (u0 <= u1)
+    Q0 = np.stack([np.rint(x0 + u0 * dx), np.rint(y0 + u0 * dy)], axis=1).astype(np.int64)
+    Q1 = np.stack([np.rint(x0 + u1 * dx), np.rint(y0 + u1 * dy)], axis=1).astype(np.int64)
+    return accept, Q0, Q1
+
 def apply_clipping_to_lines(scene: Scene, rect: pygame.Rect, algo: str, selected: Optional[set] = None) -> Tuple[int,int]:
-    indices = list(range(len(scene.lines))) if not selected else sorted(selected)
-    keep = []
-    kept = 0
-    removed = 0
-    selected_set = set(indices)
-    for i, ln in enumerate(scene.lines):
-        if i not in selected_set and selected is not None:
-            keep.append(ln)
-            continue
-        if algo == "CS":
-            res = cohen_sutherland_clip(ln.p0, ln.p1, rect)
-        else:
-            res = liang_barsky_clip(ln.p0, ln.p1, rect)
-        if res is None:
-            removed += 1
-            # drop line
-        else:
-            (np0, np1) = res
-            keep.append(Line(Point(np0.x, np0.y), Point(np1.x, np1.y), ln.algo))
-            kept += 1
-    scene.lines = keep
-    return kept, removed
+    clip_batch = cohen_sutherland_clip_batch if algo == "CS" else liang_barsky_clip_batch
+    xy = scene.line_xy
+
+    # clipped endpoints are written back into the scene rows; rejected rows are compacted away
+    if not selected:
+        accept, P0, P1 = clip_batch(xy[:, :2], xy[:, 2:], rect)
+        xy[accept] = np.concatenate((P0[accept], P1[accept]), axis=1)
+        keep = accept
+        total = len(accept)
+    else:
+        idx = np.array(sorted(i for i in selected if 0 <= i < scene.n_lines), dtype=np.intp)
+        accept, P0, P1 = clip_batch(xy[idx, :2], xy[idx, 2:], rect)
+        xy[idx[accept]] = np.concatenate((P0[accept], P1[accept]), axis=1)
+        keep = np.ones(scene.n_lines, dtype=bool)
+        keep[idx[~accept]] = False
+        total = len(idx)
+
+    scene.keep_lines(keep)
+    kept = int(accept.sum())
+    return kept, total - kept
 
 def main():
     pygame.init()
@@ -315,11 +480,16 @@ def main():
     # transform drag state (shared across translate/rotate/scale)
     dragging: bool = False
     drag_anchor: Optional[Tuple[int, int]] = None
-    lines_snapshot: List[Tuple[int, Tuple[int, int, int, int]]] = []
-    circles_snapshot: List[Tuple[int, Tuple[int, int, int, int]]] = []
+    # sorted selection indices and the matching line_xy / circle_cxcyr rows at drag start
+    sel_idx_lines: np.ndarray = np.empty(0, dtype=np.int32)
+    sel_idx_circles: np.ndarray = np.empty(0, dtype=np.int32)
+    lines_snapshot: Optional[np.ndarray] = None
+    circles_snapshot: Optional[np.ndarray] = None
     pivot: Optional[Tuple[float, float]] = None
     anchor_angle: float = 0.0
     anchor_dist: float = 1.0
+    # canvas with only the unselected primitives, rebuilt when a drag starts
+    static_canvas: Optional[pygame.Surface] = None
 
     # clipping window state
     clip_setting: bool = False
@@ -328,13 +498,35 @@ def main():
     clip_window: Optional[pygame.Rect] = None
 
     def translating_state_reset():
-        nonlocal dragging, drag_anchor, lines_snapshot, circles_snapshot, pivot
+        nonlocal dragging, drag_anchor, lines_snapshot, circles_snapshot, pivot, static_canvas
         dragging = False
         drag_anchor = None
-        lines_snapshot = []
-        circles_snapshot = []
+        lines_snapshot = None
+        circles_snapshot = None
         pivot = None
-
+        static_canvas = None
+
+    def take_snapshots():
+        nonlocal sel_idx_lines, sel_idx_circles, lines_snapshot, circles_snapshot
+        sel_idx_lines = np.sort(np.fromiter(selected_lines, dtype=np.int32, count=len(selected_lines)))
+        sel_idx_circles = np.sort(np.fromiter(selected_circles, dtype=np.int32, count=len(selected_circles)))
+        lines_snapshot = scene.line_xy[sel_idx_lines]  # fancy indexing: already a copy
+        circles_snapshot = scene.circle_cxcyr[sel_idx_circles]
+
+    def begin_drag_canvas():
+        nonlocal static_canvas
+        keep_l = np.ones(scene.n_lines, dtype=bool)
+        keep_c = np.ones(scene.n_circles, dtype=bool)
+        keep_l[sel_idx_lines] = False
+        keep_c[sel_idx_circles] = False
+        static_canvas = pygame.Surface((CANVAS_W, CANVAS_H))
+        static_canvas.fill(CANVAS_BG)
+        draw_scene(static_canvas, keep_l, keep_c)
+
+    def redraw_dragged():
+        # only the selection moves: restore the static part, rasterize the selection on top
+        canvas.blit(static_canvas, (0, 0))
+        draw_scene(canvas, sel_idx_lines, sel_idx_circles)
 
     def set_line_dda():
         nonlocal mode, pending_start, pending_center
@@ -446,6 +638,13 @@ def main():
 
     add_button("Clear Canvas", clear_canvas)
 
+    # sidebar parts that never change: background, title, buttons in their idle state
+    ui_static = pygame.Surface((UI_W, HEIGHT))
+    ui_static.fill(UI_BG)
+    ui_static.blit(render_text(font, "TP1 - CG", WHITE), (12, 12))
+    for b in buttons:
+        b.draw(ui_static, font_small)
+
     canvas.fill(CANVAS_BG)
 
     def to_canvas_pos(pos) -> Optional[Tuple[int, int]]:
@@ -455,33 +654,45 @@ def main():
         return (x - UI_W, y)
     
     def selection_bbox_and_pivot() -> Optional[Tuple[pygame.Rect, Tuple[float,float]]]:
-        xs: List[int] = []
-        ys: List[int] = []
-        for i in selected_lines:
-            ln = scene.lines[i]
-            xs.extend([ln.p0.x, ln.p1.x])
-            ys.extend([ln.p0.y, ln.p1.y])
-        for i in selected_circles:
-            c = scene.circles[i]
-            xs.extend([c.c.x - c.r, c.c.x + c.r])
-            ys.extend([c.c.y - c.r, c.c.y + c.r])
-        if not xs or not ys:
+        if not selected_lines and not selected_circles:
             return None
-        left, right = min(xs), max(xs)
-        top, bottom = min(ys), max(ys)
+        circ = scene.circle_cxcyr[list(selected_circles)]
+        pts = np.concatenate((scene.line_xy[list(selected_lines)].reshape(-1, 2),
+                              circ[:, :2] - circ[:, 2:], circ[:, :2] + circ[:, 2:]))
+        left, top = pts.min(axis=0).tolist()
+        right, bottom = pts.max(axis=0).tolist()
         rect = pygame.Rect(left, top, right - left, bottom - top)
         cx, cy = (left + right) / 2.0, (top + bottom) / 2.0
         return rect, (cx, cy)
     
+    def draw_scene(surf: pygame.Surface, lines, circles):
+        # lines/circles: anything that indexes the scene arrays (mask, index array, slice).
+        # All hand-rasterized pixels are gathered and written under a single surface lock.
+        xs: List[np.ndarray] = []
+        ys: List[np.ndarray] = []
+        for (x0, y0, x1, y1), algo in zip(scene.line_xy[lines].tolist(), scene.line_algo[lines].tolist()):
+            if LINE_ALGOS[algo] == "DDA":
+                px, py = line_dda_pixels(x0, y0, x1, y1)
+            elif FAST_DRAW:
+                pygame.draw.line(surf, BLACK, (x0, y0), (x1, y1), 1)
+                continue
+            else:
+                px, py = line_bresenham_pixels(x0, y0, x1, y1)
+            xs.append(px)
+            ys.append(py)
+        for cx, cy, r in scene.circle_cxcyr[circles].tolist():
+            if FAST_DRAW:
+                pygame.draw.circle(surf, BLACK, (cx, cy), r, 1)
+                continue
+            px, py = circle_bresenham_pixels(cx, cy, r)
+            xs.append(px)
+            ys.append(py)
+        if xs:
+            put_pixels(surf, np.concatenate(xs), np.concatenate(ys), BLACK)
+
     def redraw_canvas_from_scene():
         canvas.fill(CANVAS_BG)
-        for ln in scene.lines:
-            if ln.algo == "DDA":
-                draw_line_dda(canvas, ln.p0, ln.p1, BLACK)
-            else:
-                draw_line_bresenham(canvas, ln.p0, ln.p1, BLACK)
-        for c in scene.circles:
-            draw_circle_bresenham(canvas, c.c, c.r, BLACK)
+        draw_scene(canvas, slice(None), slice(None))
     
     def redraw_overlay():
         overlay.fill((0,0,0,0))
@@ -500,11 +711,11 @@ def main():
             pygame.draw.rect(overlay, CLIP_COLOR, clip_window, width=2)
 
         if selected_lines:
-            valid_line_indices = {i for i in selected_lines if 0 <= i < len(scene.lines)}
+            valid_line_indices = {i for i in selected_lines if 0 <= i < scene.n_lines}
             if valid_line_indices != selected_lines:
                 selected_lines.intersection_update(valid_line_indices)
         if selected_circles:
-            valid_circle_indices = {i for i in selected_circles if 0 <= i < len(scene.circles)}
+            valid_circle_indices = {i for i in selected_circles if 0 <= i < scene.n_circles}
             if valid_circle_indices != selected_circles:
                 selected_circles.intersection_update(valid_circle_indices)
 
@@ -515,35 +726,31 @@ def main():
             pygame.draw.rect(overlay, (80,180,255,120), bbox, width=2)
             pygame.draw.circle(overlay, (255,140,0,220), (int(cx), int(cy)), 4)  # pivot marker
 
-        # highlights
-        for i in selected_lines:
-            ln = scene.lines[i]
-            if ln.algo == "DDA":
-                draw_line_dda(overlay, ln.p0, ln.p1, ACCENT[:3])
-            else:
-                draw_line_bresenham(overlay, ln.p0, ln.p1, ACCENT[:3])
-        for i in selected_circles:
-            c = scene.circles[i]
-            draw_circle_bresenham(overlay, c.c, c.r, ACCENT[:3])
+        # highlights (pygame.draw: just feedback, not the course rasterizers)
+        for x0, y0, x1, y1 in scene.line_xy[list(selected_lines)].tolist():
+            pygame.draw.line(overlay, ACCENT, (x0, y0), (x1, y1))
+        for cx, cy, r in scene.circle_cxcyr[list(selected_circles)].tolist():
+            pygame.draw.circle(overlay, ACCENT, (cx, cy), r, 1)
     
     def run_selection(rect: pygame.Rect):
         nonlocal selected_lines, selected_circles
         selected_lines = set()
         selected_circles = set()
 
-        for i, ln in enumerate(scene.lines):
-            if point_in_rect(ln.p0, rect) or point_in_rect(ln.p1, rect):
-                selected_lines.add(i)
+        xy = scene.line_xy
+        hit = points_in_rect(xy[:, 0], xy[:, 1], rect) | points_in_rect(xy[:, 2], xy[:, 3], rect)
+        selected_lines.update(np.nonzero(hit)[0].tolist())
+
+        cc = scene.circle_cxcyr
+        selected_circles.update(np.nonzero(points_in_rect(cc[:, 0], cc[:, 1], rect))[0].tolist())
 
-        for i, c in enumerate(scene.circles):
-            if point_in_rect(c.c, rect):
-                selected_circles.add(i)
 
 
+    ui_key = None  # what the sidebar last showed; re-rendered only when it changes
 
     running = True
     while running:
-        for ev in pygame.event.get():
+        for ev in coalesce_motion(pygame.event.get()):
             if ev.type == pygame.QUIT:
                 running = False
 
@@ -584,30 +791,21 @@ def main():
                         if ev.type == pygame.MOUSEBUTTONDOWN and cpos and (selected_lines or selected_circles):
                             dragging = True
                             drag_anchor = cpos
-
-                            lines_snapshot = [(i, (scene.lines[i].p0.x, scene.lines[i].p0.y,
-                                                   scene.lines[i].p1.x, scene.lines[i].p1.y))
-                                              for i in selected_lines]
-                            circles_snapshot = [(i, (scene.circles[i].c.x, scene.circles[i].c.y))
-                                                for i in selected_circles]
+                            take_snapshots()
+                            begin_drag_canvas()
                         elif ev.type == pygame.MOUSEMOTION and cpos and dragging and drag_anchor:
                             dx = cpos[0] - drag_anchor[0]
                             dy = cpos[1] - drag_anchor[1]
                             # apply to scene using snapshots (no cumulative drift)
-                            for i, (x0, y0, x1, y1) in lines_snapshot:
-                                scene.lines[i].p0.x = x0 + dx
-                                scene.lines[i].p0.y = y0 + dy
-                                scene.lines[i].p1.x = x1 + dx
-                                scene.lines[i].p1.y = y1 + dy
-                            for i, (cx, cy) in circles_snapshot:
-                                scene.circles[i].c.x = cx + dx
-                                scene.circles[i].c.y = cy + dy
-                            redraw_canvas_from_scene()
+                            scene.line_xy[sel_idx_lines] = lines_snapshot + (dx, dy, dx, dy)
+                            scene.circle_cxcyr[sel_idx_circles] = circles_snapshot + (dx, dy, 0)
+                            redraw_dragged()
                         elif ev.type == pygame.MOUSEBUTTONUP and dragging:
                             dragging = False
                             drag_anchor = None
-                            lines_snapshot = []
-                            circles_snapshot = []
+                            lines_snapshot = None
+                            circles_snapshot = None
+                            static_canvas = None
 
                      # --- ROTATE (around selection bbox center) ---
                     elif mode == "ROTATE":
@@ -621,33 +819,24 @@ def main():
                             drag_anchor = cpos
                             ax, ay = cpos[0] - cx, cpos[1] - cy
                             anchor_angle = math.atan2(ay, ax) if (ax or ay) else 0.0
-                            # snapshot originals
-                            lines_snapshot = [(i, (scene.lines[i].p0.x, scene.lines[i].p0.y,
-                                                   scene.lines[i].p1.x, scene.lines[i].p1.y))
-                                              for i in selected_lines]
-                            circles_snapshot = [(i, (scene.circles[i].c.x, scene.circles[i].c.y, scene.circles[i].r))
-                                                for i in selected_circles]
+                            take_snapshots()
+                            begin_drag_canvas()
                         elif ev.type == pygame.MOUSEMOTION and cpos and dragging and pivot:
                             cx, cy = pivot
                             vx, vy = cpos[0] - cx, cpos[1] - cy
                             cur_angle = math.atan2(vy, vx) if (vx or vy) else anchor_angle
                             theta = cur_angle - anchor_angle
-                            # rotate from snapshots
-                            for i, (x0, y0, x1, y1) in lines_snapshot:
-                                nx0, ny0 = rotate_point(x0, y0, cx, cy, theta)
-                                nx1, ny1 = rotate_point(x1, y1, cx, cy, theta)
-                                scene.lines[i].p0.x, scene.lines[i].p0.y = nx0, ny0
-                                scene.lines[i].p1.x, scene.lines[i].p1.y = nx1, ny1
-                            for i, (cx0, cy0, r0) in circles_snapshot:
-                                ncx, ncy = rotate_point(cx0, cy0, cx, cy, theta)
-                                scene.circles[i].c.x, scene.circles[i].c.y = ncx, ncy
-                                scene.circles[i].r = r0  # radius unchanged by rotation
-                            redraw_canvas_from_scene()
+                            ct, st = math.cos(theta), math.sin(theta)
+                            # rotate from snapshots (radius unchanged by rotation)
+                            scene.line_xy[sel_idx_lines] = rotate_points(lines_snapshot.reshape(-1, 2), cx, cy, ct, st).reshape(-1, 4)
+                            scene.circle_cxcyr[sel_idx_circles, :2] = rotate_points(circles_snapshot[:, :2], cx, cy, ct, st)
+                            redraw_dragged()
                         elif ev.type == pygame.MOUSEBUTTONUP and dragging:
                             dragging = False
                             drag_anchor = None
-                            lines_snapshot = []
-                            circles_snapshot = []
+                            lines_snapshot = None
+                            circles_snapshot = None
+                            static_canvas = None
                             pivot = None
 
                     # --- SCALE_UNIFORM (around selection bbox center) ---
@@ -662,33 +851,24 @@ def main():
                             drag_anchor = cpos
                             dx0, dy0 = cpos[0] - cx, cpos[1] - cy
                             anchor_dist = max(1e-6, math.hypot(dx0, dy0))  # avoid /0
-                            # snapshot originals
-                            lines_snapshot = [(i, (scene.lines[i].p0.x, scene.lines[i].p0.y,
-                                                   scene.lines[i].p1.x, scene.lines[i].p1.y))
-                                              for i in selected_lines]
-                            circles_snapshot = [(i, (scene.circles[i].c.x, scene.circles[i].c.y, scene.circles[i].r))
-                                                for i in selected_circles]
+                            take_snapshots()
+                            begin_drag_canvas()
                         elif ev.type == pygame.MOUSEMOTION and cpos and dragging and pivot:
                             cx, cy = pivot
                             dx, dy = cpos[0] - cx, cpos[1] - cy
                             cur_dist = max(1e-6, math.hypot(dx, dy))
                             s = cur_dist / anchor_dist
                             # scale from snapshots (uniform)
-                            for i, (x0, y0, x1, y1) in lines_snapshot:
-                                nx0, ny0 = scale_point(x0, y0, cx, cy, s)
-                                nx1, ny1 = scale_point(x1, y1, cx, cy, s)
-                                scene.lines[i].p0.x, scene.lines[i].p0.y = nx0, ny0
-                                scene.lines[i].p1.x, scene.lines[i].p1.y = nx1, ny1
-                            for i, (cx0, cy0, r0) in circles_snapshot:
-                                ncx, ncy = scale_point(cx0, cy0, cx, cy, s)
-                                scene.circles[i].c.x, scene.circles[i].c.y = ncx, ncy
-                                scene.circles[i].r = max(0, int(round(r0 * s)))
-                            redraw_canvas_from_scene()
+                            scene.line_xy[sel_idx_lines] = scale_points(lines_snapshot.reshape(-1, 2), cx, cy, s).reshape(-1, 4)
+                            scene.circle_cxcyr[sel_idx_circles, :2] = scale_points(circles_snapshot[:, :2], cx, cy, s)
+                            scene.circle_cxcyr[sel_idx_circles, 2] = np.maximum(0, np.rint(circles_snapshot[:, 2] * s))
+                            redraw_dragged()
                         elif ev.type == pygame.MOUSEBUTTONUP and dragging:
                             dragging = False
                             drag_anchor = None
-                            lines_snapshot = []
-                            circles_snapshot = []
+                            lines_snapshot = None
+                            circles_snapshot = None
+                            static_canvas = None
                             pivot = None
 
                     elif ev.type == pygame.MOUSEBUTTONDOWN and cpos:
@@ -696,49 +876,52 @@ def main():
                         if mode == "LINE_DDA":
                             if pending_start is None:
                                 pending_start = Point(cx, cy)
-                                put_pixel(canvas, cx, cy, (0, 120, 255))
+                                put_pixel(canvas, cx, cy, ACCENT)
                             else:
                                 end = Point(cx, cy)
-                                scene.lines.append(Line(pending_start, end, "DDA"))
+                                scene.add_line(Line(pending_start, end, "DDA"))
                                 draw_line_dda(canvas, pending_start, end, BLACK)
                                 pending_start = None
 
                         elif mode == "LINE_BRESENHAM":
                             if pending_start is None:
                                 pending_start = Point(cx, cy)
-                                put_pixel(canvas, cx, cy, (0, 120, 255))
+                                put_pixel(canvas, cx, cy, ACCENT)
                             else:
                                 end = Point(cx, cy)
-                                scene.lines.append(Line(pending_start, end, "DDA"))
+                                scene.add_line(Line(pending_start, end, "DDA"))
                                 draw_line_bresenham(canvas, pending_start, end, BLACK)
                                 pending_start = None
 
                         elif mode == "CIRCLE_BRESENHAM":
                             if pending_center is None:
                                 pending_center = Point(cx, cy)
-                                put_pixel(canvas, cx, cy, (0, 120, 255))
+                                put_pixel(canvas, cx, cy, ACCENT)
 
                             else:
                                 dx =  cx - pending_center.x
                                 dy = cy - pending_center.y
                                 r = max(0, int(round(math.hypot(dx, dy))))
-                                scene.circles.append(Circle(pending_center, r, "BRESENHAM"))   
+                                scene.add_circle(Circle(pending_center, r, "BRESENHAM"))   
                                 draw_circle_bresenham(canvas, pending_center, r, BLACK)
                                 pending_center = None                             
 
 
         # draw UI
-        ui.fill(UI_BG)
-        title = font.render("TP1 - CG", True, WHITE)
-        ui.blit(title, (12, 12))
-        mode_txt = font_small.render(f"Moda: {mode}", True, (220, 220, 230))
-        ui.blit(mode_txt, (12, 34))
-        sel_info = f"Selected: {len(selected_lines)} lines, {len(selected_circles)} circles"
-        ui.blit(font_small.render(sel_info, True, (200, 210, 220)), (12, 54 + 44*4 + 40))  # under buttons
-
-
-        for b in buttons:
-            b.draw(ui, font_small)
+        key = (mode, len(selected_lines), len(selected_circles), tuple(b.hover for b in buttons))
+        if key != ui_key:
+            ui_key = key
+            ui.blit(ui_static, (0, 0))
+            mode_txt = render_text(font_small, f"Moda: {mode}", (220, 220, 230))
+            text_rects = [ui.blit(mode_txt, (12, 34))]
+            sel_info = f"Selected: {len(selected_lines)} lines, {len(selected_circles)} circles"
+            text_rects.append(ui.blit(render_text(font_small, sel_info, (200, 210, 220)), (12, 54 + 44*4 + 40)))  # under buttons
+
+            # buttons are drawn over the text; only redraw the ones the text touched or that are hovered
+            for b in buttons:
+                if b.hover or b.rect.collidelist(text_rects) != -1:
+                    b.draw(ui, font_small)
+            pygame.display.set_caption(f"TP1 CG — Mode: {mode}")
 
         redraw_overlay()
     
@@ -747,7 +930,6 @@ def main():
         screen.blit(ui, (0, 0))
         screen.blit(canvas, (UI_W, 0))
         screen.blit(overlay, (UI_W, 0))
-        pygame.display.set_caption(f"TP1 CG — Mode: {mode}")
         pygame.display.flip()
         clock.tick(60)
 
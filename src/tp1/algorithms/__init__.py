@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from .circles import draw_circle_bresenham
+from .circles import circle_offsets, draw_circle_bresenham
 from .clipping import cohen_sutherland_clip, liang_barsky_clip
-from .lines import draw_line_bresenham, draw_line_dda
+from .lines import LINE_PIXELS, draw_line_bresenham, draw_line_dda
 
 __all__ = [
     "draw_line_dda",
     "draw_line_bresenham",
     "draw_circle_bresenham",
+    "LINE_PIXELS",
+    "circle_offsets",
     "cohen_sutherland_clip",
     "liang_barsky_clip",
 ]
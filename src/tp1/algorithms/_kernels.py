@@ -0,0 +1,77 @@
+"""Loop-free pixel generators for the rasterizers.
+
+Each function returns the ``(xs, ys)`` pixels its scalar algorithm visits, in
+the same order, so callers can write them with a single bulk store.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def dda_line(x0: int, y0: int, x1: int, y1: int) -> tuple[np.ndarray, np.ndarray]:
+    dx, dy = x1 - x0, y1 - y0
+    steps = max(abs(dx), abs(dy))
+    if steps == 0:
+        return np.array([x0], dtype=np.int32), np.array([y0], dtype=np.int32)
+    # step k is at x0 + k*dx/steps rounded half up; scaling by 2*steps keeps it
+    # in integers, so there is no float increment or round() per pixel
+    k = np.arange(steps + 1, dtype=np.int64)
+    xs = x0 + (2 * k * dx + steps) // (2 * steps)
+    ys = y0 + (2 * k * dy + steps) // (2 * steps)
+    return xs.astype(np.int32), ys.astype(np.int32)
+
+
+def bresenham_line(x0: int, y0: int, x1: int, y1: int) -> tuple[np.ndarray, np.ndarray]:
+    dx, dy = abs(x1 - x0), abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    major, minor = (dx, dy) if dx >= dy else (dy, dx)
+    k = np.arange(major + 1, dtype=np.int64)
+    # the error term makes the minor axis advance at the rounded (half-down)
+    # value of k*minor/major
+    m = (2 * k * minor + major - 1) // (2 * major) if major else k
+    if dx >= dy:
+        return (x0 + sx * k).astype(np.int32), (y0 + sy * m).astype(np.int32)
+    return (x0 + sx * m).astype(np.int32), (y0 + sy * k).astype(np.int32)
+
+
+def bresenham_lines(
+    x0: np.ndarray, y0: np.ndarray, x1: np.ndarray, y1: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    `bresenham_line` for N segments in one pass. Returns ``(xs, ys, counts)``:
+    the pixels of segment i are the next ``counts[i]`` entries, in order.
+    """
+    x0, y0, x1, y1 = (np.asarray(a, dtype=np.int64) for a in (x0, y0, x1, y1))
+    dx, dy = np.abs(x1 - x0), np.abs(y1 - y0)
+    sx = np.where(x0 < x1, 1, -1)
+    sy = np.where(y0 < y1, 1, -1)
+    x_major = dx >= dy
+    major = np.where(x_major, dx, dy)
+    minor = np.where(x_major, dy, dx)
+
+    counts = major + 1
+    seg = np.repeat(np.arange(len(counts)), counts)
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    M, m = major[seg], minor[seg]
+    mk = (2 * k * m + np.maximum(M - 1, 0)) // np.maximum(2 * M, 1)  # 0 when M == 0
+    kx = np.where(x_major[seg], k, mk)
+    ky = np.where(x_major[seg], mk, k)
+    xs = (x0[seg] + sx[seg] * kx).astype(np.int32)
+    ys = (y0[seg] + sy[seg] * ky).astype(np.int32)
+    return xs, ys, counts
+
+
+def circle_octant(r: int) -> tuple[np.ndarray, np.ndarray]:
+    """Offsets of the midpoint circle's first octant (``x <= y``), for ``r > 0``."""
+    # The integer decision ``d < 0`` keeps y exactly while x^2 + y(y-1) < r^2, so
+    # y(x) is the largest y with (2y-1)^2 <= 4(r^2 - x^2) - 3.
+    x = np.arange(int(r / 2**0.5) + 2, dtype=np.int64)
+    n = 4 * (r * r - x * x) - 3
+    s = np.sqrt(np.maximum(n, 0)).astype(np.int64)
+    s -= s * s > n  # fix float sqrt to the exact integer sqrt
+    s += (s + 1) * (s + 1) <= n
+    y = (s + 1) // 2
+    keep = x <= y
+    return x[keep].astype(np.int32), y[keep].astype(np.int32)
@@ -1,9 +1,31 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
+import numpy as np
 import pygame
 
-from ..render.raster import put_pixel
+from ..render.raster import draw_points_bulk, put_pixel
 from ..scene.models import Point
+from ._kernels import circle_octant
+
+
+@lru_cache(maxsize=256)
+def circle_offsets(r: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pixel offsets from the center of a Bresenham circle of radius `r`. Memoized per
+    radius (scenes reuse a few radii), so the arrays are returned read-only.
+    """
+    if r <= 0:
+        dx, dy = np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.int32)
+    else:
+        # one octant (x <= y); the other seven are its mirror images
+        a, b = circle_octant(r)
+        dx = np.concatenate((a, b, -a, -b, a, b, -a, -b))
+        dy = np.concatenate((b, a, b, a, -b, -a, -b, -a))
+    dx.flags.writeable = False
+    dy.flags.writeable = False
+    return dx, dy
 
 
 def draw_circle_bresenham(
@@ -15,22 +37,5 @@ def draw_circle_bresenham(
     if r <= 0:
         put_pixel(surf, center.x, center.y, color)
         return
-    x = 0
-    y = r
-    d = 1 - r
-    while x <= y:
-        put_pixel(surf, center.x + x, center.y + y, color)
-        put_pixel(surf, center.x + y, center.y + x, color)
-        put_pixel(surf, center.x - x, center.y + y, color)
-        put_pixel(surf, center.x - y, center.y + x, color)
-        put_pixel(surf, center.x + x, center.y - y, color)
-        put_pixel(surf, center.x + y, center.y - x, color)
-        put_pixel(surf, center.x - x, center.y - y, color)
-        put_pixel(surf, center.x - y, center.y - x, color)
-
-        x += 1
-        if d < 0:
-            d += 2 * x + 1
-        else:
-            y -= 1
-            d += 2 * (x - y) + 1
+    dx, dy = circle_offsets(r)
+    draw_points_bulk(surf, center.x + dx, center.y + dy, color)
@@ -1,9 +1,29 @@
 from __future__ import annotations
 
-from .cohen_sutherland import cohen_sutherland_clip
-from .liang_barsky import liang_barsky_clip
+from .cohen_sutherland import cohen_sutherland_batch, cohen_sutherland_clip, outcodes
+from .liang_barsky import liang_barsky_batch, liang_barsky_clip
+from .skala import skala_clip
+
+# preview/apply algorithm code -> segment clipper
+CLIPPERS = {
+    "CS": cohen_sutherland_clip,
+    "LB": liang_barsky_clip,
+    "SK": skala_clip,
+}
+
+# algorithm code -> vectorized clipper over endpoint arrays, where one exists
+BATCH_CLIPPERS = {
+    "CS": cohen_sutherland_batch,
+    "LB": liang_barsky_batch,
+}
 
 __all__ = [
+    "CLIPPERS",
+    "BATCH_CLIPPERS",
     "cohen_sutherland_clip",
+    "cohen_sutherland_batch",
     "liang_barsky_clip",
+    "liang_barsky_batch",
+    "outcodes",
+    "skala_clip",
 ]
\ No newline at end of file
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from math import floor as _floor
+
+import numpy as np
+import pygame
+
 from ...scene.models import Point
 from ...scene.models import Rect4 as _Rect4  # (left, top, width, height)
 
@@ -7,38 +12,53 @@ from ...scene.models import Rect4 as _Rect4  # (left, top, width, height)
 INSIDE, LEFT, RIGHT, BOTTOM, TOP = 0, 1, 2, 4, 8
 
 
-def _edges(rect: _Rect4) -> tuple[int, int, int, int]:
+def _edges(rect: pygame.Rect | _Rect4) -> tuple[int, int, int, int]:
     left, top, w, h = rect
     right = left + w
     bottom = top + h
     return left, top, right, bottom
 
 
-def _code(x: int, y: int, rect: _Rect4) -> int:
-    left, top, right, bottom = _edges(rect)
-    code = INSIDE
-    if x < left:
-        code |= LEFT
-    elif x > right:
-        code |= RIGHT
-    if y < top:
-        code |= TOP
-    elif y > bottom:
-        code |= BOTTOM
-    return code
+def _code(x: int, y: int, edges: tuple[int, int, int, int]) -> int:
+    # Branchless: each comparison is a bool shifted onto its bit (LEFT/RIGHT/BOTTOM/TOP).
+    # x < left and x > right cannot both hold for a valid rect, same for y.
+    left, top, right, bottom = edges
+    return (x < left) | ((x > right) << 1) | ((y > bottom) << 2) | ((y < top) << 3)
+
+
+def outcodes(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    rect: pygame.Rect | _Rect4,
+    edges: tuple[int, int, int, int] | None = None,
+) -> np.ndarray:
+    """Region codes (as `_code`) for arrays of points, as uint8."""
+    left, top, right, bottom = edges or _edges(rect)
+    u8 = np.uint8
+    return (
+        (xs < left).astype(u8)
+        | ((xs > right).astype(u8) << 1)
+        | ((ys > bottom).astype(u8) << 2)
+        | ((ys < top).astype(u8) << 3)
+    )
 
 
 def cohen_sutherland_clip(
-    p0: Point, p1: Point, rect: _Rect4
+    p0: Point,
+    p1: Point,
+    rect: pygame.Rect | _Rect4,
+    edges: tuple[int, int, int, int] | None = None,
 ) -> tuple[Point, Point] | None:
     """
     Clip a segment against axis-aligned rect using Cohen–Sutherland.
+    `edges` is the rect's (left, top, right, bottom) if the caller has it cached.
     Returns new endpoints or None if fully outside.
     """
+    edges = edges or _edges(rect)
     x0, y0, x1, y1 = p0.x, p0.y, p1.x, p1.y
-    code0 = _code(x0, y0, rect)
-    code1 = _code(x1, y1, rect)
-    left, top, right, bottom = _edges(rect)
+    code0 = _code(x0, y0, edges)
+    code1 = _code(x1, y1, edges)
+    left, top, right, bottom = edges
 
     while True:
         if not (code0 | code1):  # both inside
@@ -60,9 +80,63 @@ def cohen_sutherland_clip(
             y = y0 + (y1 - y0) * (left - x0) / (x1 - x0) if x1 != x0 else y0
             x = left
 
-        if code_out == code0:
-            x0, y0 = int(round(x)), int(round(y))
-            code0 = _code(x0, y0, rect)
+        if code0:  # code_out is code0 whenever code0 is nonzero
+            x0, y0 = _floor(x + 0.5), _floor(y + 0.5)
+            code0 = _code(x0, y0, edges)
         else:
-            x1, y1 = int(round(x)), int(round(y))
-            code1 = _code(x1, y1, rect)
+            x1, y1 = _floor(x + 0.5), _floor(y + 0.5)
+            code1 = _code(x1, y1, edges)
+
+
+def cohen_sutherland_batch(
+    x0: np.ndarray,
+    y0: np.ndarray,
+    x1: np.ndarray,
+    y1: np.ndarray,
+    rect: pygame.Rect | _Rect4,
+    edges: tuple[int, int, int, int] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Cohen–Sutherland over N segments at once (endpoint arrays of shape (N,)).
+    Returns (mask, nx0, ny0, nx1, ny1) like `liang_barsky_batch`. Each pass moves one
+    outside endpoint of every unresolved segment onto an edge, with the same
+    arithmetic and rounding as `cohen_sutherland_clip`.
+    """
+    edges = edges or _edges(rect)
+    left, top, right, bottom = edges
+    x0, y0, x1, y1 = (np.array(a, dtype=np.int64) for a in (x0, y0, x1, y1))
+    code0 = outcodes(x0, y0, rect, edges)
+    code1 = outcodes(x1, y1, rect, edges)
+    mask = np.zeros(len(x0), dtype=bool)
+
+    todo = np.arange(len(x0))
+    while todo.size:
+        c0, c1 = code0[todo], code1[todo]
+        mask[todo[(c0 | c1) == 0]] = True
+        open_ = ((c0 | c1) != 0) & ((c0 & c1) == 0)
+        todo, c0, c1 = todo[open_], c0[open_], c1[open_]
+        if not todo.size:
+            break
+
+        ax0, ay0, ax1, ay1 = x0[todo], y0[todo], x1[todo], y1[todo]
+        dx, dy = ax1 - ax0, ay1 - ay0
+        first = c0 != 0
+        code_out = np.where(first, c0, c1)
+        # edge priority as in the scalar loop: top, bottom, right, left
+        on_top = (code_out & TOP) != 0
+        on_y_edge = on_top | ((code_out & BOTTOM) != 0)
+        ey = np.where(on_top, top, bottom)
+        ex = np.where((code_out & RIGHT) != 0, right, left)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xi = np.where(dy != 0, ax0 + dx * (ey - ay0) / dy, ax0)
+            yi = np.where(dx != 0, ay0 + dy * (ex - ax0) / dx, ay0)
+        nx = np.floor(np.where(on_y_edge, xi, ex) + 0.5).astype(np.int64)
+        ny = np.floor(np.where(on_y_edge, ey, yi) + 0.5).astype(np.int64)
+
+        i0, i1 = todo[first], todo[~first]
+        x0[i0], y0[i0] = nx[first], ny[first]
+        x1[i1], y1[i1] = nx[~first], ny[~first]
+        code0[i0] = outcodes(x0[i0], y0[i0], rect, edges)
+        code1[i1] = outcodes(x1[i1], y1[i1], rect, edges)
+
+    return mask, x0.astype(np.int32), y0.astype(np.int32), x1.astype(np.int32), y1.astype(np.int32)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from math import floor as _floor
+
+import numpy as np
+import pygame
+
 from ...scene.models import Point
 from ...scene.models import Rect4 as _Rect4  # (left, top, width, height)
 
 
-def _edges(rect: _Rect4) -> tuple[int, int, int, int]:
+def _edges(rect: pygame.Rect | _Rect4) -> tuple[int, int, int, int]:
     left, top, w, h = rect
     right = left + w
     bottom = top + h
@@ -12,45 +17,94 @@ def _edges(rect: _Rect4) -> tuple[int, int, int, int]:
 
 
 def liang_barsky_clip(
-    p0: Point, p1: Point, rect: _Rect4
+    p0: Point,
+    p1: Point,
+    rect: pygame.Rect | _Rect4,
+    edges: tuple[int, int, int, int] | None = None,
 ) -> tuple[Point, Point] | None:
     """
     Clip a segment against axis-aligned rect using Liang–Barsky (parametric).
+    `edges` is the rect's (left, top, right, bottom) if the caller has it cached.
     Returns new endpoints or None if fully outside.
     """
     x0, y0, x1, y1 = p0.x, p0.y, p1.x, p1.y
     dx = x1 - x0
     dy = y1 - y0
+    left, top, right, bottom = edges or _edges(rect)
 
-    x_min, y_min, x_max, y_max = None, None, None, None
-    left, top, right, bottom = _edges(rect)
-    x_min, x_max = left, right
-    y_min, y_max = top, bottom
+    # p*u <= q for the four edges, unrolled as two slabs. In each slab one edge is
+    # where the segment enters (raises u0) and the other where it leaves (lowers u1).
+    u0, u1 = 0.0, 1.0
 
-    # p[i] * u <= q[i]
-    p = [-dx, dx, -dy, dy]
-    q = [x0 - x_min, x_max - x0, y0 - y_min, y_max - y0]
+    if dx == 0:
+        if x0 < left or x0 > right:  # parallel and outside
+            return None
+    else:
+        if dx > 0:
+            r_in, r_out = (x0 - left) / -dx, (right - x0) / dx
+        else:
+            r_in, r_out = (right - x0) / dx, (x0 - left) / -dx
+        if r_in > u0:
+            u0 = r_in
+        if r_out < u1:
+            u1 = r_out
+        if u0 > u1:
+            return None
 
-    u0, u1 = 0.0, 1.0
-    for pi, qi in zip(p, q, strict=False):
-        if pi == 0:
-            if qi < 0:
-                return None 
-            continue
-        r = qi / pi
-        if pi < 0:
-            if r > u1:
-                return None
-            if r > u0:
-                u0 = r
+    if dy == 0:
+        if y0 < top or y0 > bottom:
+            return None
+    else:
+        if dy > 0:
+            r_in, r_out = (y0 - top) / -dy, (bottom - y0) / dy
         else:
-            if r < u0:
-                return None
-            if r < u1:
-                u1 = r
-
-    nx0 = int(round(x0 + u0 * dx))
-    ny0 = int(round(y0 + u0 * dy))
-    nx1 = int(round(x0 + u1 * dx))
-    ny1 = int(round(y0 + u1 * dy))
+            r_in, r_out = (bottom - y0) / dy, (y0 - top) / -dy
+        if r_in > u0:
+            u0 = r_in
+        if r_out < u1:
+            u1 = r_out
+        if u0 > u1:
+            return None
+
+    nx0 = _floor(x0 + u0 * dx + 0.5)
+    ny0 = _floor(y0 + u0 * dy + 0.5)
+    nx1 = _floor(x0 + u1 * dx + 0.5)
+    ny1 = _floor(y0 + u1 * dy + 0.5)
     return Point(nx0, ny0), Point(nx1, ny1)
+
+
+def liang_barsky_batch(
+    x0: np.ndarray,
+    y0: np.ndarray,
+    x1: np.ndarray,
+    y1: np.ndarray,
+    rect: pygame.Rect | _Rect4,
+    edges: tuple[int, int, int, int] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Liang–Barsky over N segments at once (endpoint arrays of shape (N,)).
+    Returns (mask, nx0, ny0, nx1, ny1): mask marks the segments that survive and
+    the n* arrays hold their clipped endpoints (meaningless where mask is False).
+    Same arithmetic and rounding as `liang_barsky_clip`.
+    """
+    left, top, right, bottom = edges or _edges(rect)
+    x0 = np.asarray(x0, dtype=np.int64)
+    y0 = np.asarray(y0, dtype=np.int64)
+    dx = np.asarray(x1, dtype=np.int64) - x0
+    dy = np.asarray(y1, dtype=np.int64) - y0
+
+    # p[i] * u <= q[i], one row per edge
+    p = np.stack([-dx, dx, -dy, dy])
+    q = np.stack([x0 - left, right - x0, y0 - top, bottom - y0])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.where(p != 0, q / p, np.inf)
+
+    u0 = np.where(p < 0, r, 0.0).max(axis=0)
+    u1 = np.where(p > 0, r, 1.0).min(axis=0)
+    mask = ~((p == 0) & (q < 0)).any(axis=0) & (u0 <= u1)
+
+    nx0 = np.floor(x0 + u0 * dx + 0.5).astype(np.int32)
+    ny0 = np.floor(y0 + u0 * dy + 0.5).astype(np.int32)
+    nx1 = np.floor(x0 + u1 * dx + 0.5).astype(np.int32)
+    ny1 = np.floor(y0 + u1 * dy + 0.5).astype(np.int32)
+    return mask, nx0, ny0, nx1, ny1
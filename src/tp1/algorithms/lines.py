@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import pygame
 
-from ..render.raster import put_pixel
+from ..render.raster import draw_points_bulk
 from ..scene.models import Point
+from ._kernels import bresenham_line, dda_line
+
+# Pixel generators by line algorithm name: (x0, y0, x1, y1) -> (xs, ys)
+LINE_PIXELS = {"DDA": dda_line, "BRESENHAM": bresenham_line}
 
 
 def draw_line_dda(
@@ -12,20 +16,7 @@ def draw_line_dda(
     p1: Point,
     color: tuple[int, int, int],
 ) -> None:
-    x0, y0 = p0.x, p0.y
-    x1, y1 = p1.x, p1.y
-    dx, dy = x1 - x0, y1 - y0
-    steps = int(max(abs(dx), abs(dy)))
-    if steps == 0:
-        put_pixel(surf, x0, y0, color)
-        return
-    x_inc = dx / steps
-    y_inc = dy / steps
-    x, y = x0, y0
-    for _ in range(steps + 1):
-        put_pixel(surf, round(x), round(y), color)
-        x += x_inc
-        y += y_inc
+    draw_points_bulk(surf, *dda_line(p0.x, p0.y, p1.x, p1.y), color)
 
 
 def draw_line_bresenham(
@@ -34,21 +25,4 @@ def draw_line_bresenham(
     p1: Point,
     color: tuple[int, int, int],
 ) -> None:
-    x0, y0 = p0.x, p0.y
-    x1, y1 = p1.x, p1.y
-    dx = abs(x1 - x0)
-    dy = abs(y1 - y0)
-    sx = 1 if x0 < x1 else -1
-    sy = 1 if y0 < y1 else -1
-    err = dx - dy
-    while True:
-        put_pixel(surf, x0, y0, color)
-        if x0 == x1 and y0 == y1:
-            break
-        e2 = 2 * err
-        if e2 > -dy:
-            err -= dy
-            x0 += sx
-        if e2 < dx:
-            err += dx
-            y0 += sy
+    draw_points_bulk(surf, *bresenham_line(p0.x, p0.y, p1.x, p1.y), color)
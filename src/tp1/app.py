@@ -5,7 +5,8 @@ import sys
 import pygame
 
 from . import config as C
-from .events import EventDispatcher
+from .events import ALLOWED_EVENTS, EventDispatcher, coalesce_motion
+from .render.raster import mark_damage, take_damage
 from .render.renderer import clear_canvas, redraw_canvas_from_scene
 from .scene.ops import apply_clipping_to_lines
 from .scene.scene import Scene
@@ -19,12 +20,17 @@ from .tools import (
 from .ui.overlay import draw_overlay
 from .ui.sidebar import Sidebar
 
+_APPLY_KEYS = frozenset({pygame.K_RETURN, pygame.K_KP_ENTER})  # apply the clip preview
+_EXPOSE_EVENTS = frozenset({pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED})  # screen needs a repaint
+
 
 def _init_pygame() -> tuple[pygame.Surface, pygame.Surface, pygame.Surface, pygame.Surface]:
     pygame.init()
     pygame.display.set_caption("TP1 CG — Mode: IDLE")
 
     screen = pygame.display.set_mode((C.WIDTH, C.HEIGHT))
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(list(ALLOWED_EVENTS))
     ui = pygame.Surface((C.UI_W, C.HEIGHT))
     canvas = pygame.Surface((C.CANVAS_W, C.CANVAS_H))
     overlay = pygame.Surface((C.CANVAS_W, C.CANVAS_H), pygame.SRCALPHA)
@@ -79,6 +85,12 @@ def _wire_sidebar(
         state.status = "Preview: Liang–Barsky (Enter=apply, 0=off)"
         redraw_canvas_from_scene(canvas, scene, state)
 
+    def preview_clip_sk() -> None:
+        state.mode = Mode.CLIP_WINDOW
+        state.clip.preview_algo = "SK"
+        state.status = "Preview: Skala (Enter=apply, 0=off)"
+        redraw_canvas_from_scene(canvas, scene, state)
+
     # Buttons (order similar to original UI)
     sidebar.add_button("Select", lambda: set_mode(Mode.SELECT))
 
@@ -89,6 +101,7 @@ def _wire_sidebar(
     sidebar.add_button("Set Clip Window", lambda: set_mode(Mode.CLIP_WINDOW))
     sidebar.add_button("Preview: Cohen–Suth.", preview_clip_cs)
     sidebar.add_button("Preview: Liang–Barsky", preview_clip_lb)
+    sidebar.add_button("Preview: Skala", preview_clip_sk)
 
     sidebar.add_button("Clear Canvas", clear_all)
 
@@ -119,7 +132,10 @@ def main() -> None:
 
     running = True
     while running:
-        for ev in pygame.event.get():
+        events = coalesce_motion(pygame.event.get())
+        if events:
+            state.dirty.update(("ui", "canvas"))
+        for ev in events:
             if ev.type == pygame.QUIT:
                 running = False
             elif ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
@@ -144,13 +160,20 @@ def main() -> None:
                     state.status = "Preview: Liang–Barsky (Enter=apply, 0=off)"
                     redraw_canvas_from_scene(canvas, scene, state)
 
-                elif ev.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                elif ev.key == pygame.K_3:
+                    # Always enable persistent preview (Skala)
+                    state.mode = Mode.CLIP_WINDOW
+                    state.clip.preview_algo = "SK"
+                    state.status = "Preview: Skala (Enter=apply, 0=off)"
+                    redraw_canvas_from_scene(canvas, scene, state)
+
+                elif ev.key in _APPLY_KEYS:
                     # Apply current preview destructively
-                    if state.clip.window and state.clip.preview_algo:
-                        rect = pygame.Rect(*state.clip.window)
+                    rect = state.clip.rect
+                    if rect is not None and state.clip.preview_algo:
                         target = state.selection.selected_lines or None
                         kept, removed = apply_clipping_to_lines(
-                            scene, rect, state.clip.preview_algo, target
+                            scene, rect, state.clip.preview_algo, target, state.clip.edges
                         )
                         state.status = f"Applied preview ({state.clip.preview_algo}): kept {kept}, removed {removed}"
                         state.clip.preview_algo = None
@@ -163,19 +186,35 @@ def main() -> None:
                         state.status = "Preview off"
                         redraw_canvas_from_scene(canvas, scene, state)
 
+            elif ev.type in _EXPOSE_EVENTS:
+                # the screen lost its pixels, not the canvas: copy all of it over again
+                mark_damage(canvas, canvas.get_rect())
             else:
                 dispatcher.handle(ev)
 
-        sidebar.draw(ui, font, font_small, state)
-        draw_overlay(overlay, scene, state)
-
-        screen.fill(C.BG)
-        screen.blit(ui, (0, 0))
-        screen.blit(canvas, (C.UI_W, 0))
-        screen.blit(overlay, (C.UI_W, 0))
-
-        pygame.display.set_caption(f"TP1 CG — Mode: {state.mode.name}")
-        pygame.display.flip()
+        # tools defer their canvas redraws to here, so a frame redraws at most once
+        dispatcher.tick()
+
+        # ui and canvas together cover the whole screen, so only dirty ones are redrawn
+        rects: list[pygame.Rect] = []
+        if "ui" in state.dirty:
+            sidebar.draw(ui, font, font_small, state)
+            rects.append(screen.blit(ui, (0, 0)))
+            pygame.display.set_caption(f"TP1 CG — Mode: {state.mode.name}")
+        if "canvas" in state.dirty:
+            # only the part where the canvas or the overlay changed goes to the screen
+            area = draw_overlay(overlay, scene, state)
+            damage = take_damage(canvas)
+            if damage is not None:
+                area = damage if area is None else area.union(damage)
+            if area is not None:
+                area = area.clip(canvas.get_rect())
+                screen.blit(canvas, (C.UI_W + area.x, area.y), area)
+                rects.append(screen.blit(overlay, (C.UI_W + area.x, area.y), area))
+        state.dirty.clear()
+
+        if rects:
+            pygame.display.update(rects)
         clock.tick(C.FPS)
 
     pygame.quit()
@@ -12,6 +12,13 @@ CANVAS_H: int = HEIGHT
 
 FPS: int = 60
 
+# True: render Bresenham lines and circles with pygame.draw (C loops) instead of the
+# hand-written rasterizers. DDA lines always go through the DDA kernel.
+FAST_DRAW: bool = False
+# Same, but only for the redraws during a live drag (move/scale/rotate, clip window move/
+# resize); the redraw when the drag ends uses the hand-written rasterizers again.
+FAST_DRAW_LIVE: bool = True
+
 # --- Colors (RGB / RGBA tuples) ---
 Color: TypeAlias = tuple[int, int, int]
 ColorA: TypeAlias = tuple[int, int, int, int]
@@ -74,6 +81,10 @@ CLIP_BORDER_WIDTH: int = 2
 CLIP_DASH_LEN: int = 6
 CLIP_DASH_GAP: int = 4
 
+# Clipping N >= CLIP_BATCH_MIN lines with Cohen–Sutherland or Liang–Barsky uses the
+# vectorized path
+CLIP_BATCH_MIN: int = 8
+
 # Clip window constraints
 CLIP_MIN_W: int = 8
 CLIP_MIN_H: int = 8
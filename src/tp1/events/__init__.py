@@ -1,5 +1,5 @@
 from __future__ import annotations
 
-from .dispatcher import EventDispatcher
+from .dispatcher import ALLOWED_EVENTS, EventDispatcher, coalesce_motion
 
-__all__ = ["EventDispatcher"]
+__all__ = ["EventDispatcher", "ALLOWED_EVENTS", "coalesce_motion"]
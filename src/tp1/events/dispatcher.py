@@ -11,6 +11,32 @@ from ..scene.scene import Scene
 from ..state import AppState, Mode
 from ..ui.sidebar import Sidebar
 
+# Event types the app reacts to; everything else is blocked at the queue. The expose
+# events stay so the screen gets repainted after the window is uncovered.
+ALLOWED_EVENTS: tuple[int, ...] = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+)
+
+
+def coalesce_motion(events: list[pygame.event.Event]) -> list[pygame.event.Event]:
+    """
+    Collapse each run of consecutive MOUSEMOTION events to its last one. Order relative
+    to button/key events is kept, so drags still start and end where they should.
+    """
+    out: list[pygame.event.Event] = []
+    for ev in events:
+        if ev.type == pygame.MOUSEMOTION and out and out[-1].type == pygame.MOUSEMOTION:
+            out[-1] = ev
+        else:
+            out.append(ev)
+    return out
+
 
 class Tool(Protocol):
     """
@@ -20,6 +46,7 @@ class Tool(Protocol):
 
     def enter(self, state: AppState, scene: Scene) -> None: ...
     def exit(self, state: AppState, scene: Scene) -> None: ...
+    def tick(self, state: AppState, scene: Scene, canvas: pygame.Surface) -> None: ...
 
     def handle_canvas_event(
         self,
@@ -88,6 +115,7 @@ class EventDispatcher:
         self._maybe_switch_tool()
 
         if hasattr(ev, "pos"):
+            self.state.mouse_pos = ev.pos
             x, _y = ev.pos
             if x < C.UI_W:
                 # Sidebar UI
@@ -100,3 +128,11 @@ class EventDispatcher:
             return
         cpos = self.to_canvas_pos(ev)
         tool.handle_canvas_event(ev, cpos, state=self.state, scene=self.scene, canvas=self.canvas)
+
+    def tick(self) -> None:
+        """
+        Per-frame hook after all events were handled. Every registered tool is ticked (not
+        just the active one) so a redraw deferred right before a mode switch still lands.
+        """
+        for tool in self._tools.values():
+            tool.tick(self.state, self.scene, self.canvas)
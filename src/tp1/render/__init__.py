@@ -1,6 +1,29 @@
 from __future__ import annotations
 
-from .raster import put_pixel
-from .renderer import clear_canvas, redraw_canvas_from_scene
+from .raster import draw_points_bulk, mark_damage, put_pixel, take_damage
 
-__all__ = ["put_pixel", "redraw_canvas_from_scene", "clear_canvas"]
+__all__ = [
+    "put_pixel",
+    "draw_points_bulk",
+    "mark_damage",
+    "take_damage",
+    "redraw_canvas_from_scene",
+    "redraw_canvas_region",
+    "draw_scene_subset",
+    "clear_canvas",
+]
+
+
+def __getattr__(name: str) -> object:
+    # renderer imports the algorithms, and those import .raster from this package,
+    # so renderer is loaded on first use instead of here to keep the imports acyclic
+    if name in (
+        "redraw_canvas_from_scene",
+        "redraw_canvas_region",
+        "draw_scene_subset",
+        "clear_canvas",
+    ):
+        from . import renderer
+
+        return getattr(renderer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,55 @@
 from __future__ import annotations
 
+import weakref
+
+import numpy as np
 import pygame
 
+from ..scene.models import Rect4
+
+# Area of each surface drawn on since the last take_damage(surf); lets the main loop
+# copy only the changed part of the canvas to the screen
+_damage: weakref.WeakKeyDictionary[pygame.Surface, pygame.Rect] = weakref.WeakKeyDictionary()
+
+
+def mark_damage(surf: pygame.Surface, rect: pygame.Rect | Rect4 | None = None) -> None:
+    """Record that `rect` of `surf` (default: its clip rect) may have changed."""
+    rect = surf.get_clip() if rect is None else pygame.Rect(rect)
+    prev = _damage.get(surf)
+    _damage[surf] = rect if prev is None else prev.union(rect)
+
 
-def put_pixel(surf: pygame.Surface, x: int, y: int, color: tuple[int, int, int]) -> None:
+def take_damage(surf: pygame.Surface) -> pygame.Rect | None:
+    """Area of `surf` changed since the last call (None if nothing), and reset it."""
+    return _damage.pop(surf, None)
+
+
+def put_pixel(surf: pygame.Surface, x: int, y: int, color: int | tuple[int, int, int]) -> None:
+    """`color` may be an RGB tuple or already packed with `surf.map_rgb`."""
     if 0 <= x < surf.get_width() and 0 <= y < surf.get_height():
         surf.set_at((x, y), color)
+        mark_damage(surf, (x, y, 1, 1))
+
+
+def draw_points_bulk(
+    surf: pygame.Surface,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    color: int | tuple[int, int, int],
+    inside: bool = False,
+) -> None:
+    """
+    Write many pixels with one locked store instead of one set_at per pixel.
+    Points outside the surface's clip rect are dropped; pass `inside=True` when every
+    point is known to be inside it to skip the bounds mask.
+    """
+    if not inside:
+        left, top, w, h = surf.get_clip()
+        mask = (left <= xs) & (xs < left + w) & (top <= ys) & (ys < top + h)
+        xs, ys = xs[mask], ys[mask]
+    # map_rgb is signed on SRCALPHA surfaces; pixels2d stores unsigned 32-bit
+    packed = (color if isinstance(color, int) else surf.map_rgb(color)) & 0xFFFFFFFF
+    arr = pygame.surfarray.pixels2d(surf)
+    arr[xs, ys] = packed
+    del arr  # releases the surface lock
+    mark_damage(surf)
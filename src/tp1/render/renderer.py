@@ -1,50 +1,199 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
+import numpy as np
 import pygame
 
 from .. import config as C
-from ..scene.scene import Scene
+from ..algorithms._kernels import bresenham_lines
+from ..algorithms.circles import circle_offsets
+from ..algorithms.clipping import BATCH_CLIPPERS, CLIPPERS
+from ..algorithms.lines import LINE_PIXELS
+from ..scene.models import Point
+from ..scene.scene import LINE_ALGOS, Scene
 from ..state import AppState
+from .raster import draw_points_bulk, mark_damage
+
+# Rasterized pixels per line, keyed by geometry. A redraw only runs the rasterizers for
+# lines that changed since the previous one (circle offsets are memoized per radius by
+# circle_offsets); everything else is reused and the whole scene goes to the canvas in
+# a single batched store.
+_line_pixels: dict[tuple[int, int, int, int, int], tuple[np.ndarray, np.ndarray]] = {}
 
 
 def clear_canvas(canvas: pygame.Surface) -> None:
     canvas.fill(C.CANVAS_BG)
+    mark_damage(canvas)
+
+
+def redraw_canvas_region(
+    canvas: pygame.Surface,
+    scene: Scene,
+    rect: pygame.Rect,
+    state: AppState | None = None,
+    fast: bool | None = None,
+) -> None:
+    """
+    Redraw only `rect`: the canvas is clipped to it, so pixels elsewhere are left alone and
+    primitives that do not reach it are skipped. Inside `rect` the result is the same as
+    redraw_canvas_from_scene.
+    """
+    prev = canvas.get_clip()
+    canvas.set_clip(rect)
+    try:
+        redraw_canvas_from_scene(canvas, scene, state, fast)
+    finally:
+        canvas.set_clip(prev)
 
 
 def redraw_canvas_from_scene(
     canvas: pygame.Surface, 
     scene: Scene,
-    state: AppState | None = None
+    state: AppState | None = None,
+    fast: bool | None = None,  # None -> C.FAST_DRAW
     ) -> None:
-    
-    from ..algorithms.circles import draw_circle_bresenham
-    from ..algorithms.clipping import cohen_sutherland_clip, liang_barsky_clip
-    from ..algorithms.lines import draw_line_bresenham, draw_line_dda
-
-
-    canvas.fill(C.CANVAS_BG)
+    fast = C.FAST_DRAW if fast is None else fast
+    canvas.fill(C.CANVAS_BG)  # fill and pygame.draw honour the clip rect, as does the bulk store
+    mark_damage(canvas)
+    ink = canvas.map_rgb(C.BLACK)  # packed once for every primitive
 
     clip_rect = None
     clip_algo = None
+    clip_edges = None
     if state and state.clip.window and state.clip.preview_algo:
-        l, t, w, h = state.clip.window
-        clip_rect = pygame.Rect(l, t, w, h)
+        clip_rect = state.clip.rect
         clip_algo = state.clip.preview_algo
+        clip_edges = state.clip.edges
 
-    for ln in scene.lines:
-        p0, p1 = ln.p0, ln.p1
+    if clip_rect and clip_algo in BATCH_CLIPPERS and scene.n_lines >= C.CLIP_BATCH_MIN:
+        # Many lines under a CS/LB preview: clip them all in one vectorized pass
+        xy = scene.line_xy
+        ok, nx0, ny0, nx1, ny1 = BATCH_CLIPPERS[clip_algo](
+            xy[:, 0], xy[:, 1], xy[:, 2], xy[:, 3], clip_rect, clip_edges
+        )
+        rows = np.stack((nx0, ny0, nx1, ny1), axis=1)[ok].tolist()
+        algos = scene.line_algo[ok].tolist()
+    else:
+        rows = scene.line_xy.tolist()
+        algos = scene.line_algo.tolist()
         if clip_rect and clip_algo:
-            if clip_algo == "CS":
-                res = cohen_sutherland_clip(p0, p1, clip_rect)
-            else:
-                res = liang_barsky_clip(p0, p1, clip_rect)
-            if res is None:
+            # Clip up front so the drawing loop below has no per-line clip branch.
+            # Lines whose bbox is inside the window (or wholly on one side of it) are
+            # settled without running the clipper.
+            clip = CLIPPERS[clip_algo]
+            assert clip_edges is not None  # set_window keeps it with the rect
+            left, top, right, bottom = clip_edges
+            clipped_rows, clipped_algos = [], []
+            for row, algo in zip(rows, algos, strict=True):
+                x0, y0, x1, y1 = row
+                lo_x, hi_x = (x0, x1) if x0 <= x1 else (x1, x0)
+                lo_y, hi_y = (y0, y1) if y0 <= y1 else (y1, y0)
+                if hi_x < left or lo_x > right or hi_y < top or lo_y > bottom:
+                    continue
+                if lo_x >= left and hi_x <= right and lo_y >= top and hi_y <= bottom:
+                    clipped_rows.append(row)
+                    clipped_algos.append(algo)
+                    continue
+                res = clip(Point(x0, y0), Point(x1, y1), clip_rect, clip_edges)
+                if res is not None:
+                    p0, p1 = res
+                    clipped_rows.append((p0.x, p0.y, p1.x, p1.y))
+                    clipped_algos.append(algo)
+            rows, algos = clipped_rows, clipped_algos
+
+    _draw_primitives(canvas, rows, algos, scene.circle_xyr.tolist(), ink, fast, whole=True)
+
+
+def draw_scene_subset(
+    canvas: pygame.Surface,
+    scene: Scene,
+    lines: Iterable[int],
+    circles: Iterable[int],
+    fast: bool | None = None,
+    color: tuple[int, int, int] = C.BLACK,
+) -> None:
+    """
+    Draw only the given lines and circles, over whatever the canvas already shows (no
+    clear, no clip preview), in one batch. Honours the canvas clip rect like
+    redraw_canvas_from_scene.
+    """
+    fast = C.FAST_DRAW if fast is None else fast
+    mark_damage(canvas)  # pygame.draw on the fast path bypasses the bulk store
+    ids = [i for i in lines if 0 <= i < scene.n_lines]
+    cids = [i for i in circles if 0 <= i < scene.n_circles]
+    rows = scene.line_xy[ids].tolist()
+    algos = scene.line_algo[ids].tolist()
+    circle_rows = scene.circle_xyr[cids].tolist()
+    _draw_primitives(canvas, rows, algos, circle_rows, canvas.map_rgb(color), fast, whole=False)
+
+
+def _draw_primitives(
+    canvas: pygame.Surface,
+    rows: list[list[int]],
+    algos: list[int],
+    circle_rows: list[list[int]],
+    ink: int,
+    fast: bool,
+    whole: bool,
+) -> None:
+    # `whole`: these are all the lines of the scene, so the pixel cache can be trimmed
+    # Pixels of primitives fully inside the drawn area (the canvas, or its clip rect)
+    # skip the bounds mask when stored
+    area = canvas.get_clip()
+    L, T, R, B = area.left, area.top, area.right, area.bottom
+    inner: list[tuple[np.ndarray, np.ndarray]] = []
+    border: list[tuple[np.ndarray, np.ndarray]] = []
+    line_pixels = {}
+    misses: list[tuple[int, int, int, int, int]] = []
+    misses_inside = True
+    for (x0, y0, x1, y1), algo in zip(rows, algos, strict=True):
+        lo_x, hi_x = (x0, x1) if x0 <= x1 else (x1, x0)
+        lo_y, hi_y = (y0, y1) if y0 <= y1 else (y1, y0)
+        if hi_x < L or lo_x >= R or hi_y < T or lo_y >= B:
+            continue  # every pixel of the line is inside its bbox, so none would land
+        inside = lo_x >= L and hi_x < R and lo_y >= T and hi_y < B
+        if fast and LINE_ALGOS[algo] == "BRESENHAM":
+            pygame.draw.line(canvas, ink, (x0, y0), (x1, y1), 1)
+            continue
+        key = (x0, y0, x1, y1, algo)
+        pts = _line_pixels.get(key)
+        if pts is None:
+            if LINE_ALGOS[algo] == "BRESENHAM":
+                misses.append(key)
+                misses_inside = misses_inside and inside
                 continue
-            p0, p1 = res
-        if ln.algo == "DDA":
-            draw_line_dda(canvas, p0, p1, C.BLACK)
-        else:
-            draw_line_bresenham(canvas, p0, p1, C.BLACK)
-
-    for c in scene.circles:
-        draw_circle_bresenham(canvas, c.c, c.r, C.BLACK)
\ No newline at end of file
+            pts = LINE_PIXELS[LINE_ALGOS[algo]](x0, y0, x1, y1)
+        line_pixels[key] = pts
+        (inner if inside else border).append(pts)
+
+    # New Bresenham lines are rasterized together in one batched kernel call
+    if misses:
+        ends = np.array(misses, dtype=np.int64)
+        xs, ys, counts = bresenham_lines(ends[:, 0], ends[:, 1], ends[:, 2], ends[:, 3])
+        splits = np.cumsum(counts)[:-1]
+        for key, px, py in zip(misses, np.split(xs, splits), np.split(ys, splits), strict=True):
+            line_pixels[key] = (px, py)
+        (inner if misses_inside else border).append((xs, ys))
+
+    for cx, cy, r in circle_rows:
+        if cx + r < L or cx - r >= R or cy + r < T or cy - r >= B:
+            continue
+        if fast and r > 0:
+            pygame.draw.circle(canvas, ink, (cx, cy), r, 1)
+            continue
+        offs = circle_offsets(r)
+        inside = cx - r >= L and cx + r < R and cy - r >= T and cy + r < B
+        (inner if inside else border).append((cx + offs[0], cy + offs[1]))
+
+    # keep only what is on screen now, so the cache tracks the scene's size; a partial
+    # redraw only saw some of the lines, so it adds to the cache instead
+    if whole and area == canvas.get_rect():
+        _line_pixels.clear()
+    _line_pixels.update(line_pixels)
+
+    for parts, inside in ((inner, True), (border, False)):
+        if parts:
+            xs = np.concatenate([p[0] for p in parts])
+            ys = np.concatenate([p[1] for p in parts])
+            draw_points_bulk(canvas, xs, ys, ink, inside)
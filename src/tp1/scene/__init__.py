@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from .models import Circle, CircleAlgo, Line, LineAlgo, Point, Rect4
-from .ops import apply_clipping_to_lines
+from .ops import apply_clipping_to_lines, select_in_rect, selection_bounds
 from .scene import Scene
 
 __all__ = [
@@ -12,5 +12,7 @@ __all__ = [
     "CircleAlgo",
     "Rect4",
     "Scene",
-    "apply_clipping_to_lines"
+    "apply_clipping_to_lines",
+    "select_in_rect",
+    "selection_bounds",
 ]
@@ -8,7 +8,7 @@ CircleAlgo: TypeAlias = Literal["BRESENHAM"]
 Rect4: TypeAlias = tuple[int, int, int, int]  # (left, top, width, height)
 
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     x: int
     y: int
@@ -21,7 +21,7 @@ class Point:
         self.y += dy
 
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     p0: Point
     p1: Point
@@ -39,7 +39,7 @@ class Line:
         self.p1.move_ip(dx, dy)
 
 
-@dataclass
+@dataclass(slots=True)
 class Circle:
     c: Point
     r: int
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+from collections.abc import Iterable
+
+import numpy as np
 import pygame
 
+from .. import config as C
+from ..algorithms.clipping import BATCH_CLIPPERS, CLIPPERS, outcodes
+from .models import Point
 from .scene import Scene
-from .models import Line, Point
-from ..algorithms.clipping import cohen_sutherland_clip, liang_barsky_clip
 
 
 def apply_clipping_to_lines(
     scene: Scene,
     rect: pygame.Rect,
-    algo: str,                              # "CS" | "LB"
+    algo: str,                              # "CS" | "LB" | "SK"
     selected: set[int] | None = None,       # None -> all lines
+    edges: tuple[int, int, int, int] | None = None,  # cached (left, top, right, bottom) of rect
 ) -> tuple[int, int]:
     """
     Destructively clip lines in the scene to `rect` using `algo`.
@@ -21,30 +24,92 @@ def apply_clipping_to_lines(
 
     Returns: (kept, removed) counts over the affected set.
     """
-    affected: set[int] | None = None if not selected else set(selected)
-    kept = 0
-    removed = 0
-    new_lines: list[Line] = []
-
-    for i, ln in enumerate(scene.lines):
-        # If selection is active and this line isn't selected, keep as-is
-        if affected is not None and i not in affected:
-            new_lines.append(ln)
-            continue
-
-        # Clip the line
-        if algo == "CS":
-            res = cohen_sutherland_clip(ln.p0, ln.p1, rect)
-        else:
-            res = liang_barsky_clip(ln.p0, ln.p1, rect)
-
-        if res is None:
-            removed += 1
-            # drop the line
-        else:
-            p0, p1 = res
-            new_lines.append(Line(Point(p0.x, p0.y), Point(p1.x, p1.y), ln.algo))
-            kept += 1
-
-    scene.lines = new_lines
-    return kept, removed
+    if edges is None:
+        left, top, w, h = rect
+        edges = (left, top, left + w, top + h)
+    n = scene.n_lines
+    if not selected:
+        idx = np.arange(n)
+    else:
+        # a bool mask over the lines gives the affected rows in order without sorting
+        mask = np.zeros(n, dtype=bool)
+        mask[[i for i in selected if 0 <= i < n]] = True
+        idx = np.flatnonzero(mask)
+    new_xy = scene.line_xy.copy()
+    xy = new_xy[idx]
+
+    # Trivial accept/reject from the endpoint outcodes: a line fully inside keeps its
+    # endpoints, one whose endpoints share an outside region is dropped. Only the
+    # remaining lines go through the actual clipper.
+    code0 = outcodes(xy[:, 0], xy[:, 1], rect, edges)
+    code1 = outcodes(xy[:, 2], xy[:, 3], rect, edges)
+    inside = (code0 | code1) == 0
+    outside = (code0 & code1) != 0
+    todo = np.nonzero(~inside & ~outside)[0]
+
+    ok = inside.copy()
+    if algo in BATCH_CLIPPERS and len(todo) >= C.CLIP_BATCH_MIN:
+        sub = xy[todo]
+        res_ok, nx0, ny0, nx1, ny1 = BATCH_CLIPPERS[algo](
+            sub[:, 0], sub[:, 1], sub[:, 2], sub[:, 3], rect, edges
+        )
+        ok[todo] = res_ok
+        xy[todo] = np.stack((nx0, ny0, nx1, ny1), axis=1)
+    else:
+        clip = CLIPPERS[algo]
+        for k, (x0, y0, x1, y1) in zip(todo.tolist(), xy[todo].tolist(), strict=True):
+            res = clip(Point(x0, y0), Point(x1, y1), rect, edges)
+            if res is not None:
+                p0, p1 = res
+                xy[k] = (p0.x, p0.y, p1.x, p1.y)
+                ok[k] = True
+
+    # Lines outside the affected set pass through unchanged
+    keep = np.ones(n, dtype=bool)
+    keep[idx] = ok
+    new_xy[idx] = xy
+    scene.set_lines(np.compress(keep, new_xy, axis=0), np.compress(keep, scene.line_algo))
+
+    kept = int(ok.sum())
+    return kept, len(idx) - kept
+
+
+def select_in_rect(scene: Scene, edges: tuple[int, int, int, int]) -> tuple[set[int], set[int]]:
+    """
+    Indices of the lines with an endpoint inside `edges` (left, top, right, bottom),
+    inclusive, and of the circles whose center is inside. Each kind is tested in one
+    vectorized pass over `scene.line_xy` / `scene.circle_xyr`.
+    """
+    left, top, right, bottom = edges
+    xy = scene.line_xy
+    x_in = (left <= xy[:, 0::2]) & (xy[:, 0::2] <= right)  # (N, 2): x0, x1
+    y_in = (top <= xy[:, 1::2]) & (xy[:, 1::2] <= bottom)
+    lines = set(np.flatnonzero((x_in & y_in).any(axis=1)).tolist())
+    cxy = scene.circle_xyr
+    c_in = (
+        (left <= cxy[:, 0]) & (cxy[:, 0] <= right) & (top <= cxy[:, 1]) & (cxy[:, 1] <= bottom)
+    )
+    circles = set(np.flatnonzero(c_in).tolist())
+    return lines, circles
+
+
+def _valid_ids(indices: Iterable[int], n: int) -> np.ndarray:
+    ids = np.fromiter(indices, dtype=np.intp)
+    return ids[(ids >= 0) & (ids < n)]
+
+
+def selection_bounds(
+    scene: Scene, lines: Iterable[int], circles: Iterable[int]
+) -> tuple[int, int, int, int] | None:
+    """
+    (left, top, right, bottom) around the given lines' endpoints and circles' extents,
+    or None if no index is valid. Out-of-range indices are ignored.
+    """
+    xy = scene.line_xy[_valid_ids(lines, scene.n_lines)]
+    cxyr = scene.circle_xyr[_valid_ids(circles, scene.n_circles)]
+    if not len(xy) and not len(cxyr):
+        return None
+    cx, cy, r = cxyr[:, 0], cxyr[:, 1], cxyr[:, 2]
+    xs = np.concatenate((xy[:, 0::2].ravel(), cx - r, cx + r))
+    ys = np.concatenate((xy[:, 1::2].ravel(), cy - r, cy + r))
+    return int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max())
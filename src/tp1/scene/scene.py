@@ -1,32 +1,305 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from typing import overload
 
-from .models import Circle, Line
+import numpy as np
+
+from .models import Circle, CircleAlgo, Line, LineAlgo, Rect4
+
+# Line algorithms by their code in Scene.line_algo
+LINE_ALGOS: tuple[LineAlgo, ...] = ("DDA", "BRESENHAM")
+_LINE_ALGO_CODE = {name: code for code, name in enumerate(LINE_ALGOS)}
+
+_INITIAL_CAPACITY = 16
+
+
+class PointRef:
+    """Endpoint of a stored line; reads and writes go straight to the scene arrays."""
+
+    __slots__ = ("_scene", "_i", "_c")
+
+    _ARRAY = "_line_xy"  # Scene attribute holding the rows
+
+    def __init__(self, scene: Scene, i: int, c: int) -> None:
+        self._scene = scene
+        self._i = i
+        self._c = c  # column of x in the row (0 for p0, 2 for p1)
+
+    def _rows(self) -> np.ndarray:
+        # looked up on every access: the scene swaps the array when it grows
+        return getattr(self._scene, self._ARRAY)
+
+    @property
+    def x(self) -> int:
+        return int(self._rows()[self._i, self._c])
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self._rows()[self._i, self._c] = value
+        self._scene.version += 1
+
+    @property
+    def y(self) -> int:
+        return int(self._rows()[self._i, self._c + 1])
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self._rows()[self._i, self._c + 1] = value
+        self._scene.version += 1
+
+    def as_tuple(self) -> tuple[int, int]:
+        x, y = self._rows()[self._i, self._c : self._c + 2].tolist()
+        return x, y
+
+    def move_ip(self, dx: int, dy: int) -> None:
+        self._rows()[self._i, self._c : self._c + 2] += (dx, dy)
+        self._scene.version += 1
+
+    def __repr__(self) -> str:
+        x, y = self.as_tuple()
+        return f"PointRef(x={x}, y={y})"
+
+
+class LineRef:
+    """Line `i` of a Scene, exposing the same interface as `Line`."""
+
+    __slots__ = ("_scene", "_i")
+
+    def __init__(self, scene: Scene, i: int) -> None:
+        self._scene = scene
+        self._i = i
+
+    @property
+    def p0(self) -> PointRef:
+        return PointRef(self._scene, self._i, 0)
+
+    @property
+    def p1(self) -> PointRef:
+        return PointRef(self._scene, self._i, 2)
+
+    @property
+    def algo(self) -> LineAlgo:
+        return LINE_ALGOS[self._scene._line_algo[self._i]]
+
+    @algo.setter
+    def algo(self, value: LineAlgo) -> None:
+        self._scene._line_algo[self._i] = _LINE_ALGO_CODE[value]
+        self._scene.version += 1
+
+    def bbox(self) -> Rect4:
+        x0, y0, x1, y1 = self._scene._line_xy[self._i].tolist()
+        return min(x0, x1), min(y0, y1), abs(x1 - x0), abs(y1 - y0)
+
+    def move_ip(self, dx: int, dy: int) -> None:
+        self._scene._line_xy[self._i] += (dx, dy, dx, dy)
+        self._scene.version += 1
+
+    def __repr__(self) -> str:
+        x0, y0, x1, y1 = self._scene._line_xy[self._i].tolist()
+        return f"LineRef(({x0}, {y0}) -> ({x1}, {y1}), {self.algo!r})"
+
+
+class CenterRef(PointRef):
+    """Center of a stored circle (columns 0, 1 of circle_xyr)."""
+
+    __slots__ = ()
+
+    _ARRAY = "_circle_xyr"
+
+
+class CircleRef:
+    """Circle `i` of a Scene, exposing the same interface as `Circle`."""
+
+    __slots__ = ("_scene", "_i")
+
+    algo: CircleAlgo = "BRESENHAM"
+
+    def __init__(self, scene: Scene, i: int) -> None:
+        self._scene = scene
+        self._i = i
+
+    @property
+    def c(self) -> CenterRef:
+        return CenterRef(self._scene, self._i, 0)
+
+    @property
+    def r(self) -> int:
+        return int(self._scene._circle_xyr[self._i, 2])
+
+    @r.setter
+    def r(self, value: int) -> None:
+        self._scene._circle_xyr[self._i, 2] = max(0, value)
+        self._scene.version += 1
+
+    def bbox(self) -> Rect4:
+        cx, cy, r = self._scene._circle_xyr[self._i].tolist()
+        return cx - r, cy - r, 2 * r, 2 * r
+
+    def move_ip(self, dx: int, dy: int) -> None:
+        self._scene._circle_xyr[self._i, :2] += (dx, dy)
+        self._scene.version += 1
+
+    def __repr__(self) -> str:
+        cx, cy, r = self._scene._circle_xyr[self._i].tolist()
+        return f"CircleRef(({cx}, {cy}), r={r})"
+
+
+class LineSeq(Sequence[LineRef]):
+    """Read-only list-like view over the lines of a Scene (yields LineRef)."""
+
+    __slots__ = ("_scene",)
+
+    def __init__(self, scene: Scene) -> None:
+        self._scene = scene
+
+    def __len__(self) -> int:
+        return self._scene.n_lines
+
+    @overload
+    def __getitem__(self, i: int) -> LineRef: ...
+    @overload
+    def __getitem__(self, i: slice) -> list[LineRef]: ...
+
+    def __getitem__(self, i: int | slice) -> LineRef | list[LineRef]:
+        n = self._scene.n_lines
+        if isinstance(i, slice):
+            return [LineRef(self._scene, k) for k in range(*i.indices(n))]
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("line index out of range")
+        return LineRef(self._scene, i)
+
+
+class CircleSeq(Sequence[CircleRef]):
+    """Read-only list-like view over the circles of a Scene (yields CircleRef)."""
+
+    __slots__ = ("_scene",)
+
+    def __init__(self, scene: Scene) -> None:
+        self._scene = scene
+
+    def __len__(self) -> int:
+        return self._scene.n_circles
+
+    @overload
+    def __getitem__(self, i: int) -> CircleRef: ...
+    @overload
+    def __getitem__(self, i: slice) -> list[CircleRef]: ...
+
+    def __getitem__(self, i: int | slice) -> CircleRef | list[CircleRef]:
+        n = self._scene.n_circles
+        if isinstance(i, slice):
+            return [CircleRef(self._scene, k) for k in range(*i.indices(n))]
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("circle index out of range")
+        return CircleRef(self._scene, i)
 
 
 @dataclass
 class Scene:
-    lines: list[Line] = field(default_factory=list)
-    circles: list[Circle] = field(default_factory=list)
+    """
+    Lines are stored as a Structure-of-Arrays: `line_xy` rows are (x0, y0, x1, y1) and
+    `line_algo` holds the index into LINE_ALGOS. `lines` gives Line-like views over them.
+    Circles likewise: `circle_xyr` rows are (cx, cy, r) and `circles` gives the views.
+
+    `version` goes up on every change made through the Scene; code that edits `line_xy`
+    rows or circles in place calls `touch()`. Caches of derived data compare it.
+    """
+
+    n_lines: int = field(default=0, init=False)
+    n_circles: int = field(default=0, init=False)
+    version: int = field(default=0, init=False)
+    _line_xy: np.ndarray = field(
+        default_factory=lambda: np.zeros((_INITIAL_CAPACITY, 4), dtype=np.int32),
+        init=False,
+        repr=False,
+    )
+    _line_algo: np.ndarray = field(
+        default_factory=lambda: np.zeros(_INITIAL_CAPACITY, dtype=np.uint8),
+        init=False,
+        repr=False,
+    )
+    _circle_xyr: np.ndarray = field(
+        default_factory=lambda: np.zeros((_INITIAL_CAPACITY, 3), dtype=np.int32),
+        init=False,
+        repr=False,
+    )
+
+    @property
+    def lines(self) -> LineSeq:
+        return LineSeq(self)
+
+    @property
+    def line_xy(self) -> np.ndarray:
+        """(n_lines, 4) int32 view; writes go to the scene."""
+        return self._line_xy[: self.n_lines]
+
+    @property
+    def line_algo(self) -> np.ndarray:
+        return self._line_algo[: self.n_lines]
+
+    @property
+    def circles(self) -> CircleSeq:
+        return CircleSeq(self)
+
+    @property
+    def circle_xyr(self) -> np.ndarray:
+        """(n_circles, 3) int32 view; writes go to the scene."""
+        return self._circle_xyr[: self.n_circles]
+
+    def touch(self) -> None:
+        """Mark the scene changed after editing geometry in place."""
+        self.version += 1
 
     def clear(self) -> None:
-        self.lines.clear()
-        self.circles.clear()
+        self.n_lines = 0
+        self.n_circles = 0
+        self.version += 1
 
     # Convenience adders return the index of the inserted item (useful for selection)
     def add_line(self, line: Line) -> int:
-        self.lines.append(line)
-        return len(self.lines) - 1
+        i = self.n_lines
+        if i == len(self._line_xy):
+            self._line_xy = np.resize(self._line_xy, (2 * i, 4))
+            self._line_algo = np.resize(self._line_algo, 2 * i)
+        self._line_xy[i] = (line.p0.x, line.p0.y, line.p1.x, line.p1.y)
+        self._line_algo[i] = _LINE_ALGO_CODE[line.algo]
+        self.n_lines = i + 1
+        self.version += 1
+        return i
+
+    def set_lines(self, xy: np.ndarray, algo: np.ndarray) -> None:
+        """Replace all lines with the rows of `xy` (N, 4) and their `algo` codes."""
+        n = len(xy)
+        cap = len(self._line_xy)
+        if n > cap:
+            while cap < n:
+                cap *= 2
+            self._line_xy = np.zeros((cap, 4), dtype=np.int32)
+            self._line_algo = np.zeros(cap, dtype=np.uint8)
+        # written into the existing buffers when they are big enough (clipping only shrinks)
+        self._line_xy[:n] = xy
+        self._line_algo[:n] = algo
+        self.n_lines = n
+        self.version += 1
 
     def add_circle(self, circle: Circle) -> int:
-        self.circles.append(circle)
-        return len(self.circles) - 1
+        i = self.n_circles
+        if i == len(self._circle_xyr):
+            self._circle_xyr = np.resize(self._circle_xyr, (2 * i, 3))
+        self._circle_xyr[i] = (circle.c.x, circle.c.y, circle.r)
+        self.n_circles = i + 1
+        self.version += 1
+        return i
 
     def is_empty(self) -> bool:
-        return not self.lines and not self.circles
+        return not self.n_lines and not self.n_circles
 
     def __len__(self) -> int:
         """Total number of primitives."""
-        return len(self.lines) + len(self.circles)
-    
\ No newline at end of file
+        return self.n_lines + self.n_circles
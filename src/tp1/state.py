@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TypeAlias
 
+import numpy as np
+import pygame
+
 Point2: TypeAlias = tuple[int, int]
 Rect4: TypeAlias = tuple[int, int, int, int]  # (left, top, width, height)
 
@@ -21,7 +25,7 @@ class Mode(Enum):
     CLIP_WINDOW = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectionState:
     selecting: bool = False
     anchor: Point2 | None = None
@@ -29,58 +33,116 @@ class SelectionState:
     selected_lines: set[int] = field(default_factory=set)
     selected_circles: set[int] = field(default_factory=set)
 
+    # Last selection bbox as (scene version, lines, circles, bbox): reusable while the
+    # scene version and both index sets are unchanged
+    bbox_cache: tuple[int, frozenset[int], frozenset[int], Rect4 | None] | None = None
+
+    # Scene version the sets were last checked against; indices only go stale when
+    # the scene changes
+    sanitized_version: int | None = None
+
     def reset(self) -> None:
         self.selecting = False
         self.anchor = None
         self.current = None
         self.selected_lines.clear()
         self.selected_circles.clear()
+        self.bbox_cache = None
+        self.sanitized_version = None
+
+
+def _frozen(a: np.ndarray) -> np.ndarray:
+    a.setflags(write=False)
+    return a
+
+
+# Empty snapshots; shared, so they must never be written to
+_NO_IDS = _frozen(np.empty(0, dtype=np.intp))
+_NO_LINES = _frozen(np.empty((0, 4), dtype=np.int32))
+_NO_CIRCLES = _frozen(np.empty((0, 3), dtype=np.int32))
 
 
-@dataclass
+def _take_rows(arr: np.ndarray, indices: Iterable[int]) -> tuple[np.ndarray, np.ndarray]:
+    """Sorted valid indices into `arr` and a copy of their rows."""
+    ids = np.array(sorted(i for i in indices if 0 <= i < len(arr)), dtype=np.intp)
+    return ids, arr[ids]
+
+
+@dataclass(slots=True)
 class TransformState:
     dragging: bool = False
     anchor: Point2 | None = None
 
-    # Snapshots for non-destructive drags
-    lines_snapshot: list[tuple[int, tuple[int, int, int, int]]] = field(default_factory=list)
-    # circles: (idx, (cx, cy, r))
-    circles_snapshot: list[tuple[int, tuple[int, int, int]]] = field(default_factory=list)
+    # Snapshots for non-destructive drags: sorted scene indices and their rows at drag
+    # start, (K, 4) rows of line_xy and (M, 3) rows of circle_xyr
+    line_ids: np.ndarray = field(default_factory=lambda: _NO_IDS)
+    line_pts0: np.ndarray = field(default_factory=lambda: _NO_LINES)
+    circle_ids: np.ndarray = field(default_factory=lambda: _NO_IDS)
+    circle_pts0: np.ndarray = field(default_factory=lambda: _NO_CIRCLES)
+    # tools take the snapshot on the first motion of a drag, so plain clicks copy nothing
+    snapshot_taken: bool = False
 
     # Pivot (for rotate/scale) and baseline magnitudes
     pivot: tuple[float, float] | None = None
-    anchor_angle: float = 0.0
     anchor_dist: float = 1.0
 
     def reset(self) -> None:
         self.dragging = False
         self.anchor = None
-        self.lines_snapshot.clear()
-        self.circles_snapshot.clear()
+        self.line_ids = self.circle_ids = _NO_IDS
+        self.line_pts0 = _NO_LINES
+        self.circle_pts0 = _NO_CIRCLES
+        self.snapshot_taken = False
         self.pivot = None
-        self.anchor_angle = 0.0
         self.anchor_dist = 1.0
 
+    def snapshot(
+        self,
+        line_xy: np.ndarray,
+        lines: Iterable[int],
+        circle_xyr: np.ndarray,
+        circles: Iterable[int],
+    ) -> None:
+        """Copy the rows of the given lines and circles as the drag's starting geometry."""
+        self.line_ids, self.line_pts0 = _take_rows(line_xy, lines)
+        self.circle_ids, self.circle_pts0 = _take_rows(circle_xyr, circles)
+        self.snapshot_taken = True
+
 
-@dataclass
+@dataclass(slots=True)
 class ClipState:
     """User-defined clipping window via drag."""
     setting: bool = False
     anchor: Point2 | None = None
     current: Point2 | None = None
     window: Rect4 | None = None
+    # (left, top, right, bottom) of `window`, kept in sync by set_window so the
+    # clippers don't recompute it for every line
+    edges: tuple[int, int, int, int] | None = None
+    # `window` as a pygame.Rect, also kept by set_window; treat it as read-only
+    rect: pygame.Rect | None = None
 
     preview_algo: str | None = None
 
+    def set_window(self, window: Rect4 | None) -> None:
+        self.window = window
+        if window is None:
+            self.edges = None
+            self.rect = None
+        else:
+            left, top, w, h = window
+            self.edges = (left, top, left + w, top + h)
+            self.rect = pygame.Rect(left, top, w, h)
+
     def reset(self) -> None:
         self.setting = False
         self.anchor = None
         self.current = None
-        self.window = None
+        self.set_window(None)
         self.preview_algo = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     """Top-level state container owned by the app loop."""
     mode: Mode = Mode.IDLE
@@ -95,6 +157,13 @@ class AppState:
     # Basic HUD/status message (optional)
     status: str = ""
 
+    # Last mouse position (screen coords), set by the dispatcher from mouse events
+    mouse_pos: Point2 = (0, 0)
+
+    # Screen regions to repaint this frame ("ui", "canvas"). The app loop marks them
+    # whenever events arrive, so an idle window does no drawing or blitting.
+    dirty: set[str] = field(default_factory=lambda: {"ui", "canvas"})
+
     def reset_all(self) -> None:
         """Reset selection/transform/clip and pending clicks; keep mode."""
         self.selection.reset()
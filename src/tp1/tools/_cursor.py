@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pygame
+
+# Cursor helpers shared by the canvas tools. The last cursor set is remembered here,
+# once for all tools, so switching tools never leaves a stale cache behind.
+_last_cursor_const: int | None = None
+# Cleared the first time SDL can't create a system cursor (e.g. the dummy video driver),
+# so unsupported setups stop trying instead of raising on every hover event.
+_cursors_supported = True
+
+
+def set_cursor(system_cursor_const: int) -> None:
+    """Set a system cursor (pygame 2 takes the constant directly); no-op if already set."""
+    global _last_cursor_const, _cursors_supported
+    if system_cursor_const == _last_cursor_const or not _cursors_supported:
+        return
+    try:
+        pygame.mouse.set_cursor(system_cursor_const)
+    except pygame.error:
+        _cursors_supported = False
+        return
+    _last_cursor_const = system_cursor_const
+
+
+# Handle key -> system cursor; pygame's cursor constants exist at import, no init needed
+_HANDLE_CURSOR: dict[str, int] = {
+    "n": pygame.SYSTEM_CURSOR_SIZENS,
+    "s": pygame.SYSTEM_CURSOR_SIZENS,
+    "e": pygame.SYSTEM_CURSOR_SIZEWE,
+    "w": pygame.SYSTEM_CURSOR_SIZEWE,
+    "ne": pygame.SYSTEM_CURSOR_SIZENESW,
+    "sw": pygame.SYSTEM_CURSOR_SIZENESW,
+    "nw": pygame.SYSTEM_CURSOR_SIZENWSE,
+    "se": pygame.SYSTEM_CURSOR_SIZENWSE,
+    "rot": pygame.SYSTEM_CURSOR_HAND,
+}
+
+
+def cursor_for_handle(handle: str) -> int:
+    """Map a handle key to a system cursor constant."""
+    return _HANDLE_CURSOR.get(handle, pygame.SYSTEM_CURSOR_ARROW)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from ..scene.ops import select_in_rect
+from ..scene.scene import Scene
+from ..state import AppState
+from ..utils.geom import rect_from_points
+
+
+def finish_rubber_band(scene: Scene, state: AppState) -> None:
+    """
+    End a rubber-band drag: the selection becomes the lines with an endpoint inside the
+    band and the circles with the center inside. Shared by the select tools.
+    """
+    sel = state.selection
+    sel.selecting = False
+    a, b = sel.anchor, sel.current
+    if not a or not b:
+        return
+    l, t, w, h = rect_from_points(a, b)
+    # fresh sets from select_in_rect, no copy needed
+    sel.selected_lines, sel.selected_circles = select_in_rect(scene, (l, t, l + w, t + h))
+    state.status = f"Selected {len(sel.selected_lines)} lines, {len(sel.selected_circles)} circles"
@@ -20,6 +20,10 @@ class ToolBase:
         """Called when this tool is deactivated."""
         return
 
+    def tick(self, state: AppState, scene: Scene, canvas: pygame.Surface) -> None:
+        """Called once per frame after the events; deferred canvas redraws go here."""
+        return
+
     def handle_canvas_event(
         self,
         ev: pygame.event.Event,
@@ -22,6 +22,9 @@ class CircleTool:
         state.pending_circle_center = None
         state.status = ""
 
+    def tick(self, state: AppState, scene: Scene, canvas: pygame.Surface) -> None:
+        return  # circles are drawn as they are committed
+
     def handle_canvas_event(
         self,
         ev: pygame.event.Event,
@@ -38,7 +41,13 @@ class CircleTool:
                 put_pixel(canvas, x, y, C.ACCENT)
             else:
                 cx, cy = state.pending_circle_center
-                r = max(0, int(round(math.hypot(x - cx, y - cy))))
+                # nearest integer to the distance, in integers: sqrt(d2) > r + 0.5 iff d2 > r*r + r
+                # (never a tie, so this matches round(hypot(...)))
+                dx, dy = x - cx, y - cy
+                d2 = dx * dx + dy * dy
+                r = math.isqrt(d2)
+                if d2 - r * r > r:
+                    r += 1
                 center = Point(cx, cy)
                 scene.add_circle(Circle(center, r, "BRESENHAM"))
                 draw_circle_bresenham(canvas, center, r, C.BLACK)
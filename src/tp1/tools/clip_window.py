@@ -6,54 +6,22 @@ from .. import config as C
 from ..render.renderer import redraw_canvas_from_scene
 from ..scene.scene import Scene
 from ..state import AppState, Mode
-from ..utils.geom import bbox_handles, clamp_rect_to_canvas, resize_rect_from_handle
-
-# -------- Cursor helpers (same pattern used elsewhere) --------
-
-_last_cursor_const: int | None = None
-
-def _set_cursor(system_cursor_const: int) -> None:
-    global _last_cursor_const
-    if _last_cursor_const == system_cursor_const:
-        return
-    try:
-        pygame.mouse.set_cursor(system_cursor_const)  # type: ignore[arg-type]
-        _last_cursor_const = system_cursor_const
-        return
-    except Exception:
-        pass
-    try:
-        pygame.mouse.set_cursor(pygame.cursors.Cursor(system_cursor_const))
-        _last_cursor_const = system_cursor_const
-    except Exception:
-        pass
-
-
-def _cursor_for_handle(handle: str) -> int:
-    if handle in ("n", "s"):
-        return pygame.SYSTEM_CURSOR_SIZENS
-    if handle in ("e", "w"):
-        return pygame.SYSTEM_CURSOR_SIZEWE
-    if handle in ("ne", "sw"):
-        return pygame.SYSTEM_CURSOR_SIZENESW
-    if handle in ("nw", "se"):
-        return pygame.SYSTEM_CURSOR_SIZENWSE
-    return pygame.SYSTEM_CURSOR_ARROW
-
-
-# -------- Local hit-testing for the 8 clip handles --------
-
-def _hit_test_clip_handle(bbox: pygame.Rect, mouse_canvas: tuple[int, int]) -> str | None:
-    centers = bbox_handles((bbox.left, bbox.top, bbox.width, bbox.height), C.ROT_HANDLE_OFFSET)
-    mx, my = mouse_canvas
-    size = C.HANDLE_SIZE + 2 * C.HANDLE_HIT_PAD
-    half = size // 2
-    for key in ("nw", "n", "ne", "e", "se", "s", "sw", "w"):
-        cx, cy = centers[key]
-        rect = pygame.Rect(cx - half, cy - half, size, size)
-        if rect.collidepoint(mx, my):
-            return key
-    return None
+from ..utils.geom import (
+    bbox_handles_cached,
+    clamp_rect_to_canvas,
+    hit_test_resize_handles,
+    resize_rect_from_handle,
+)
+from ._cursor import cursor_for_handle, set_cursor
+
+_CLEAR_KEYS = frozenset({pygame.K_DELETE, pygame.K_BACKSPACE})
+# arrow key -> unit nudge direction
+_NUDGE_DIRS = {
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+}
 
 
 class ClipWindowTool:
@@ -71,10 +39,25 @@ class ClipWindowTool:
     _handle: str | None = None
     _keep_aspect: bool = False
     _from_center: bool = False
+    _dirty: bool = False  # canvas needs a redraw on the next tick
+
+    def __init__(self) -> None:
+        # event type -> handler, and (for motion) gesture mode -> handler
+        self._on_event = {
+            pygame.KEYDOWN: self._on_key,
+            pygame.MOUSEMOTION: self._on_motion,
+            pygame.MOUSEBUTTONDOWN: self._on_down,
+            pygame.MOUSEBUTTONUP: self._on_up,
+        }
+        self._on_drag = {
+            "moving": self._drag_move,
+            "resizing": self._drag_resize,
+            "creating": self._drag_create,
+        }
 
     def enter(self, state: AppState, scene: Scene) -> None:
         state.status = "Clip mode: drag to create; drag inside to move; handles to resize; Del to clear; Arrows to nudge"
-        _set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         self._mode = None
         self._anchor = None
         self._rect0 = None
@@ -83,8 +66,10 @@ class ClipWindowTool:
         self._from_center = False
 
     def exit(self, state: AppState, scene: Scene) -> None:
+        if self._mode in ("moving", "resizing") and state.clip.preview_algo:
+            self._dirty = True  # replace the live (fast) drawing with the exact one
         state.status = ""
-        _set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         self._mode = None
         self._anchor = None
         self._rect0 = None
@@ -92,6 +77,15 @@ class ClipWindowTool:
         self._keep_aspect = False
         self._from_center = False
 
+    def tick(self, state: AppState, scene: Scene, canvas: pygame.Surface) -> None:
+        """Once per frame: redraw the canvas (clip preview) if the window moved or resized."""
+        if self._dirty:
+            self._dirty = False
+            live = self._mode in ("moving", "resizing")
+            # mid-drag frames may use pygame.draw; otherwise C.FAST_DRAW decides
+            fast = True if live and C.FAST_DRAW_LIVE else None
+            redraw_canvas_from_scene(canvas, scene, state, fast=fast)
+
     def _set_idle_status(self, state: AppState) -> None:
         """Show x,y,w,h when we have a window and we're not dragging/creating."""
         if state.clip.window and self._mode is None and not state.clip.setting:
@@ -109,163 +103,182 @@ class ClipWindowTool:
     ) -> None:
         if state.mode != Mode.CLIP_WINDOW:
             return
+        handler = self._on_event.get(ev.type)
+        if handler is not None:
+            handler(ev, cpos, state)
 
-        # ---------- KEYBOARD: Delete clears; arrows nudge ----------
-        if ev.type == pygame.KEYDOWN:
-            # Only act when not in a mouse drag/creation (to avoid conflicts)
-            if self._mode is None and not state.clip.setting:
-                # Delete / Backspace → clear window
-                if ev.key in (pygame.K_DELETE, pygame.K_BACKSPACE):
-                    if state.clip.window:
-                        state.clip.window = None
-                        state.status = "Clip window cleared"
-                    return
-                # Arrow keys → nudge window
-                if state.clip.window and ev.key in (
-                    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN
-                ):
-                    step = C.CLIP_NUDGE_STEP
-                    mods = pygame.key.get_mods()
-                    if mods & pygame.KMOD_SHIFT:
-                        step = C.CLIP_NUDGE_STEP_FAST
+    # ---------- KEYBOARD: Delete clears; arrows nudge ----------
+    def _on_key(
+        self, ev: pygame.event.Event, cpos: tuple[int, int] | None, state: AppState
+    ) -> None:
+        # Only act when not in a mouse drag/creation (to avoid conflicts)
+        if self._mode is not None or state.clip.setting:
+            return
+        # Delete / Backspace → clear window
+        if ev.key in _CLEAR_KEYS:
+            if state.clip.window:
+                state.clip.set_window(None)
+                state.status = "Clip window cleared"
+            return
+        # Arrow keys → nudge window
+        if state.clip.window and ev.key in _NUDGE_DIRS:
+            step = C.CLIP_NUDGE_STEP
+            if ev.mod & pygame.KMOD_SHIFT:  # modifiers come with the event
+                step = C.CLIP_NUDGE_STEP_FAST
 
-                    dx = (-step if ev.key == pygame.K_LEFT else step if ev.key == pygame.K_RIGHT else 0)
-                    dy = (-step if ev.key == pygame.K_UP   else step if ev.key == pygame.K_DOWN  else 0)
+            ux, uy = _NUDGE_DIRS[ev.key]
+            dx, dy = ux * step, uy * step
 
-                    l, t, w, h = state.clip.window
-                    state.clip.window = clamp_rect_to_canvas((l + dx, t + dy, w, h), C.CANVAS_W, C.CANVAS_H)
-                    l, t, w, h = state.clip.window
-                    state.status = f"Nudge: x={l}, y={t}, w={w}, h={h}"
-                    return
+            l, t, w, h = state.clip.window
+            nudged = (l + dx, t + dy, w, h)
+            state.clip.set_window(clamp_rect_to_canvas(nudged, C.CANVAS_W, C.CANVAS_H))
+            l, t, w, h = state.clip.window
+            state.status = f"Nudge: x={l}, y={t}, w={w}, h={h}"
 
-        # --------------- LIVE MOVE ---------------
-        if ev.type == pygame.MOUSEMOTION and self._mode == "moving" and cpos and self._anchor and self._rect0:
-            dx = cpos[0] - self._anchor[0]
-            dy = cpos[1] - self._anchor[1]
-            l0, t0, w0, h0 = self._rect0
-            new_rect = (l0 + dx, t0 + dy, w0, h0)
-            state.clip.window = clamp_rect_to_canvas(new_rect, C.CANVAS_W, C.CANVAS_H)
-            state.status = f"Move: ({dx}, {dy})"
-            _set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
-            redraw_canvas_from_scene(canvas, scene, state)
+    def _on_motion(
+        self, ev: pygame.event.Event, cpos: tuple[int, int] | None, state: AppState
+    ) -> None:
+        if cpos is None:
+            set_cursor(pygame.SYSTEM_CURSOR_ARROW)
             return
-
-        # --------------- LIVE RESIZE ---------------
-        if ev.type == pygame.MOUSEMOTION and self._mode == "resizing" and cpos and self._rect0 and self._handle:
-            new_rect = resize_rect_from_handle(
-                self._rect0,
-                self._handle,
-                cpos,
-                keep_aspect=self._keep_aspect,
-                from_center=self._from_center,
-                min_w=C.CLIP_MIN_W,
-                min_h=C.CLIP_MIN_H,
-                bounds=(C.CANVAS_W, C.CANVAS_H),
-            )
-            state.clip.window = new_rect
-            l, t, w, h = new_rect
-            state.status = f"Resize: {w}×{h}"
-            _set_cursor(_cursor_for_handle(self._handle))
-            redraw_canvas_from_scene(canvas, scene, state)
+        # no gesture in progress, or one that did not apply: plain hover
+        if self._mode is None or not self._on_drag[self._mode](cpos, state):
+            self._hover(cpos, state)
+
+    # --------------- LIVE MOVE ---------------
+    def _drag_move(self, cpos: tuple[int, int], state: AppState) -> bool:
+        if not (self._anchor and self._rect0):
+            return False
+        dx = cpos[0] - self._anchor[0]
+        dy = cpos[1] - self._anchor[1]
+        l0, t0, w0, h0 = self._rect0
+        new_rect = (l0 + dx, t0 + dy, w0, h0)
+        state.clip.set_window(clamp_rect_to_canvas(new_rect, C.CANVAS_W, C.CANVAS_H))
+        state.status = f"Move: ({dx}, {dy})"
+        set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
+        # The window outline lives on the overlay, so the canvas only changes
+        # when a clip preview is shown through the window.
+        if state.clip.preview_algo:
+            self._dirty = True
+        return True
+
+    # --------------- LIVE RESIZE ---------------
+    def _drag_resize(self, cpos: tuple[int, int], state: AppState) -> bool:
+        if not (self._rect0 and self._handle):
+            return False
+        new_rect = resize_rect_from_handle(
+            self._rect0,
+            self._handle,
+            cpos,
+            keep_aspect=self._keep_aspect,
+            from_center=self._from_center,
+            min_w=C.CLIP_MIN_W,
+            min_h=C.CLIP_MIN_H,
+            bounds=(C.CANVAS_W, C.CANVAS_H),
+        )
+        state.clip.set_window(new_rect)
+        l, t, w, h = new_rect
+        state.status = f"Resize: {w}×{h}"
+        set_cursor(cursor_for_handle(self._handle))
+        if state.clip.preview_algo:
+            self._dirty = True
+        return True
+
+    # --------------- UPDATE creation drag ---------------
+    def _drag_create(self, cpos: tuple[int, int], state: AppState) -> bool:
+        if not state.clip.setting:
+            return False
+        state.clip.current = cpos
+        set_cursor(pygame.SYSTEM_CURSOR_CROSSHAIR)
+        return True
+
+    # --------------- HOVER cursors (idle) ---------------
+    def _hover(self, cpos: tuple[int, int], state: AppState) -> None:
+        if state.clip.window and self._mode is None and not state.clip.setting:
+            centers = bbox_handles_cached(state.clip.window, C.ROT_HANDLE_OFFSET)
+            hkey = hit_test_resize_handles(centers, cpos)
+            if hkey:
+                set_cursor(cursor_for_handle(hkey))
+            elif state.clip.rect is not None and state.clip.rect.collidepoint(cpos):
+                set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
+            else:
+                set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        else:
+            set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        self._set_idle_status(state)
+
+    # --------------- BEGIN gestures ---------------
+    def _on_down(
+        self, ev: pygame.event.Event, cpos: tuple[int, int] | None, state: AppState
+    ) -> None:
+        if not cpos:
             return
-
-        # --------------- HOVER cursors (idle) ---------------
-        if ev.type == pygame.MOUSEMOTION:
-            if cpos is None:
-                _set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        # Prefer RESIZE if we pressed on a handle
+        if state.clip.window:
+            centers = bbox_handles_cached(state.clip.window, C.ROT_HANDLE_OFFSET)
+            hkey = hit_test_resize_handles(centers, cpos)
+            if hkey:
+                self._mode = "resizing"
+                self._handle = hkey
+                self._rect0 = state.clip.window
+                mods = pygame.key.get_mods()
+                self._keep_aspect = bool(mods & pygame.KMOD_SHIFT)
+                self._from_center = bool(mods & pygame.KMOD_ALT)
+                state.status = "Resizing clip window…"
+                set_cursor(cursor_for_handle(hkey))
                 return
 
-            if state.clip.window and self._mode is None and not state.clip.setting:
-                l, t, w, h = state.clip.window
-                bbox = pygame.Rect(l, t, w, h)
-
-                hkey = _hit_test_clip_handle(bbox, cpos)
-                if hkey:
-                    _set_cursor(_cursor_for_handle(hkey))
-                    self._set_idle_status(state)
-                    return
-
-                if bbox.collidepoint(cpos):
-                    _set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
-                    self._set_idle_status(state)
-                    return
-
-            _set_cursor(pygame.SYSTEM_CURSOR_ARROW)
-            self._set_idle_status(state)
-
-        # --------------- BEGIN gestures ---------------
-        if ev.type == pygame.MOUSEBUTTONDOWN and cpos:
-            # Prefer RESIZE if we pressed on a handle
-            if state.clip.window:
-                l, t, w, h = state.clip.window
-                bbox = pygame.Rect(l, t, w, h)
-                hkey = _hit_test_clip_handle(bbox, cpos)
-                if hkey:
-                    self._mode = "resizing"
-                    self._handle = hkey
-                    self._rect0 = state.clip.window
-                    mods = pygame.key.get_mods()
-                    self._keep_aspect = bool(mods & pygame.KMOD_SHIFT)
-                    self._from_center = bool(mods & pygame.KMOD_ALT)
-                    state.status = "Resizing clip window…"
-                    _set_cursor(_cursor_for_handle(hkey))
-                    return
-
-                # Else: MOVING if inside
-                if bbox.collidepoint(cpos):
-                    self._mode = "moving"
-                    self._anchor = cpos
-                    self._rect0 = state.clip.window
-                    state.status = "Moving clip window…"
-                    _set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
-                    return
+            # Else: MOVING if inside
+            if state.clip.rect is not None and state.clip.rect.collidepoint(cpos):
+                self._mode = "moving"
+                self._anchor = cpos
+                self._rect0 = state.clip.window
+                state.status = "Moving clip window…"
+                set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
+                return
 
-            # Else: CREATING
-            state.clip.setting = True
-            self._mode = "creating"
-            state.clip.anchor = cpos
-            state.clip.current = cpos
-            _set_cursor(pygame.SYSTEM_CURSOR_CROSSHAIR)
+        # Else: CREATING
+        state.clip.setting = True
+        self._mode = "creating"
+        state.clip.anchor = cpos
+        state.clip.current = cpos
+        set_cursor(pygame.SYSTEM_CURSOR_CROSSHAIR)
+
+    # --------------- END gestures ---------------
+    def _on_up(self, ev: pygame.event.Event, cpos: tuple[int, int] | None, state: AppState) -> None:
+        # Finish MOVE
+        if self._mode == "moving":
+            self._mode = None
+            self._anchor = None
+            self._rect0 = None
+            state.status = "Clip window moved"
+            if state.clip.preview_algo:
+                self._dirty = True  # final redraw with the exact rasterizers
             return
 
-        # --------------- UPDATE creation drag ---------------
-        if ev.type == pygame.MOUSEMOTION and cpos and state.clip.setting and self._mode == "creating":
-            state.clip.current = cpos
-            _set_cursor(pygame.SYSTEM_CURSOR_CROSSHAIR)
+        # Finish RESIZE
+        if self._mode == "resizing":
+            self._mode = None
+            self._rect0 = None
+            self._handle = None
+            self._keep_aspect = False
+            self._from_center = False
+            state.status = "Clip window resized"
+            if state.clip.preview_algo:
+                self._dirty = True  # final redraw with the exact rasterizers
             return
 
-        # --------------- END gestures ---------------
-        if ev.type == pygame.MOUSEBUTTONUP:
-            # Finish MOVE
-            if self._mode == "moving":
-                self._mode = None
-                self._anchor = None
-                self._rect0 = None
-                state.status = "Clip window moved"
-                return
-
-            # Finish RESIZE
-            if self._mode == "resizing":
-                self._mode = None
-                self._rect0 = None
-                self._handle = None
-                self._keep_aspect = False
-                self._from_center = False
-                state.status = "Clip window resized"
-                return
-
-            # Finish CREATE (same as before)
-            if state.clip.setting and state.clip.anchor and state.clip.current:
-                state.clip.setting = False
-                (x0, y0) = state.clip.anchor
-                (x1, y1) = state.clip.current
-                left = min(x0, x1)
-                top = min(y0, y1)
-                w = max(1, abs(x1 - x0))
-                h = max(1, abs(y1 - y0))
-                state.clip.window = clamp_rect_to_canvas((left, top, w, h), C.CANVAS_W, C.CANVAS_H)
-                state.clip.anchor = None
-                state.clip.current = None
-                self._mode = None
-                _set_cursor(pygame.SYSTEM_CURSOR_ARROW)
-                return
+        # Finish CREATE (same as before)
+        if state.clip.setting and state.clip.anchor and state.clip.current:
+            state.clip.setting = False
+            (x0, y0) = state.clip.anchor
+            (x1, y1) = state.clip.current
+            left = min(x0, x1)
+            top = min(y0, y1)
+            w = max(1, abs(x1 - x0))
+            h = max(1, abs(y1 - y0))
+            state.clip.set_window(clamp_rect_to_canvas((left, top, w, h), C.CANVAS_W, C.CANVAS_H))
+            state.clip.anchor = None
+            state.clip.current = None
+            self._mode = None
+            set_cursor(pygame.SYSTEM_CURSOR_ARROW)
@@ -28,6 +28,9 @@ class LineTool:
         state.pending_line_start = None
         state.status = ""
 
+    def tick(self, state: AppState, scene: Scene, canvas: pygame.Surface) -> None:
+        return  # lines are drawn as they are committed
+
     def handle_canvas_event(
         self,
         ev: pygame.event.Event,
@@ -1,33 +1,21 @@
 from __future__ import annotations
 
-import math
-
+import numpy as np
 import pygame
 
 from ..render.renderer import redraw_canvas_from_scene
+from ..scene.ops import selection_bounds
 from ..scene.scene import Scene
 from ..state import AppState
-from ..utils.geom import bbox_of_points
-from ..utils.transforms import rotate_point_i
+from ..utils.transforms import cos_sin_between, rotate_points_cs
 
 
 def _selection_bbox_center(scene: Scene, state: AppState) -> tuple[float, float] | None:
-    pts: list[tuple[int, int]] = []
-    for i in state.selection.selected_lines:
-        if 0 <= i < len(scene.lines):
-            ln = scene.lines[i]
-            pts.append((ln.p0.x, ln.p0.y))
-            pts.append((ln.p1.x, ln.p1.y))
-    for i in state.selection.selected_circles:
-        if 0 <= i < len(scene.circles):
-            c = scene.circles[i]
-            pts.append((c.c.x - c.r, c.c.y - c.r))
-            pts.append((c.c.x + c.r, c.c.y + c.r))
-    bb = bbox_of_points(pts)
-    if not bb:
+    edges = selection_bounds(scene, state.selection.selected_lines, state.selection.selected_circles)
+    if edges is None:
         return None
-    l, t, w, h = bb
-    return (l + w / 2.0, t + h / 2.0)
+    l, t, r, b = edges
+    return (l + (r - l) / 2.0, t + (b - t) / 2.0)
 
 
 class RotateTool:
@@ -40,6 +28,9 @@ class RotateTool:
         state.transform.reset()
         state.status = ""
 
+    def tick(self, state: AppState, scene: Scene, canvas: pygame.Surface) -> None:
+        return  # redraws happen in the event handler
+
     def handle_canvas_event(
         self,
         ev: pygame.event.Event,
@@ -59,35 +50,30 @@ class RotateTool:
             tr.dragging = True
             tr.anchor = cpos
             tr.pivot = pivot
-            ax, ay = cpos[0] - pivot[0], cpos[1] - pivot[1]
-            tr.anchor_angle = math.atan2(ay, ax) if (ax or ay) else 0.0
-
-            tr.lines_snapshot = [
-                (i, (scene.lines[i].p0.x, scene.lines[i].p0.y, scene.lines[i].p1.x, scene.lines[i].p1.y))
-                for i in sel.selected_lines
-            ]
-            tr.circles_snapshot = [
-                (i, (scene.circles[i].c.x, scene.circles[i].c.y, scene.circles[i].r))
-                for i in sel.selected_circles
-            ]
-
-        elif ev.type == pygame.MOUSEMOTION and cpos and tr.dragging and tr.pivot:
-            cx, cy = tr.pivot
-            vx, vy = cpos[0] - cx, cpos[1] - cy
-            cur_angle = math.atan2(vy, vx) if (vx or vy) else tr.anchor_angle
-            theta = cur_angle - tr.anchor_angle
-
-            for i, (x0, y0, x1, y1) in tr.lines_snapshot:
-                nx0, ny0 = rotate_point_i(x0, y0, cx, cy, theta)
-                nx1, ny1 = rotate_point_i(x1, y1, cx, cy, theta)
-                scene.lines[i].p0.x, scene.lines[i].p0.y = nx0, ny0
-                scene.lines[i].p1.x, scene.lines[i].p1.y = nx1, ny1
-
-            for i, (cx0, cy0, r0) in tr.circles_snapshot:
-                ncx, ncy = rotate_point_i(cx0, cy0, cx, cy, theta)
-                scene.circles[i].c.x, scene.circles[i].c.y = ncx, ncy
-                scene.circles[i].r = r0
 
+        elif (
+            ev.type == pygame.MOUSEMOTION and cpos and tr.dragging and tr.pivot and tr.anchor
+        ):
+            if not tr.snapshot_taken:  # first motion of the drag
+                tr.snapshot(scene.line_xy, sel.selected_lines, scene.circle_xyr, sel.selected_circles)
+            cx, cy = tr.pivot
+            ax, ay = tr.anchor[0] - cx, tr.anchor[1] - cy
+            if not (ax or ay):
+                ax, ay = 1.0, 0.0  # grabbed on the pivot: angle measured from +x
+            ct, st = cos_sin_between(ax, ay, cpos[0] - cx, cpos[1] - cy)
+
+            if len(tr.line_ids):
+                ids, rows = tr.line_ids, tr.line_pts0
+                nx, ny = rotate_points_cs(rows[:, 0::2], rows[:, 1::2], cx, cy, ct, st)
+                scene.line_xy[ids, 0::2] = nx
+                scene.line_xy[ids, 1::2] = ny
+
+            if len(tr.circle_ids):
+                cids, crows = tr.circle_ids, tr.circle_pts0
+                ncx, ncy = rotate_points_cs(crows[:, 0], crows[:, 1], cx, cy, ct, st)
+                scene.circle_xyr[cids] = np.column_stack((ncx, ncy, crows[:, 2]))
+
+            scene.touch()
             redraw_canvas_from_scene(canvas, scene)
 
         elif ev.type == pygame.MOUSEBUTTONUP and tr.dragging:
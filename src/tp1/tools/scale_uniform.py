@@ -2,32 +2,22 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pygame
 
 from ..render.renderer import redraw_canvas_from_scene
+from ..scene.ops import selection_bounds
 from ..scene.scene import Scene
 from ..state import AppState
-from ..utils.geom import bbox_of_points
-from ..utils.transforms import scale_point_i
+from ..utils.transforms import scale_points_xy_i
 
 
 def _selection_bbox_center(scene: Scene, state: AppState) -> tuple[float, float] | None:
-    pts: list[tuple[int, int]] = []
-    for i in state.selection.selected_lines:
-        if 0 <= i < len(scene.lines):
-            ln = scene.lines[i]
-            pts.append((ln.p0.x, ln.p0.y))
-            pts.append((ln.p1.x, ln.p1.y))
-    for i in state.selection.selected_circles:
-        if 0 <= i < len(scene.circles):
-            c = scene.circles[i]
-            pts.append((c.c.x - c.r, c.c.y - c.r))
-            pts.append((c.c.x + c.r, c.c.y + c.r))
-    bb = bbox_of_points(pts)
-    if not bb:
+    edges = selection_bounds(scene, state.selection.selected_lines, state.selection.selected_circles)
+    if edges is None:
         return None
-    l, t, w, h = bb
-    return (l + w / 2.0, t + h / 2.0)
+    l, t, r, b = edges
+    return (l + (r - l) / 2.0, t + (b - t) / 2.0)
 
 
 class ScaleUniformTool:
@@ -40,6 +30,9 @@ class ScaleUniformTool:
         state.transform.reset()
         state.status = ""
 
+    def tick(self, state: AppState, scene: Scene, canvas: pygame.Surface) -> None:
+        return  # redraws happen in the event handler
+
     def handle_canvas_event(
         self,
         ev: pygame.event.Event,
@@ -62,32 +55,27 @@ class ScaleUniformTool:
             dx0, dy0 = cpos[0] - pivot[0], cpos[1] - pivot[1]
             tr.anchor_dist = max(1e-6, math.hypot(dx0, dy0))
 
-            tr.lines_snapshot = [
-                (i, (scene.lines[i].p0.x, scene.lines[i].p0.y, scene.lines[i].p1.x, scene.lines[i].p1.y))
-                for i in sel.selected_lines
-            ]
-            tr.circles_snapshot = [
-                (i, (scene.circles[i].c.x, scene.circles[i].c.y, scene.circles[i].r))
-                for i in sel.selected_circles
-            ]
-
         elif ev.type == pygame.MOUSEMOTION and cpos and tr.dragging and tr.pivot:
+            if not tr.snapshot_taken:  # first motion of the drag
+                tr.snapshot(scene.line_xy, sel.selected_lines, scene.circle_xyr, sel.selected_circles)
             cx, cy = tr.pivot
             dx, dy = cpos[0] - cx, cpos[1] - cy
             cur_dist = max(1e-6, math.hypot(dx, dy))
             s = cur_dist / tr.anchor_dist
 
-            for i, (x0, y0, x1, y1) in tr.lines_snapshot:
-                nx0, ny0 = scale_point_i(x0, y0, cx, cy, s)
-                nx1, ny1 = scale_point_i(x1, y1, cx, cy, s)
-                scene.lines[i].p0.x, scene.lines[i].p0.y = nx0, ny0
-                scene.lines[i].p1.x, scene.lines[i].p1.y = nx1, ny1
+            if len(tr.line_ids):
+                ids, rows = tr.line_ids, tr.line_pts0
+                nx, ny = scale_points_xy_i(rows[:, 0::2], rows[:, 1::2], cx, cy, s, s)
+                scene.line_xy[ids, 0::2] = nx
+                scene.line_xy[ids, 1::2] = ny
 
-            for i, (cx0, cy0, r0) in tr.circles_snapshot:
-                ncx, ncy = scale_point_i(cx0, cy0, cx, cy, s)
-                scene.circles[i].c.x, scene.circles[i].c.y = ncx, ncy
-                scene.circles[i].r = max(0, int(round(r0 * s)))
+            if len(tr.circle_ids):
+                cids, crows = tr.circle_ids, tr.circle_pts0
+                ncx, ncy = scale_points_xy_i(crows[:, 0], crows[:, 1], cx, cy, s, s)
+                nr = np.maximum(np.rint(crows[:, 2] * s), 0).astype(np.int32)
+                scene.circle_xyr[cids] = np.column_stack((ncx, ncy, nr))
 
+            scene.touch()
             redraw_canvas_from_scene(canvas, scene)
 
         elif ev.type == pygame.MOUSEBUTTONUP and tr.dragging:
@@ -4,7 +4,7 @@ import pygame
 
 from ..scene.scene import Scene
 from ..state import AppState
-from ..utils.geom import rect_from_points
+from ._selection import finish_rubber_band
 
 
 class SelectTool:
@@ -23,6 +23,9 @@ class SelectTool:
         state.selection.current = None
         state.status = ""
 
+    def tick(self, state: AppState, scene: Scene, canvas: pygame.Surface) -> None:
+        return  # the rubber band lives on the overlay
+
     def handle_canvas_event(
         self,
         ev: pygame.event.Event,
@@ -43,28 +46,4 @@ class SelectTool:
             sel.current = cpos
 
         elif ev.type == pygame.MOUSEBUTTONUP and cpos and sel.selecting:
-            sel.selecting = False
-            a, b = sel.anchor, sel.current
-            if not a or not b:
-                return
-            l, t, w, h = rect_from_points(a, b)
-
-            # rebuild selection sets
-            sel.selected_lines.clear()
-            sel.selected_circles.clear()
-
-            L, T, R, B = l, t, l + w, t + h
-
-            # Lines: select if any endpoint is inside
-            for i, ln in enumerate(scene.lines):
-                if (L <= ln.p0.x <= R and T <= ln.p0.y <= B) or (
-                    L <= ln.p1.x <= R and T <= ln.p1.y <= B
-                ):
-                    sel.selected_lines.add(i)
-
-            # Circles: select if center is inside
-            for i, c in enumerate(scene.circles):
-                if L <= c.c.x <= R and T <= c.c.y <= B:
-                    sel.selected_circles.add(i)
-
-            state.status = f"Selected {len(sel.selected_lines)} lines, {len(sel.selected_circles)} circles"
+            finish_rubber_band(scene, state)
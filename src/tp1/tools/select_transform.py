@@ -2,33 +2,52 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pygame
 
 from .. import config as C
-from ..render.renderer import redraw_canvas_from_scene
+from ..render.renderer import draw_scene_subset, redraw_canvas_from_scene
+from ..scene.ops import selection_bounds
 from ..scene.scene import Scene
 from ..state import AppState
-from ..utils.geom import bbox_handles, rect_from_points
-from ..utils.transforms import rotate_point_i, scale_point_xy_i
+from ..utils.geom import RESIZE_HANDLES, bbox_handles_cached, hit_test_resize_handles
+from ..utils.transforms import cos_sin_between, rotate_points_cs, scale_points_xy_i
+from ._cursor import cursor_for_handle, set_cursor
+from ._selection import finish_rubber_band
+
+
+def _snapshot_valid(ids: np.ndarray, n: int) -> bool:
+    """True if the (sorted) snapshot ids are non-empty and still inside the scene."""
+    return len(ids) > 0 and ids[-1] < n
 
 
 def _selection_bbox(scene: Scene, state: AppState) -> pygame.Rect | None:
-    xs: list[int] = []
-    ys: list[int] = []
-    for i in state.selection.selected_lines:
-        if 0 <= i < len(scene.lines):
-            ln = scene.lines[i]
-            xs.extend([ln.p0.x, ln.p1.x])
-            ys.extend([ln.p0.y, ln.p1.y])
-    for i in state.selection.selected_circles:
-        if 0 <= i < len(scene.circles):
-            c = scene.circles[i]
-            xs.extend([c.c.x - c.r, c.c.x + c.r])
-            ys.extend([c.c.y - c.r, c.c.y + c.r])
-    if not xs or not ys:
+    # Hover asks for this on every motion; reuse the last result until the scene or the
+    # selection changes (set equality is a C-level compare, no coordinate reads)
+    sel = state.selection
+    cache = sel.bbox_cache
+    if (
+        cache is not None
+        and cache[0] == scene.version
+        and cache[1] == sel.selected_lines
+        and cache[2] == sel.selected_circles
+    ):
+        return pygame.Rect(cache[3]) if cache[3] else None
+    bbox = _compute_selection_bbox(scene, state)
+    sel.bbox_cache = (
+        scene.version,
+        frozenset(sel.selected_lines),
+        frozenset(sel.selected_circles),
+        (bbox.x, bbox.y, bbox.w, bbox.h) if bbox else None,
+    )
+    return bbox
+
+
+def _compute_selection_bbox(scene: Scene, state: AppState) -> pygame.Rect | None:
+    edges = selection_bounds(scene, state.selection.selected_lines, state.selection.selected_circles)
+    if edges is None:
         return None
-    left, right = min(xs), max(xs)
-    top, bottom = min(ys), max(ys)
+    left, top, right, bottom = edges
     return pygame.Rect(left, top, right - left, bottom - top)
 
 
@@ -49,27 +68,41 @@ def _affects_axes(handle: str) -> tuple[bool, bool]:
     return (True, True)
 
 
+# Rotation knob: circular hit area (slightly larger than visual)
+_KNOB_HIT_RADIUS = max(C.HANDLE_SIZE // 2 + C.HANDLE_HIT_PAD + 3, 10)
+# Farthest any hit area (handle square, knob, stem) reaches past its center point
+_HIT_REACH = max((C.HANDLE_SIZE + 2 * C.HANDLE_HIT_PAD) // 2, _KNOB_HIT_RADIUS, C.ROT_STEM_HIT_RADIUS) + 1
+
+
+def _near_bbox(bbox: pygame.Rect, mouse: tuple[int, int]) -> bool:
+    """
+    Cheap pre-check for hover: False means `mouse` can hit neither the bbox nor any of its
+    handles, knob or stem, so the detailed tests can be skipped.
+    """
+    rx, ry = bbox_handles_cached((bbox.left, bbox.top, bbox.width, bbox.height), C.ROT_HANDLE_OFFSET)["rot"]
+    mx, my = mouse
+    return (
+        min(bbox.left, rx) - _HIT_REACH <= mx <= max(bbox.right, rx) + _HIT_REACH
+        and min(bbox.top, ry) - _HIT_REACH <= my <= max(bbox.bottom, ry) + _HIT_REACH
+    )
+
+
 def _hit_test_handle(bbox: pygame.Rect, mouse: tuple[int, int]) -> str | None:
     """
     Return handle key ("nw","n","ne","e","se","s","sw","w","rot") if mouse hits one.
     Otherwise None. Includes clickable rotation *stem* for better UX.
     """
-    centers = bbox_handles((bbox.left, bbox.top, bbox.width, bbox.height), C.ROT_HANDLE_OFFSET)
+    centers = bbox_handles_cached((bbox.left, bbox.top, bbox.width, bbox.height), C.ROT_HANDLE_OFFSET)
     mx, my = mouse
 
     # square handles first (corners/edges)
-    size = C.HANDLE_SIZE + 2 * C.HANDLE_HIT_PAD
-    half = size // 2
-    for key in ("nw", "n", "ne", "e", "se", "s", "sw", "w"):
-        cx, cy = centers[key]
-        rect = pygame.Rect(cx - half, cy - half, size, size)
-        if rect.collidepoint(mx, my):
-            return key
-
-    # rotation knob: circular hit area (slightly larger than visual)
+    key = hit_test_resize_handles(centers, mouse)
+    if key:
+        return key
+
+    # rotation knob
     rx, ry = centers["rot"]
-    r_knob = max(C.HANDLE_SIZE // 2 + C.HANDLE_HIT_PAD + 3, 10)
-    if (mx - rx) * (mx - rx) + (my - ry) * (my - ry) <= r_knob * r_knob:
+    if (mx - rx) * (mx - rx) + (my - ry) * (my - ry) <= _KNOB_HIT_RADIUS * _KNOB_HIT_RADIUS:
         return "rot"
 
     # rotation stem: treat clicks near the stem as rotation, too
@@ -90,50 +123,6 @@ def _hit_test_handle(bbox: pygame.Rect, mouse: tuple[int, int]) -> str | None:
     return None
 
 
-# ---- Cursor helpers ---------------------------------------------------------
-
-# Cache the last set cursor to avoid redundant calls
-_last_cursor_const: int | None = None
-
-def _set_cursor(system_cursor_const: int) -> None:
-    """Set a system cursor if available; cache to avoid redundant calls."""
-    global _last_cursor_const
-    if _last_cursor_const == system_cursor_const:
-        return
-    try:
-        # Pygame 2: set a system cursor directly by constant
-        pygame.mouse.set_cursor(system_cursor_const)  # type: ignore[arg-type]
-        _last_cursor_const = system_cursor_const
-        return
-    except Exception:
-        pass
-    try:
-        # Fallback: wrap in Cursor object
-        pygame.mouse.set_cursor(pygame.cursors.Cursor(system_cursor_const))
-        _last_cursor_const = system_cursor_const
-    except Exception:
-        # Last resort: do nothing (keep whatever cursor is active)
-        pass
-
-
-def _cursor_for_handle(handle: str) -> int:
-    """Map a handle key to a system cursor constant."""
-    if handle in ("n", "s"):
-        return pygame.SYSTEM_CURSOR_SIZENS
-    if handle in ("e", "w"):
-        return pygame.SYSTEM_CURSOR_SIZEWE
-    if handle in ("ne", "sw"):
-        return pygame.SYSTEM_CURSOR_SIZENESW
-    if handle in ("nw", "se"):
-        return pygame.SYSTEM_CURSOR_SIZENWSE
-    if handle == "rot":
-        return pygame.SYSTEM_CURSOR_HAND
-    return pygame.SYSTEM_CURSOR_ARROW
-
-
-# ----------------------------------------------------------------------------
-
-
 class SelectTransformTool:
     """
     Unified selection + transform tool.
@@ -153,13 +142,21 @@ class SelectTransformTool:
     _bbox0: pygame.Rect | None = None
     _pivot: tuple[float, float] | None = None
     _h0: tuple[int, int] | None = None  # grabbed handle original position
-    _anchor_angle: float = 0.0          # for rotation
+    _anchor_vec: tuple[float, float] = (1.0, 0.0)  # pivot -> grab point, for rotation
+    _dirty: bool = False                # canvas needs a redraw on the next tick
+    _pending: tuple[int, int] | None = None  # latest drag position, applied once per tick
+    _applied: tuple[tuple[int, int], int] | None = None  # (position, Shift/Alt) last applied
+    _dirty_rect: pygame.Rect | None = None   # area the live drag changed since the last tick
+    _bg: pygame.Surface | None = None        # unselected shapes, drawn once per gesture
 
     def enter(self, state: AppState, scene: Scene) -> None:
         state.status = "Drag to select; drag inside selection to move; handles to scale; rotate knob to rotate"
-        _set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        set_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
     def exit(self, state: AppState, scene: Scene) -> None:
+        self._flush_pending(state, scene)
+        if self._mode in ("moving", "scaling", "rotating"):
+            self._dirty = True  # replace the live (fast) drawing with the exact one
         state.selection.selecting = False
         state.transform.reset()
         state.status = ""
@@ -168,37 +165,95 @@ class SelectTransformTool:
         self._bbox0 = None
         self._pivot = None
         self._h0 = None
-        self._anchor_angle = 0.0
-        _set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        self._anchor_vec = (1.0, 0.0)
+        self._bg = None
+        self._applied = None
+        set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+
+    def tick(self, state: AppState, scene: Scene, canvas: pygame.Surface) -> None:
+        """Once per frame: apply the last drag motion and redraw if the scene changed."""
+        self._flush_pending(state, scene)
+        dirty_rect, self._dirty_rect = self._dirty_rect, None
+        if self._dirty:
+            self._dirty = False
+            live = self._mode in ("moving", "scaling", "rotating")
+            # mid-drag frames may use pygame.draw; otherwise C.FAST_DRAW decides
+            fast = True if live and C.FAST_DRAW_LIVE else None
+            if live and dirty_rect is not None:
+                self._redraw_live(canvas, scene, state, dirty_rect, fast)
+            else:
+                redraw_canvas_from_scene(canvas, scene, fast=fast)
+
+    def _redraw_live(
+        self,
+        canvas: pygame.Surface,
+        scene: Scene,
+        state: AppState,
+        rect: pygame.Rect,
+        fast: bool | None,
+    ) -> None:
+        # Only where the selection was or is now changed. Shapes outside the selection do
+        # not move during the gesture, so they come from a surface drawn once at its start
+        sel = state.selection
+        if self._bg is None:
+            self._bg = canvas.copy()
+            self._bg.fill(C.CANVAS_BG)
+            draw_scene_subset(
+                self._bg,
+                scene,
+                set(range(scene.n_lines)) - sel.selected_lines,
+                set(range(scene.n_circles)) - sel.selected_circles,
+            )
+        prev = canvas.get_clip()
+        canvas.set_clip(rect)
+        area = canvas.get_clip()
+        canvas.blit(self._bg, area, area)
+        draw_scene_subset(canvas, scene, sel.selected_lines, sel.selected_circles, fast=fast)
+        canvas.set_clip(prev)
+
+    def _flush_pending(self, state: AppState, scene: Scene) -> None:
+        # Motions only record the position; the transform runs for the last one of the frame
+        cpos, self._pending = self._pending, None
+        if cpos is None:
+            return
+        # Same spot with the same modifiers gives the same geometry: nothing to redo
+        applied = (cpos, pygame.key.get_mods() & (pygame.KMOD_SHIFT | pygame.KMOD_ALT))
+        if applied == self._applied:
+            return
+        self._applied = applied
+        tr, sel = state.transform, state.selection
+        if not tr.snapshot_taken:
+            tr.snapshot(scene.line_xy, sel.selected_lines, scene.circle_xyr, sel.selected_circles)
+        before = _selection_bbox(scene, state)
+        if self._mode == "moving":
+            self._apply_move(cpos, state=state, scene=scene)
+        elif self._mode == "scaling":
+            self._apply_scale(cpos, state=state, scene=scene)
+        elif self._mode == "rotating":
+            self._apply_rotate(cpos, state=state, scene=scene)
+        after = _selection_bbox(scene, state)
+        if before and after:
+            # the bbox Rects stop one pixel short of the right/bottom coordinates
+            area = before.union(after).inflate(4, 4)
+            self._dirty_rect = area if self._dirty_rect is None else self._dirty_rect.union(area)
 
     # ------------ begin gestures ------------
 
     def _begin_move(self, cpos: tuple[int, int], state: AppState, scene: Scene) -> None:
         tr = state.transform
-        sel = state.selection
         tr.dragging = True
         tr.anchor = cpos
-        tr.lines_snapshot = [
-            (i, (scene.lines[i].p0.x, scene.lines[i].p0.y, scene.lines[i].p1.x, scene.lines[i].p1.y))
-            for i in sel.selected_lines
-            if 0 <= i < len(scene.lines)
-        ]
-        tr.circles_snapshot = [
-            (i, (scene.circles[i].c.x, scene.circles[i].c.y, scene.circles[i].r))
-            for i in sel.selected_circles
-            if 0 <= i < len(scene.circles)
-        ]
         state.status = "Moving…"
         self._mode = "moving"
-        _set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
+        set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
 
     def _begin_scale(self, handle: str, cpos: tuple[int, int], state: AppState, scene: Scene) -> None:
-        assert handle in ("nw", "n", "ne", "e", "se", "s", "sw", "w")
+        assert handle in RESIZE_HANDLES
         bx = _selection_bbox(scene, state)
         if not bx:
             return
         self._bbox0 = bx.copy()
-        centers = bbox_handles((bx.left, bx.top, bx.width, bx.height), C.ROT_HANDLE_OFFSET)
+        centers = bbox_handles_cached((bx.left, bx.top, bx.width, bx.height), C.ROT_HANDLE_OFFSET)
         self._handle = handle
         self._h0 = centers[handle]
 
@@ -214,24 +269,13 @@ class SelectTransformTool:
             opp = _OPPOSITE[handle]
             self._pivot = tuple(map(float, centers[opp]))  # type: ignore[arg-type]
 
-        # snapshot shapes
+        # start the drag; shapes are snapshotted on its first motion (_flush_pending)
         tr = state.transform
-        sel = state.selection
         tr.dragging = True
         tr.anchor = cpos
-        tr.lines_snapshot = [
-            (i, (scene.lines[i].p0.x, scene.lines[i].p0.y, scene.lines[i].p1.x, scene.lines[i].p1.y))
-            for i in sel.selected_lines
-            if 0 <= i < len(scene.lines)
-        ]
-        tr.circles_snapshot = [
-            (i, (scene.circles[i].c.x, scene.circles[i].c.y, scene.circles[i].r))
-            for i in sel.selected_circles
-            if 0 <= i < len(scene.circles)
-        ]
         self._mode = "scaling"
         state.status = "Scaling…"
-        _set_cursor(_cursor_for_handle(handle))
+        set_cursor(cursor_for_handle(handle))
 
     def _begin_rotate(self, cpos: tuple[int, int], state: AppState, scene: Scene) -> None:
         bx = _selection_bbox(scene, state)
@@ -242,53 +286,36 @@ class SelectTransformTool:
         cy = (bx.top + bx.bottom) / 2.0
         self._pivot = (cx, cy)
 
-        # anchor angle from pivot to mouse
+        # anchor vector from pivot to mouse (angle 0 if the grab is on the pivot)
         ax, ay = cpos[0] - cx, cpos[1] - cy
-        self._anchor_angle = math.atan2(ay, ax) if (ax or ay) else 0.0
+        self._anchor_vec = (ax, ay) if (ax or ay) else (1.0, 0.0)
 
-        # snapshot shapes
+        # start the drag; shapes are snapshotted on its first motion (_flush_pending)
         tr = state.transform
-        sel = state.selection
         tr.dragging = True
         tr.anchor = cpos  # not strictly needed for rotation, but keeps symmetry
-        tr.lines_snapshot = [
-            (i, (scene.lines[i].p0.x, scene.lines[i].p0.y, scene.lines[i].p1.x, scene.lines[i].p1.y))
-            for i in sel.selected_lines
-            if 0 <= i < len(scene.lines)
-        ]
-        tr.circles_snapshot = [
-            (i, (scene.circles[i].c.x, scene.circles[i].c.y, scene.circles[i].r))
-            for i in sel.selected_circles
-            if 0 <= i < len(scene.circles)
-        ]
 
         self._mode = "rotating"
         state.status = "Rotating…"
-        _set_cursor(pygame.SYSTEM_CURSOR_HAND)
+        set_cursor(pygame.SYSTEM_CURSOR_HAND)
 
     # ------------ live application during drag ------------
 
-    def _apply_move(self, cpos: tuple[int, int], *, state: AppState, scene: Scene, canvas: pygame.Surface) -> None:
+    def _apply_move(self, cpos: tuple[int, int], *, state: AppState, scene: Scene) -> None:
         tr = state.transform
         if not (tr.dragging and tr.anchor):
             return
         dx = cpos[0] - tr.anchor[0]
         dy = cpos[1] - tr.anchor[1]
-        for i, (x0, y0, x1, y1) in tr.lines_snapshot:
-            if 0 <= i < len(scene.lines):
-                scene.lines[i].p0.x = x0 + dx
-                scene.lines[i].p0.y = y0 + dy
-                scene.lines[i].p1.x = x1 + dx
-                scene.lines[i].p1.y = y1 + dy
-        for i, (cx0, cy0, r0) in tr.circles_snapshot:
-            if 0 <= i < len(scene.circles):
-                scene.circles[i].c.x = cx0 + dx
-                scene.circles[i].c.y = cy0 + dy
-                scene.circles[i].r = r0
+        if _snapshot_valid(tr.line_ids, scene.n_lines):
+            scene.line_xy[tr.line_ids] = tr.line_pts0 + (dx, dy, dx, dy)
+        if _snapshot_valid(tr.circle_ids, scene.n_circles):
+            scene.circle_xyr[tr.circle_ids] = tr.circle_pts0 + (dx, dy, 0)
         state.status = f"Move: ({dx}, {dy})"
-        redraw_canvas_from_scene(canvas, scene)
+        scene.touch()
+        self._dirty = True
 
-    def _apply_scale(self, cpos: tuple[int, int], *, state: AppState, scene: Scene, canvas: pygame.Surface) -> None:
+    def _apply_scale(self, cpos: tuple[int, int], *, state: AppState, scene: Scene) -> None:
         if self._mode != "scaling" or self._handle is None or self._bbox0 is None or self._pivot is None:
             return
 
@@ -321,55 +348,59 @@ class SelectTransformTool:
                 sy = s
 
         tr = state.transform
-        for i, (x0, y0, x1, y1) in tr.lines_snapshot:
-            if 0 <= i < len(scene.lines):
-                nx0, ny0 = scale_point_xy_i(x0, y0, px, py, sx, sy)
-                nx1, ny1 = scale_point_xy_i(x1, y1, px, py, sx, sy)
-                scene.lines[i].p0.x, scene.lines[i].p0.y = nx0, ny0
-                scene.lines[i].p1.x, scene.lines[i].p1.y = nx1, ny1
-
-        for i, (cx0, cy0, r0) in tr.circles_snapshot:
-            if 0 <= i < len(scene.circles):
-                ncx, ncy = scale_point_xy_i(cx0, cy0, px, py, sx, sy)
-                scene.circles[i].c.x, scene.circles[i].c.y = ncx, ncy
-                sr = abs(sx) if uniform else max(abs(sx), abs(sy))
-                scene.circles[i].r = max(0, int(round(r0 * sr)))
+        ids, rows = tr.line_ids, tr.line_pts0
+        if _snapshot_valid(ids, scene.n_lines):
+            nx, ny = scale_points_xy_i(rows[:, 0::2], rows[:, 1::2], px, py, sx, sy)
+            xy = scene.line_xy
+            xy[ids, 0::2] = nx
+            xy[ids, 1::2] = ny
+
+        cids, crows = tr.circle_ids, tr.circle_pts0
+        if _snapshot_valid(cids, scene.n_circles):
+            cxy = scene.circle_xyr
+            cxy[cids, 0], cxy[cids, 1] = scale_points_xy_i(crows[:, 0], crows[:, 1], px, py, sx, sy)
+            sr = abs(sx) if uniform else max(abs(sx), abs(sy))
+            cxy[cids, 2] = np.maximum(np.rint(crows[:, 2] * sr), 0)
 
         state.status = f"Scale: sx={sx:.2f} sy={sy:.2f}"
-        redraw_canvas_from_scene(canvas, scene)
+        scene.touch()
+        self._dirty = True
 
-    def _apply_rotate(self, cpos: tuple[int, int], *, state: AppState, scene: Scene, canvas: pygame.Surface) -> None:
+    def _apply_rotate(self, cpos: tuple[int, int], *, state: AppState, scene: Scene) -> None:
         if self._mode != "rotating" or self._pivot is None:
             return
         cx, cy = self._pivot
-        vx, vy = cpos[0] - cx, cpos[1] - cy
-        cur_angle = math.atan2(vy, vx) if (vx or vy) else self._anchor_angle
-        theta = cur_angle - self._anchor_angle
+        # cos/sin of the turn from the anchor vector to the current one, straight from
+        # their dot and cross products; the angle itself is only needed to snap
+        ct, st = cos_sin_between(*self._anchor_vec, cpos[0] - cx, cpos[1] - cy)
 
         # Snap with Shift
         mods = pygame.key.get_mods()
         if mods & pygame.KMOD_SHIFT:
             snap = math.radians(C.SNAP_ANGLE_DEG)
             if snap > 0:
-                theta = round(theta / snap) * snap
+                theta = round(math.atan2(st, ct) / snap) * snap
+                ct, st = math.cos(theta), math.sin(theta)
 
         tr = state.transform
-        for i, (x0, y0, x1, y1) in tr.lines_snapshot:
-            if 0 <= i < len(scene.lines):
-                nx0, ny0 = rotate_point_i(x0, y0, cx, cy, theta)
-                nx1, ny1 = rotate_point_i(x1, y1, cx, cy, theta)
-                scene.lines[i].p0.x, scene.lines[i].p0.y = nx0, ny0
-                scene.lines[i].p1.x, scene.lines[i].p1.y = nx1, ny1
-
-        for i, (cx0, cy0, r0) in tr.circles_snapshot:
-            if 0 <= i < len(scene.circles):
-                ncx, ncy = rotate_point_i(cx0, cy0, cx, cy, theta)
-                scene.circles[i].c.x, scene.circles[i].c.y = ncx, ncy
-                scene.circles[i].r = r0
-
-        deg = math.degrees(theta)
+        ids, rows = tr.line_ids, tr.line_pts0
+        if _snapshot_valid(ids, scene.n_lines):
+            # x columns (0, 2) and y columns (1, 3) rotated together, written back in one go
+            nx, ny = rotate_points_cs(rows[:, 0::2], rows[:, 1::2], cx, cy, ct, st)
+            xy = scene.line_xy
+            xy[ids, 0::2] = nx
+            xy[ids, 1::2] = ny
+
+        cids, crows = tr.circle_ids, tr.circle_pts0
+        if _snapshot_valid(cids, scene.n_circles):
+            cxy = scene.circle_xyr
+            cxy[cids, 0], cxy[cids, 1] = rotate_points_cs(crows[:, 0], crows[:, 1], cx, cy, ct, st)
+            cxy[cids, 2] = crows[:, 2]
+
+        deg = math.degrees(math.atan2(st, ct))
         state.status = f"Rotate: {deg:+.1f}°"
-        redraw_canvas_from_scene(canvas, scene)
+        scene.touch()
+        self._dirty = True
 
     # ------------ hover cursor updates ------------
 
@@ -382,35 +413,35 @@ class SelectTransformTool:
     ) -> None:
         """Set cursor based on hover location when idle (not dragging/selecting)."""
         if cpos is None:
-            _set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+            set_cursor(pygame.SYSTEM_CURSOR_ARROW)
             return
 
         # If we're currently dragging, keep the respective cursor
         if self._mode == "moving":
-            _set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
+            set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
             return
         if self._mode == "scaling" and self._handle:
-            _set_cursor(_cursor_for_handle(self._handle))
+            set_cursor(cursor_for_handle(self._handle))
             return
         if self._mode == "rotating":
-            _set_cursor(pygame.SYSTEM_CURSOR_HAND)
+            set_cursor(pygame.SYSTEM_CURSOR_HAND)
             return
 
         # Otherwise, determine hover based on selection bbox & handles
         bx = _selection_bbox(scene, state)
-        if not bx:
-            _set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        if not bx or not _near_bbox(bx, cpos):
+            set_cursor(pygame.SYSTEM_CURSOR_ARROW)
             return
 
         h = _hit_test_handle(bx, cpos)
         if h:
-            _set_cursor(_cursor_for_handle(h))
+            set_cursor(cursor_for_handle(h))
             return
 
         if bx.collidepoint(cpos) and (state.selection.selected_lines or state.selection.selected_circles):
-            _set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
+            set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
         else:
-            _set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+            set_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
     # ---------------- Protocol entry ----------------
 
@@ -431,7 +462,7 @@ class SelectTransformTool:
             # Try handles first (only when we have a bbox)
             if bx:
                 h = _hit_test_handle(bx, cpos)
-                if h in ("nw", "n", "ne", "e", "se", "s", "sw", "w"):
+                if h in RESIZE_HANDLES:
                     self._begin_scale(h, cpos, state, scene)
                     return
                 elif h == "rot":
@@ -449,23 +480,23 @@ class SelectTransformTool:
             sel.current = cpos
             state.status = "Selecting…"
             self._mode = "selecting"
-            _set_cursor(pygame.SYSTEM_CURSOR_CROSSHAIR)
+            set_cursor(pygame.SYSTEM_CURSOR_CROSSHAIR)
 
         elif ev.type == pygame.MOUSEMOTION:
             if cpos and sel.selecting and sel.anchor:
                 sel.current = cpos
                 # keep crosshair while selecting
-                _set_cursor(pygame.SYSTEM_CURSOR_CROSSHAIR)
+                set_cursor(pygame.SYSTEM_CURSOR_CROSSHAIR)
             elif cpos and self._mode == "moving":
-                self._apply_move(cpos, state=state, scene=scene, canvas=canvas)
-                _set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
+                self._pending = cpos
+                set_cursor(pygame.SYSTEM_CURSOR_SIZEALL)
             elif cpos and self._mode == "scaling":
-                self._apply_scale(cpos, state=state, scene=scene, canvas=canvas)
+                self._pending = cpos
                 if self._handle:
-                    _set_cursor(_cursor_for_handle(self._handle))
+                    set_cursor(cursor_for_handle(self._handle))
             elif cpos and self._mode == "rotating":
-                self._apply_rotate(cpos, state=state, scene=scene, canvas=canvas)
-                _set_cursor(pygame.SYSTEM_CURSOR_HAND)
+                self._pending = cpos
+                set_cursor(pygame.SYSTEM_CURSOR_HAND)
             else:
                 # idle hover update
                 self._update_hover_cursor(cpos, state=state, scene=scene)
@@ -473,26 +504,7 @@ class SelectTransformTool:
         elif ev.type == pygame.MOUSEBUTTONUP:
             # Finish selection
             if sel.selecting:
-                sel.selecting = False
-                a, b = sel.anchor, sel.current
-                if a and b:
-                    l, t, w, h = rect_from_points(a, b)
-                    L, T, R, B = l, t, l + w, t + h
-
-                    sel.selected_lines.clear()
-                    sel.selected_circles.clear()
-
-                    for i, ln in enumerate(scene.lines):
-                        if (L <= ln.p0.x <= R and T <= ln.p0.y <= B) or (
-                            L <= ln.p1.x <= R and T <= ln.p1.y <= B
-                        ):
-                            sel.selected_lines.add(i)
-                    for i, c in enumerate(scene.circles):
-                        if L <= c.c.x <= R and T <= c.c.y <= B:
-                            sel.selected_circles.add(i)
-
-                    state.status = f"Selected {len(sel.selected_lines)} lines, {len(sel.selected_circles)} circles"
-
+                finish_rubber_band(scene, state)
                 sel.anchor = None
                 sel.current = None
                 self._mode = None
@@ -500,6 +512,7 @@ class SelectTransformTool:
                 self._update_hover_cursor(cpos, state=state, scene=scene)
 
             # Finish move/scale/rotate
+            self._flush_pending(state, scene)
             if tr.dragging or self._mode in ("moving", "scaling", "rotating"):
                 tr.reset()
                 self._mode = None
@@ -507,7 +520,9 @@ class SelectTransformTool:
                 self._bbox0 = None
                 self._pivot = None
                 self._h0 = None
-                self._anchor_angle = 0.0
-                redraw_canvas_from_scene(canvas, scene)
+                self._anchor_vec = (1.0, 0.0)
+                self._bg = None
+                self._applied = None
+                self._dirty = True
                 # After gesture ends, update cursor based on hover
                 self._update_hover_cursor(cpos, state=state, scene=scene)
@@ -17,6 +17,9 @@ class TranslateTool:
         state.transform.reset()
         state.status = ""
 
+    def tick(self, state: AppState, scene: Scene, canvas: pygame.Surface) -> None:
+        return  # redraws happen in the event handler
+
     def handle_canvas_event(
         self,
         ev: pygame.event.Event,
@@ -32,27 +35,15 @@ class TranslateTool:
         if ev.type == pygame.MOUSEBUTTONDOWN and cpos and (sel.selected_lines or sel.selected_circles):
             tr.dragging = True
             tr.anchor = cpos
-            tr.lines_snapshot = [
-                (i, (scene.lines[i].p0.x, scene.lines[i].p0.y, scene.lines[i].p1.x, scene.lines[i].p1.y))
-                for i in sel.selected_lines
-            ]
-            tr.circles_snapshot = [
-                (i, (scene.circles[i].c.x, scene.circles[i].c.y, scene.circles[i].r))
-                for i in sel.selected_circles
-            ]
 
         elif ev.type == pygame.MOUSEMOTION and cpos and tr.dragging and tr.anchor:
+            if not tr.snapshot_taken:  # first motion of the drag
+                tr.snapshot(scene.line_xy, sel.selected_lines, scene.circle_xyr, sel.selected_circles)
             dx = cpos[0] - tr.anchor[0]
             dy = cpos[1] - tr.anchor[1]
-            for i, (x0, y0, x1, y1) in tr.lines_snapshot:
-                scene.lines[i].p0.x = x0 + dx
-                scene.lines[i].p0.y = y0 + dy
-                scene.lines[i].p1.x = x1 + dx
-                scene.lines[i].p1.y = y1 + dy
-            for i, (cx0, cy0, r0) in tr.circles_snapshot:
-                scene.circles[i].c.x = cx0 + dx
-                scene.circles[i].c.y = cy0 + dy
-                scene.circles[i].r = r0
+            scene.line_xy[tr.line_ids] = tr.line_pts0 + (dx, dy, dx, dy)
+            scene.circle_xyr[tr.circle_ids] = tr.circle_pts0 + (dx, dy, 0)
+            scene.touch()
             redraw_canvas_from_scene(canvas, scene)
 
         elif ev.type == pygame.MOUSEBUTTONUP and tr.dragging:
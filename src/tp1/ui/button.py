@@ -18,14 +18,34 @@ class Button:
 
     # runtime fields
     _hover: bool = False
+    # label surface, re-rendered only when (font, label, enabled) changes
+    _rendered_text: pygame.Surface | None = None
+    _rendered_key: tuple | None = None
+    # hover/enabled changed since the last draw
+    _dirty: bool = True
+
+    def needs_draw(self, font: pygame.font.Font) -> bool:
+        return self._dirty or self._rendered_key != (font, self.label, self.enabled)
+
+    def invalidate(self) -> None:
+        """Force the next draw, e.g. after the pixels under the button were cleared."""
+        self._dirty = True
 
     def draw(self, surf: pygame.Surface, font: pygame.font.Font) -> None:
+        """Draw the button unless it looks the same as last time (its pixels are kept)."""
+        if not self.needs_draw(font):
+            return
+        self._dirty = False
         color = C.UI_BTN_HOVER if self._hover and self.enabled else C.UI_BTN
         pygame.draw.rect(surf, color, self.rect, border_radius=8)
         pygame.draw.rect(surf, C.UI_STROKE, self.rect, width=1, border_radius=8)
 
-        txt_color = C.WHITE if self.enabled else (180, 180, 180)
-        txt = font.render(self.label, True, txt_color)
+        key = (font, self.label, self.enabled)
+        if self._rendered_text is None or key != self._rendered_key:
+            txt_color = C.WHITE if self.enabled else (180, 180, 180)
+            self._rendered_text = font.render(self.label, True, txt_color)
+            self._rendered_key = key
+        txt = self._rendered_text
         surf.blit(
             txt,
             (self.rect.x + 10, self.rect.y + (self.rect.h - txt.get_height()) // 2),
@@ -33,7 +53,10 @@ class Button:
 
     def handle_event(self, ev: pygame.event.Event) -> None:
         if ev.type == pygame.MOUSEMOTION and hasattr(ev, "pos"):
-            self._hover = self.rect.collidepoint(ev.pos)
+            hover = self.rect.collidepoint(ev.pos)
+            if hover != self._hover:
+                self._hover = hover
+                self._dirty = True
         elif (
             ev.type == pygame.MOUSEBUTTONDOWN
             and ev.button == 1
@@ -48,3 +71,4 @@ class Button:
         self.enabled = bool(value)
         if not self.enabled:
             self._hover = False
+        self._dirty = True
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 import pygame
 
 from .. import config as C
+from ..render.renderer import draw_scene_subset
+from ..scene.ops import selection_bounds
 from ..scene.scene import Scene
 from ..state import AppState, Mode
-from ..utils.geom import bbox_handles
-
-
-def _rect_from_tuple(r: tuple[int, int, int, int]) -> pygame.Rect:
-    l, t, w, h = r
-    return pygame.Rect(l, t, w, h)
+from ..utils.geom import (
+    RESIZE_HANDLES,
+    Point2,
+    bbox_handles_cached,
+    hit_test_resize_handles,
+)
 
 
 def _norm_rect(a: tuple[int, int] | None, b: tuple[int, int] | None) -> pygame.Rect | None:
@@ -25,123 +29,209 @@ def _norm_rect(a: tuple[int, int] | None, b: tuple[int, int] | None) -> pygame.R
 
 
 def _selection_bbox_and_pivot(scene: Scene, state: AppState) -> tuple[pygame.Rect, tuple[float, float]] | None:
-    xs: list[int] = []
-    ys: list[int] = []
-    for i in state.selection.selected_lines:
-        if 0 <= i < len(scene.lines):
-            ln = scene.lines[i]
-            xs.extend([ln.p0.x, ln.p1.x])
-            ys.extend([ln.p0.y, ln.p1.y])
-    for i in state.selection.selected_circles:
-        if 0 <= i < len(scene.circles):
-            c = scene.circles[i]
-            xs.extend([c.c.x - c.r, c.c.x + c.r])
-            ys.extend([c.c.y - c.r, c.c.y + c.r])
-    if not xs or not ys:
+    edges = selection_bounds(scene, state.selection.selected_lines, state.selection.selected_circles)
+    if edges is None:
         return None
-    left, right = min(xs), max(xs)
-    top, bottom = min(ys), max(ys)
+    left, top, right, bottom = edges
     rect = pygame.Rect(left, top, right - left, bottom - top)
     cx, cy = (left + right) / 2.0, (top + bottom) / 2.0
     return rect, (cx, cy)
 
 
 def _sanitize_selection(scene: Scene, state: AppState) -> None:
-    if state.selection.selected_lines:
-        valid = {i for i in state.selection.selected_lines if 0 <= i < len(scene.lines)}
-        state.selection.selected_lines.intersection_update(valid)
-    if state.selection.selected_circles:
-        valid = {i for i in state.selection.selected_circles if 0 <= i < len(scene.circles)}
-        state.selection.selected_circles.intersection_update(valid)
+    sel = state.selection
+    if sel.sanitized_version == scene.version:
+        return
+    sel.sanitized_version = scene.version
+    # the version also moves on every drag frame, when the indices are still fine: min/max
+    # run in C, and the sets are only rebuilt if one is out of range
+    for ids, n in ((sel.selected_lines, scene.n_lines), (sel.selected_circles, scene.n_circles)):
+        if ids and (min(ids) < 0 or max(ids) >= n):
+            ids.difference_update([i for i in ids if not 0 <= i < n])
 
 
 # ---------- dashed stroke helpers (axis-aligned) ----------
 
-def _dashed_hline(surf: pygame.Surface, y: int, x0: int, x1: int, color, dash: int, gap: int, width: int) -> None:
-    if x1 < x0:
-        x0, x1 = x1, x0
-    step = max(1, dash + gap)
-    x = x0
-    while x <= x1:
-        xe = min(x + dash, x1)
-        pygame.draw.line(surf, color, (x, y), (xe, y), width)
-        x += step
+# Solid tiles the dashes are cut from: (color, side) -> Surface. Alpha blending is off
+# (set_alpha(None)) so a blit copies the color like pygame.draw.line does.
+_DASH_TILES: dict[tuple, pygame.Surface] = {}
+
+
+def _dash_tile(color: C.Color | C.ColorA, side: int) -> pygame.Surface:
+    key = (tuple(color), side)
+    tile = _DASH_TILES.get(key)
+    if tile is None:
+        tile = _DASH_TILES[key] = pygame.Surface((side, side), pygame.SRCALPHA)
+        tile.fill(color)
+        tile.set_alpha(None)
+    return tile
 
 
-def _dashed_vline(surf: pygame.Surface, x: int, y0: int, y1: int, color, dash: int, gap: int, width: int) -> None:
-    if y1 < y0:
-        y0, y1 = y1, y0
-    step = max(1, dash + gap)
-    y = y0
-    while y <= y1:
-        ye = min(y + dash, y1)
-        pygame.draw.line(surf, color, (x, y), (x, ye), width)
-        y += step
+def _dash_spans(a0: int, a1: int, dash: int, gap: int) -> range:
+    """Start of each dash along [a0, a1]; a dash covers [start, min(start + dash, a1)]."""
+    if a1 < a0:
+        a0, a1 = a1, a0
+    return range(a0, a1 + 1, max(1, dash + gap))
 
 
 def _draw_dashed_rect(surf: pygame.Surface, rect: pygame.Rect, color, width: int, dash: int, gap: int) -> None:
+    """
+    Dashed outline, pixel-identical to one pygame.draw.line(..., width) per dash.
+    An axis-aligned thick line covers a rectangle, so every dash is a window on one
+    cached tile and the whole outline goes out in a single blits call.
+    """
+    if width < 1:
+        return
     l, t, w, h = rect
     r = l + w
     b = t + h
-    _dashed_hline(surf, t, l, r, color, dash, gap, width)
-    _dashed_hline(surf, b, l, r, color, dash, gap, width)
-    _dashed_vline(surf, l, t, b, color, dash, gap, width)
-    _dashed_vline(surf, r, t, b, color, dash, gap, width)
+    # pygame.draw.line skips a thick line whose 1px path misses the clip rect (lines
+    # 3px and wider still get drawn one row/column past the bottom/right edge)
+    cl, ct, cw, ch = surf.get_clip()
+    cr, cb = cl + cw - (width < 3), ct + ch - (width < 3)
+    off = (width - 1) // 2  # thick lines grow this far up/left of the path
+    tile = _dash_tile(color, max(dash + 1, width))
+    blits = []
+    for y in (t, b):
+        if not ct <= y <= cb:
+            continue
+        for x in _dash_spans(l, r, dash, gap):
+            n = min(x + dash, max(l, r)) - x
+            if x > cr or x + n < cl:
+                continue
+            if n:
+                blits.append((tile, (x, y - off), (0, 0, n + 1, width)))
+            else:  # a zero-length line is drawn as a point, widened horizontally
+                blits.append((tile, (x - off, y), (0, 0, width, 1)))
+    for x in (l, r):
+        if not cl <= x <= cr:
+            continue
+        for y in _dash_spans(t, b, dash, gap):
+            n = min(y + dash, max(t, b)) - y
+            if y > cb or y + n < ct:
+                continue
+            blits.append((tile, (x - off, y), (0, 0, width, n + 1)))
+    surf.blits(blits, doreturn=False)
 
 
 # ---------- handle helpers ----------
 
-def _hit_test_clip_handle(bbox: pygame.Rect, mouse_canvas: tuple[int, int]) -> str | None:
-    """Return one of the 8 resize handle keys if hovered; else None."""
-    centers = bbox_handles((bbox.left, bbox.top, bbox.width, bbox.height), C.ROT_HANDLE_OFFSET)
-    mx, my = mouse_canvas
-    size = C.HANDLE_SIZE + 2 * C.HANDLE_HIT_PAD
-    half = size // 2
-    for key in ("nw", "n", "ne", "e", "se", "s", "sw", "w"):
-        cx, cy = centers[key]
-        rect = pygame.Rect(cx - half, cy - half, size, size)
-        if rect.collidepoint(mx, my):
-            return key
-    return None
+# Grow a bbox by this (in total) to cover the handles, borders and highlights around it
+_HANDLE_PAD = C.HANDLE_SIZE + 2 * C.CLIP_BORDER_WIDTH
 
+# Pre-rendered handle squares: (fill, border) -> Surface; blended off like the dash tiles
+_HANDLE_TILES: dict[tuple, pygame.Surface] = {}
 
-def _draw_clip_handles(overlay: pygame.Surface, bbox: pygame.Rect, hover_key: str | None) -> None:
-    """Draw 8 square resize handles for the clip window, with hover highlight."""
-    centers = bbox_handles((bbox.left, bbox.top, bbox.width, bbox.height), C.ROT_HANDLE_OFFSET)
+
+def _handle_tile(fill: C.Color, border: C.Color) -> pygame.Surface:
+    tile = _HANDLE_TILES.get((fill, border))
+    if tile is None:
+        s = C.HANDLE_SIZE
+        tile = _HANDLE_TILES[(fill, border)] = pygame.Surface((s, s), pygame.SRCALPHA)
+        tile.fill(fill)
+        pygame.draw.rect(tile, border, tile.get_rect(), width=1)
+        tile.set_alpha(None)
+    return tile
+
+
+def _blit_handles(
+    overlay: pygame.Surface, centers: Mapping[str, Point2], hover_key: str | None = None
+) -> None:
+    """The 8 resize handle squares at `centers`; one blits call unless some are cut off."""
     s = C.HANDLE_SIZE
     half = s // 2
-    for key in ("nw", "n", "ne", "e", "se", "s", "sw", "w"):
+    clip = overlay.get_clip()
+    seq = []
+    for key in RESIZE_HANDLES:
         cx, cy = centers[key]
+        colors = (
+            (C.HANDLE_HOVER_FILL, C.HANDLE_HOVER_BORDER) if key == hover_key else (C.HANDLE_FILL, C.HANDLE_BORDER)
+        )
         rect = pygame.Rect(cx - half, cy - half, s, s)
-        is_hover = hover_key == key
-        fill = C.HANDLE_HOVER_FILL if is_hover else C.HANDLE_FILL
-        border = C.HANDLE_HOVER_BORDER if is_hover else C.HANDLE_BORDER
-        pygame.draw.rect(overlay, fill, rect)
-        pygame.draw.rect(overlay, border, rect, width=1)
+        if clip.contains(rect):
+            seq.append((_handle_tile(*colors), rect.topleft))
+            continue
+        # pygame.draw.rect outlines the clipped rect, which a cut-off tile would not show
+        overlay.blits(seq, doreturn=False)
+        seq = []
+        pygame.draw.rect(overlay, colors[0], rect)
+        pygame.draw.rect(overlay, colors[1], rect, width=1)
+    overlay.blits(seq, doreturn=False)
+
+
+def _draw_clip_handles(overlay: pygame.Surface, centers, hover_key: str | None) -> None:
+    """Draw 8 square resize handles for the clip window, with hover highlight."""
+    _blit_handles(overlay, centers, hover_key)
 
 
-def _draw_handles_with_rotation(overlay: pygame.Surface, bbox: pygame.Rect) -> None:
-    """Selection bbox handles (8 squares) + rotation knob (existing behavior)."""
+def _draw_handles_with_rotation(overlay: pygame.Surface, bbox: pygame.Rect) -> pygame.Rect:
+    """Selection bbox handles (8 squares) + rotation knob (existing behavior); returns the area drawn."""
     pygame.draw.rect(overlay, C.BBOX_COLOR, bbox, width=2)
-    centers = bbox_handles((bbox.left, bbox.top, bbox.width, bbox.height), C.ROT_HANDLE_OFFSET)
+    centers = bbox_handles_cached((bbox.left, bbox.top, bbox.width, bbox.height), C.ROT_HANDLE_OFFSET)
+    _blit_handles(overlay, centers)
 
-    s = C.HANDLE_SIZE
-    half = s // 2
-    for key in ("nw", "n", "ne", "e", "se", "s", "sw", "w"):
-        cx, cy = centers[key]
-        rect = pygame.Rect(cx - half, cy - half, s, s)
-        pygame.draw.rect(overlay, C.HANDLE_FILL, rect)
-        pygame.draw.rect(overlay, C.HANDLE_BORDER, rect, width=1)
+    half = C.HANDLE_SIZE // 2
 
     # Rotation knob + stem
     rx, ry = centers["rot"]
     stem_start = centers["n"]
     pygame.draw.line(overlay, C.ROT_STEM_COLOR, stem_start, (rx, ry), width=2)
-    pygame.draw.circle(overlay, C.ROT_HANDLE_FILL, (rx, ry), max(half, 5))
+    knob = pygame.draw.circle(overlay, C.ROT_HANDLE_FILL, (rx, ry), max(half, 5))
     pygame.draw.circle(overlay, C.ROT_HANDLE_BORDER, (rx, ry), max(half, 5), width=1)
+    return bbox.inflate(_HANDLE_PAD, _HANDLE_PAD).union(knob)
+
+
+# (overlay, key, area drawn) of the last draw_overlay; the surface is left as is while
+# the key holds
+_drawn: tuple[pygame.Surface, tuple, pygame.Rect | None] | None = None
 
 
-def draw_overlay(overlay: pygame.Surface, scene: Scene, state: AppState) -> None:
+def _clip_hover_key(centers: Mapping[str, Point2], mouse_pos: tuple[int, int]) -> str | None:
+    """Resize handle of the clip window (at `centers`) under the mouse, if any."""
+    mx, my = mouse_pos
+    if mx < C.UI_W:
+        return None
+    return hit_test_resize_handles(centers, (mx - C.UI_W, my))
+
+
+def draw_overlay(overlay: pygame.Surface, scene: Scene, state: AppState) -> pygame.Rect | None:
+    """
+    Redraw the overlay if anything it shows has changed. Returns the area that differs
+    from the previous overlay (what was drawn then and now), or None if it is the same.
+    """
+    global _drawn
+
+    # Clean selection sets
+    _sanitize_selection(scene, state)
+
+    sel = state.selection
+    clip = state.clip
+    # the clip window's handle centers, found once for the hover test and the drawing
+    clip_centers = None
+    hover_key = None
+    if state.mode == Mode.CLIP_WINDOW and not clip.setting and clip.window:
+        clip_centers = bbox_handles_cached(clip.window, C.ROT_HANDLE_OFFSET)
+        hover_key = _clip_hover_key(clip_centers, state.mouse_pos)
+    key = (
+        scene.version,
+        frozenset(sel.selected_lines),
+        frozenset(sel.selected_circles),
+        sel.selecting,
+        sel.anchor,
+        sel.current,
+        state.mode,
+        clip.window,
+        clip.setting,
+        clip.anchor,
+        clip.current,
+        hover_key,
+    )
+    if _drawn is not None and _drawn[0] is overlay and _drawn[1] == key:
+        return None  # nothing it shows has changed
+    # a surface not drawn here before may hold anything
+    prev = _drawn[2] if _drawn is not None and _drawn[0] is overlay else overlay.get_rect()
+    drawn: list[pygame.Rect] = []
+
     overlay.fill((0, 0, 0, 0))
 
     # Selection rubber band
@@ -150,6 +240,7 @@ def draw_overlay(overlay: pygame.Surface, scene: Scene, state: AppState) -> None
         if rect:
             pygame.draw.rect(overlay, C.ACCENT_FILL, rect)
             pygame.draw.rect(overlay, C.ACCENT_BORDER, rect, width=2)
+            drawn.append(rect)
 
     # --- Clip window visuals ---
     if state.mode == Mode.CLIP_WINDOW:
@@ -159,47 +250,34 @@ def draw_overlay(overlay: pygame.Surface, scene: Scene, state: AppState) -> None
             if r:
                 pygame.draw.rect(overlay, C.CLIP_FILL, r)
                 _draw_dashed_rect(overlay, r, C.BBOX_COLOR, C.CLIP_BORDER_WIDTH, C.CLIP_DASH_LEN, C.CLIP_DASH_GAP)
+                drawn.append(r.inflate(_HANDLE_PAD, _HANDLE_PAD))
         # Existing window in clip mode: dashed border + handles with hover
-        elif state.clip.window:
-            r = _rect_from_tuple(state.clip.window)
+        elif state.clip.rect is not None:
+            r = state.clip.rect
             pygame.draw.rect(overlay, C.CLIP_FILL, r)
             _draw_dashed_rect(overlay, r, C.BBOX_COLOR, C.CLIP_BORDER_WIDTH, C.CLIP_DASH_LEN, C.CLIP_DASH_GAP)
-
-            # Determine hover handle (canvas coords from mouse)
-            mx, my = pygame.mouse.get_pos()
-            hover_key = None
-            if mx >= C.UI_W:
-                hover_key = _hit_test_clip_handle(r, (mx - C.UI_W, my))
-
-            _draw_clip_handles(overlay, r, hover_key)
+            _draw_clip_handles(overlay, clip_centers, hover_key)
+            drawn.append(r.inflate(_HANDLE_PAD, _HANDLE_PAD))
     else:
         # Outside clip mode: static clip window (solid outline)
-        if state.clip.window:
-            r = _rect_from_tuple(state.clip.window)
+        if state.clip.rect is not None:
+            r = state.clip.rect
             pygame.draw.rect(overlay, C.CLIP_FILL, r)
             pygame.draw.rect(overlay, C.CLIP_COLOR, r, width=2)
+            drawn.append(r)
 
-    # Clean selection sets
-    _sanitize_selection(scene, state)
-
-    # Selected-shape highlights (accent overlay)
-    from ..algorithms.circles import draw_circle_bresenham
-    from ..algorithms.lines import draw_line_bresenham, draw_line_dda
-
-    for i in state.selection.selected_lines:
-        ln = scene.lines[i]
-        if ln.algo == "DDA":
-            draw_line_dda(overlay, ln.p0, ln.p1, C.ACCENT)
-        else:
-            draw_line_bresenham(overlay, ln.p0, ln.p1, C.ACCENT)
-
-    for i in state.selection.selected_circles:
-        c = scene.circles[i]
-        draw_circle_bresenham(overlay, c.c, c.r, C.ACCENT)
+    # Selected-shape highlights (accent overlay), rasterized together in one batch
+    draw_scene_subset(overlay, scene, sel.selected_lines, sel.selected_circles, color=C.ACCENT)
 
     # Selection bbox + handles (with rotation)
     if state.selection.selected_lines or state.selection.selected_circles:
         sp = _selection_bbox_and_pivot(scene, state)
         if sp:
             bbox, _ = sp
-            _draw_handles_with_rotation(overlay, bbox)
+            drawn.append(_draw_handles_with_rotation(overlay, bbox))
+
+    area = drawn[0].unionall(drawn[1:]) if drawn else None
+    _drawn = (overlay, key, area)
+    if prev is None:
+        return area
+    return prev if area is None else prev.union(area)
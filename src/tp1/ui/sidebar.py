@@ -20,6 +20,14 @@ class Sidebar:
     # Layout cursor (y start for the next button)
     _cursor_y: int = C.BTN_PAD + 44  # leave space for title/mode area
 
+    # Last rendered text per line slot: slot -> ((font, text, color), surface)
+    _texts: dict[str, tuple[tuple, pygame.Surface]] = field(default_factory=dict)
+
+    # Surface last painted in full; later draws repaint only the text bands and changed buttons
+    _painted: pygame.Surface | None = None
+    # Text surfaces the bands were last painted with; the bands are left alone while they hold
+    _bands_key: tuple | None = None
+
     def add_button(self, label: str, on_click: Callable[[], None]) -> None:
         rect = pygame.Rect(
             C.BTN_PAD, self._cursor_y, C.UI_W - 2 * C.BTN_PAD, C.BTN_HEIGHT
@@ -38,6 +46,7 @@ class Sidebar:
         for b in self.buttons:
             b.rect.update(C.BTN_PAD, self._cursor_y, C.UI_W - 2 * C.BTN_PAD, C.BTN_HEIGHT)
             self._cursor_y += C.BTN_HEIGHT + C.BTN_SPACING
+        self._painted = None
 
     def handle_event(self, ev: pygame.event.Event) -> None:
         # Only process events that happen inside the sidebar area
@@ -48,26 +57,62 @@ class Sidebar:
         for b in self.buttons:
             b.handle_event(ev)
 
+    def _text(
+        self, slot: str, font: pygame.font.Font, text: str, color: tuple[int, int, int]
+    ) -> pygame.Surface:
+        """font.render, skipped while the text in `slot` stays the same."""
+        key = (font, text, color)
+        cached = self._texts.get(slot)
+        if cached is None or cached[0] != key:
+            cached = self._texts[slot] = (key, font.render(text, True, color))
+        return cached[1]
+
     def draw(self, surf: pygame.Surface, font: pygame.font.Font, small: pygame.font.Font, state: AppState) -> None:  # noqa: E501
-        # background
-        surf.fill(C.UI_BG)
+        # Title & mode, optional status line, selection info footer (simple counters)
+        title = self._text("title", font, "TP1 - CG", C.WHITE)
+        mode_txt = self._text("mode", small, f"Mode: {state.mode.name}", (220, 220, 230))
+        status_txt = self._text("status", small, state.status, (210, 210, 220)) if state.status else None
+        sel = state.selection
+        info = f"Selected: {len(sel.selected_lines)} lines, {len(sel.selected_circles)} circles"
+        info_txt = self._text("info", small, info, (200, 210, 220))
+        bands_key = (title, mode_txt, status_txt, info_txt)
 
-        # Title & mode
-        title = font.render("TP1 - CG", True, C.WHITE)
-        mode_txt = small.render(f"Mode: {state.mode.name}", True, (220, 220, 230))
-        surf.blit(title, (C.BTN_PAD, C.BTN_PAD))
-        surf.blit(mode_txt, (C.BTN_PAD, C.BTN_PAD + 22))
+        # background: the title/mode/status band and the footer hold the text; the rest of
+        # the sidebar is only the buttons, which redraw themselves when they change
+        header = pygame.Rect(
+            0, 0, surf.get_width(), max(C.BTN_PAD + font.get_height(), C.BTN_PAD + 40 + small.get_height())
+        )
+        footer = pygame.Rect(0, self._cursor_y, surf.get_width(), surf.get_height() - self._cursor_y)
+        if self._painted is not surf:
+            surf.fill(C.UI_BG)
+            for b in self.buttons:
+                b.invalidate()
+            self._painted = surf
+            bands = True
+        else:
+            # unchanged text is left as painted, unless a button it shows through (the
+            # rounded corners) is redrawn
+            overlapping = [b for b in self.buttons if b.rect.colliderect(header) or b.rect.colliderect(footer)]
+            bands = bands_key != self._bands_key or any(b.needs_draw(small) for b in overlapping)
+            if bands:
+                surf.fill(C.UI_BG, header)
+                surf.fill(C.UI_BG, footer)
+                for b in overlapping:
+                    b.invalidate()  # text may be drawn over it, so it goes back on top
+        self._bands_key = bands_key
+        for b in self.buttons:
+            if b.needs_draw(small):
+                surf.fill(C.UI_BG, b.rect)
 
-        # Optional status line
-        if state.status:
-            status_txt = small.render(state.status, True, (210, 210, 220))
-            surf.blit(status_txt, (C.BTN_PAD, C.BTN_PAD + 22 + 18))
+        if bands:
+            surf.blit(title, (C.BTN_PAD, C.BTN_PAD))
+            surf.blit(mode_txt, (C.BTN_PAD, C.BTN_PAD + 22))
+            if status_txt is not None:
+                surf.blit(status_txt, (C.BTN_PAD, C.BTN_PAD + 22 + 18))
 
         # Buttons
         for b in self.buttons:
             b.draw(surf, small)
 
-        # Selection info footer (simple counters)
-        sel = state.selection
-        info = f"Selected: {len(sel.selected_lines)} lines, {len(sel.selected_circles)} circles"
-        surf.blit(small.render(info, True, (200, 210, 220)), (C.BTN_PAD, self._cursor_y + 16))
+        if bands:
+            surf.blit(info_txt, (C.BTN_PAD, self._cursor_y + 16))
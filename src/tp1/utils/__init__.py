@@ -1,43 +1,59 @@
 from __future__ import annotations
 
 from .geom import (
+    RESIZE_HANDLES,
     bbox_handles,
+    bbox_handles_cached,
     bbox_of_points,
     bbox_union,
     clamp_rect_to_canvas,
+    hit_test_resize_handles,
     move_rect,
     rect_center,
+    rect_center_i,
     rect_contains_point,
     rect_edges,
     rect_from_points,
 )
 from .transforms import (
     angle_from_center,
+    cos_sin_between,
     distance,
     rotate_point_f,
     rotate_point_i,
+    rotate_points_cs,
+    rotate_points_i,
     scale_point_f,
     scale_point_i,
     scale_point_xy_f,
     scale_point_xy_i,
+    scale_points_xy_i,
 )
 
 __all__ = [
+    "RESIZE_HANDLES",
     "rect_from_points",
     "rect_contains_point",
     "rect_edges",
     "rect_center",
+    "rect_center_i",
     "bbox_handles",
+    "bbox_handles_cached",
+    "hit_test_resize_handles",
     "bbox_of_points",
     "bbox_union",
     "rotate_point_f",
     "rotate_point_i",
+    "rotate_points_i",
+    "rotate_points_cs",
     "scale_point_f",
     "scale_point_i",
     "scale_point_xy_f",
     "scale_point_xy_i",
+    "scale_points_xy_i",
     "distance",
     "angle_from_center",
+    "cos_sin_between",
     "move_rect",
     "clamp_rect_to_canvas"
 ]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import math
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TypeAlias
 
+import numpy as np
+
 from .. import config as C
 
 Point2: TypeAlias = tuple[int, int]
@@ -34,50 +37,79 @@ def rect_center(rect: Rect4) -> tuple[float, float]:
     return left + w / 2.0, top + h / 2.0
 
 
+def rect_center_i(rect: Rect4) -> Point2:
+    """
+    rect_center in whole pixels, truncated toward zero like int(); integer math only.
+    (left + w // 2 would floor instead left of / above the origin.)
+    """
+    left, top, w, h = rect
+    sx = 2 * left + w
+    sy = 2 * top + h
+    return (sx >> 1 if sx >= 0 else -(-sx >> 1)), (sy >> 1 if sy >= 0 else -(-sy >> 1))
+
+
 def rect_contains_point(rect: Rect4, pt: Point2) -> bool:
     """Inclusive containment test (left/top/right/bottom included)."""
     x, y = pt
-    left, top, right, bottom = rect_edges(rect)
-    return left <= x <= right and top <= y <= bottom
+    left, top, w, h = rect
+    return left <= x <= left + w and top <= y <= top + h
 
 
-def bbox_of_points(points: Iterable[Point2]) -> Rect4 | None:
+def bbox_of_points(points: Iterable[Point2] | np.ndarray) -> Rect4 | None:
     """
-    Bounding box of an iterable of points.
+    Bounding box of an iterable of points, or of an (N, 2) array of them.
     Returns None for an empty iterable.
     """
-    xs: list[int] = []
-    ys: list[int] = []
-    for x, y in points:
-        xs.append(x)
-        ys.append(y)
-    if not xs or not ys:
+    if isinstance(points, np.ndarray):
+        if not len(points):
+            return None
+        (left, top), (right, bottom) = points.min(axis=0).tolist(), points.max(axis=0).tolist()
+        return (left, top, right - left, bottom - top)
+    it = iter(points)
+    try:
+        left, top = right, bottom = next(it)
+    except StopIteration:
         return None
-    left, right = min(xs), max(xs)
-    top, bottom = min(ys), max(ys)
+    # one pass, no coordinate lists
+    for x, y in it:
+        if x < left:
+            left = x
+        elif x > right:
+            right = x
+        if y < top:
+            top = y
+        elif y > bottom:
+            bottom = y
     return (left, top, right - left, bottom - top)
 
 
-def bbox_union(rects: Iterable[Rect4]) -> Rect4 | None:
+def bbox_union(rects: Iterable[Rect4] | np.ndarray) -> Rect4 | None:
     """
-    Union (minimal covering rect) of an iterable of Rect4.
+    Union (minimal covering rect) of an iterable of Rect4, or of an (N, 4) array of them.
     Returns None for an empty iterable.
     """
-    first = True
-    L = T = R = B = 0
-    for l, t, w, h in rects:  # noqa: E741
-        r = l + w
-        b = t + h
-        if first:
-            L, T, R, B = l, t, r, b
-            first = False
-        else:
-            L = min(L, l)
-            T = min(T, t)
-            R = max(R, r)
-            B = max(B, b)
-    if first:
+    if isinstance(rects, np.ndarray):
+        if not len(rects):
+            return None
+        L, T = rects[:, :2].min(axis=0).tolist()
+        R, B = (rects[:, :2] + rects[:, 2:]).max(axis=0).tolist()
+        return (L, T, R - L, B - T)
+    it = iter(rects)
+    try:
+        L, T, w, h = next(it)
+    except StopIteration:
         return None
+    R = L + w
+    B = T + h
+    for l, t, w, h in it:  # noqa: E741
+        if l < L:
+            L = l
+        if t < T:
+            T = t
+        if l + w > R:
+            R = l + w
+        if t + h > B:
+            B = t + h
     return (L, T, R - L, B - T)
 
 def bbox_handles(rect: Rect4, rot_offset: int) -> dict[str, Point2]:
@@ -88,33 +120,59 @@ def bbox_handles(rect: Rect4, rot_offset: int) -> dict[str, Point2]:
         "nw","n","ne","e","se","s","sw","w"  (corners + edges)
         "rot"                                (rotation knob above top-middle)
 
-    The positions are integer pixel centers.
+    The positions are integer pixel centers; `rect` holds ints.
     """
     l, t, w, h = rect
     r = l + w
     b = t + h
-    cx = l + w / 2.0
-    cy = t + h / 2.0
-
-    # Edge/Corner handle centers (ints)
-    pos: dict[str, Point2] = {
-        "nw": (int(l), int(t)),
-        "n": (int(cx), int(t)),
-        "ne": (int(r), int(t)),
-        "e": (int(r), int(cy)),
-        "se": (int(r), int(b)),
-        "s": (int(cx), int(b)),
-        "sw": (int(l), int(b)),
-        "w": (int(l), int(cy)),
+    cx, cy = rect_center_i(rect)
+    return {
+        # Edge/Corner handle centers
+        "nw": (l, t),
+        "n": (cx, t),
+        "ne": (r, t),
+        "e": (r, cy),
+        "se": (r, b),
+        "s": (cx, b),
+        "sw": (l, b),
+        "w": (l, cy),
+        # Rotation handle (circle) above top-mid, clamped to the top margin
+        "rot": (cx, max(C.ROT_HANDLE_TOP_MARGIN, t - rot_offset)),
     }
 
-    # Rotation handle (circle) above top-mid
-    raw_rot_y = int(t) - int(rot_offset)
-    rot_y = max(C.ROT_HANDLE_TOP_MARGIN, raw_rot_y)  # <-- clamp
-    rot = (int(cx), rot_y)
-    pos["rot"] = rot
 
-    return pos
+@lru_cache(maxsize=128)
+def bbox_handles_cached(rect: Rect4, rot_offset: int) -> Mapping[str, Point2]:
+    """
+    Memoized `bbox_handles` for per-frame hit tests and drawing, where the same bbox is
+    asked for again and again. `rect` must be a tuple; the result is read-only.
+    """
+    return MappingProxyType(bbox_handles(rect, rot_offset))
+
+
+RESIZE_HANDLES: tuple[str, ...] = ("nw", "n", "ne", "e", "se", "s", "sw", "w")
+
+
+def hit_test_resize_handles(centers: Mapping[str, Point2], pt: Point2) -> str | None:
+    """
+    Return the first resize handle (in RESIZE_HANDLES order) whose hit square contains `pt`.
+    Squares are HANDLE_SIZE + 2*HANDLE_HIT_PAD wide around the `bbox_handles` centers.
+    """
+    size = C.HANDLE_SIZE + 2 * C.HANDLE_HIT_PAD
+    half = size // 2
+    mx, my = pt
+    # every center lies between the nw and se corners, so a point outside the squares
+    # around those spans misses all eight
+    left, top = centers["nw"]
+    right, bottom = centers["se"]
+    if not (left - half <= mx < right - half + size and top - half <= my < bottom - half + size):
+        return None
+    for key in RESIZE_HANDLES:
+        cx, cy = centers[key]
+        # same test as pygame.Rect(cx - half, cy - half, size, size).collidepoint(mx, my)
+        if 0 <= mx - cx + half < size and 0 <= my - cy + half < size:
+            return key
+    return None
 
 def move_rect(rect: Rect4, dx: int, dy: int) -> Rect4:
     """Translate a rect by (dx, dy) without clamping."""
@@ -127,24 +185,15 @@ def clamp_rect_to_canvas(rect: Rect4, width: int, height: int) -> Rect4:
     If rect is larger than the canvas, it will be reduced to fit.
     """
     l, t, w, h = rect
-    w = min(max(0, w), width)
-    h = min(max(0, h), height)
-    l = max(0, min(l, width - w))
-    t = max(0, min(t, height - h))
+    # conditional expressions rather than min/max calls: this runs on every drag event
+    w = 0 if w < 0 else width if w > width else w
+    h = 0 if h < 0 else height if h > height else h
+    l = 0 if l < 0 else width - w if l > width - w else l
+    t = 0 if t < 0 else height - h if t > height - h else t
     return (int(l), int(t), int(w), int(h))
 
-def _opposite_corner_for(handle: str, l0: int, t0: int, r0: int, b0: int) -> tuple[float, float]:
-    """Return the pivot corner (opposite to the dragged corner)."""
-    if handle == "se":  # pivot NW
-        return float(l0), float(t0)
-    if handle == "ne":  # pivot SW
-        return float(l0), float(b0)
-    if handle == "sw":  # pivot NE
-        return float(r0), float(t0)
-    if handle == "nw":  # pivot SE
-        return float(r0), float(b0)
-    # default (won't be used for edges)
-    return float(l0), float(t0)
+# Pivot of a corner drag, the opposite corner, as indices into (l, t, r, b)
+_OPPOSITE_CORNER = {"se": (0, 1), "ne": (0, 3), "sw": (2, 1), "nw": (2, 3)}
 
 def _normalize_edges(l: float, t: float, r: float, b: float) -> tuple[int, int, int, int]:
     """Ensure l<=r and t<=b; return ints."""
@@ -194,10 +243,14 @@ def resize_rect_from_handle(
             vy = my - cy
             # Aspect lock (corners only)
             if keep_aspect and h0 != 0:
-                if abs(vx) / aspect >= abs(vy):
-                    vy = math.copysign(abs(vx) / aspect, vy if vy != 0 else 1.0)
+                # the shorter side follows the longer; a zero component counts as positive
+                ay = abs(vy)
+                side = abs(vx) / aspect
+                if side >= ay:
+                    vy = side if vy >= 0 else -side
                 else:
-                    vx = math.copysign(abs(vy) * aspect, vx if vx != 0 else 1.0)
+                    side = ay * aspect
+                    vx = side if vx >= 0 else -side
             # Enforce min size (half-dimensions when resizing from center)
             half_w = max(min_w / 2.0, abs(vx))
             half_h = max(min_h / 2.0, abs(vy))
@@ -207,20 +260,26 @@ def resize_rect_from_handle(
             b = cy + half_h
         else:
             # Pivot at opposite corner
-            px, py = _opposite_corner_for(handle, l0, t0, r0, b0)
+            edges = (l, t, r, b)
+            ix, iy = _OPPOSITE_CORNER[handle]
+            px, py = edges[ix], edges[iy]
             vx = mx - px
             vy = my - py
             # Aspect lock (corners only)
             if keep_aspect and h0 != 0:
-                if abs(vx) / aspect >= abs(vy):
-                    vy = math.copysign(abs(vx) / aspect, vy if vy != 0 else 1.0)
+                # the shorter side follows the longer; a zero component counts as positive
+                ay = abs(vy)
+                side = abs(vx) / aspect
+                if side >= ay:
+                    vy = side if vy >= 0 else -side
                 else:
-                    vx = math.copysign(abs(vy) * aspect, vx if vx != 0 else 1.0)
+                    side = ay * aspect
+                    vx = side if vx >= 0 else -side
             # Enforce mins relative to pivot (full size)
             if abs(vx) < min_w:
-                vx = math.copysign(min_w, vx if vx != 0 else 1.0)
+                vx = float(min_w if vx >= 0 else -min_w)
             if abs(vy) < min_h:
-                vy = math.copysign(min_h, vy if vy != 0 else 1.0)
+                vy = float(min_h if vy >= 0 else -min_h)
             # Build from pivot and vector
             l = min(px, px + vx)
             r = max(px, px + vx)
@@ -269,9 +328,8 @@ def resize_rect_from_handle(
 
     # Normalize to ints
     L, T, R, B = _normalize_edges(l, t, r, b)
+    rect = (L, T, R - L, B - T)
     # Clamp to canvas
     if bounds:
-        from .geom import clamp_rect_to_canvas  # local import to avoid cycles
-        L, T, W, H = clamp_rect_to_canvas((L, T, R - L, B - T), bounds[0], bounds[1])
-        return (L, T, W, H)
-    return (L, T, R - L, B - T)
\ No newline at end of file
+        return clamp_rect_to_canvas(rect, bounds[0], bounds[1])
+    return rect
\ No newline at end of file
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-import math
+from math import atan2 as _atan2
+from math import cos as _cos
+from math import hypot as _hypot
+from math import sin as _sin
+from math import sqrt as _sqrt
 from typing import TypeAlias
 
+import numpy as np
+
 Point2f: TypeAlias = tuple[float, float]
 Point2i: TypeAlias = tuple[int, int]
 
@@ -12,8 +18,8 @@ def rotate_point_f(px: float, py: float, cx: float, cy: float, theta: float) ->
     Rotate (px, py) around (cx, cy) by angle theta (radians).
     Returns float coordinates (no rounding).
     """
-    ct = math.cos(theta)
-    st = math.sin(theta)
+    ct = _cos(theta)
+    st = _sin(theta)
     x = cx + ct * (px - cx) - st * (py - cy)
     y = cy + st * (px - cx) + ct * (py - cy)
     return (x, y)
@@ -27,6 +33,38 @@ def rotate_point_i(px: int, py: int, cx: float, cy: float, theta: float) -> Poin
     return (int(round(x)), int(round(y)))
 
 
+def rotate_points_i(
+    xs: np.ndarray, ys: np.ndarray, cx: float, cy: float, theta: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Array form of rotate_point_i: rotates every (xs[k], ys[k]) at once, same arithmetic
+    and rounding (half to even, like round()). Returns int32 arrays shaped like the input.
+    """
+    return rotate_points_cs(xs, ys, cx, cy, _cos(theta), _sin(theta))
+
+
+def rotate_points_cs(
+    xs: np.ndarray, ys: np.ndarray, cx: float, cy: float, ct: float, st: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """rotate_points_i taking the angle as its cosine and sine."""
+    dx = np.asarray(xs, dtype=np.float64) - cx
+    dy = np.asarray(ys, dtype=np.float64) - cy
+    x = cx + ct * dx - st * dy
+    y = cy + st * dx + ct * dy
+    return np.rint(x).astype(np.int32), np.rint(y).astype(np.int32)
+
+
+def cos_sin_between(ax: float, ay: float, bx: float, by: float) -> Point2f:
+    """
+    (cos, sin) of the angle that turns vector a onto vector b, from their dot and cross
+    products (no trig calls). (1.0, 0.0) when either vector is zero.
+    """
+    n = _sqrt((ax * ax + ay * ay) * (bx * bx + by * by))
+    if n == 0.0:
+        return 1.0, 0.0
+    return (ax * bx + ay * by) / n, (ax * by - ay * bx) / n
+
+
 def scale_point_f(px: float, py: float, cx: float, cy: float, s: float) -> Point2f:
     """
     Uniformly scale point (px, py) about (cx, cy) by factor s. Returns float coords.
@@ -64,13 +102,25 @@ def scale_point_xy_i(
     x, y = scale_point_xy_f(float(px), float(py), cx, cy, sx, sy)
     return (int(round(x)), int(round(y)))
 
+
+def scale_points_xy_i(
+    xs: np.ndarray, ys: np.ndarray, cx: float, cy: float, sx: float, sy: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Array form of scale_point_xy_i (and of scale_point_i with sx == sy), rounded the same
+    way. Returns int32 arrays shaped like the input.
+    """
+    x = cx + sx * (np.asarray(xs, dtype=np.float64) - cx)
+    y = cy + sy * (np.asarray(ys, dtype=np.float64) - cy)
+    return np.rint(x).astype(np.int32), np.rint(y).astype(np.int32)
+
 def distance(x0: float, y0: float, x1: float, y1: float) -> float:
     """Euclidean distance between two points (floats)."""
-    return math.hypot(x1 - x0, y1 - y0)
+    return _hypot(x1 - x0, y1 - y0)
 
 
 def angle_from_center(cx: float, cy: float, x: float, y: float) -> float:
     """
     Angle (radians) of vector (x - cx, y - cy) using atan2.
     """
-    return math.atan2(y - cy, x - cx)
+    return _atan2(y - cy, x - cx)